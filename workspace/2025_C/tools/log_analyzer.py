@@ -3,7 +3,13 @@
 Log Analyzer: Compress training logs and extract insights for @metacognition_agent.
 
 Usage:
-    python log_analyzer.py <training_log> <output_json>
+    python log_analyzer.py <training_log> <output_json> [--workers N] [--mmap] [--keep-series]
+                           [--profile auto|generic|keras|pymc|sklearn|statsmodels]
+    python log_analyzer.py <training_log> <output_json> --follow [--interval SECONDS]
+    python log_analyzer.py --batch <log_dir_or_glob> <output_dir> [--workers N]
+    python log_analyzer.py --benchmark [training_log]
+    python log_analyzer.py --benchmark-analytics [--benchmark-points N]
+    python log_analyzer.py --benchmark-profiles [--benchmark-lines N]
 
 Example:
     python log_analyzer.py output/implementation/logs/training_full.log logs/summary.json
@@ -18,16 +24,44 @@ This script:
 The output summary is the primary INPUT for Phase 5.8 (Insight Extraction).
 """
 
+import io
 import os
 import re
 import sys
+import bz2
+import glob
+import gzip
+import hashlib
+import lzma
+import copy
 import json
 import math
+import mmap
+import time
+import zlib
+import pickle
+import random
+import signal
+import tempfile
 import statistics
+from array import array
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional, Any
-from collections import defaultdict
+from typing import Dict, List, Tuple, Optional, Any, Iterable, Iterator, BinaryIO
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
 
 
 # ============================================================================
@@ -158,12 +192,1253 @@ CRITICAL_PATTERNS = {
 }
 
 
+# Precompiled critical-event matchers: one alternation per event type, matched
+# against the lowercased line (same semantics as trying each pattern in turn).
+CRITICAL_REGEXES = {
+    event_type: re.compile('|'.join(f'(?:{p})' for p in patterns))
+    for event_type, patterns in CRITICAL_PATTERNS.items()
+}
+
+
+# ============================================================================
+# SINGLE-PASS SCANNER
+# ============================================================================
+
+# Keyword prefilter: a metric pattern or critical event can only match a line
+# that contains one of its keywords (checked on the lowercased line). Lines
+# with no keyword at all skip every regex. Values name the PATTERNS keys and
+# CRITICAL_PATTERNS event types that become candidates when the keyword is seen.
+SCAN_KEYWORDS = {
+    "epoch": ("epoch",),
+    "loss": ("loss", "val_loss", "nan_loss"),
+    "acc": ("accuracy",),
+    "norm": ("gradient_norm",),
+    "hat": ("rhat", "divergence"),
+    "warn": ("warning",),
+    "error": ("error",),
+    "exception": ("error",),
+    "traceback": ("error",),
+    "nan": ("nan_inf",),
+    "inf": ("nan_inf",),
+    "grad": ("gradient_explosion", "gradient_vanishing"),
+    "overflow": ("gradient_explosion", "numerical_instability"),
+    "diverge": ("divergence",),
+    "converg": ("divergence",),
+    "memory": ("memory_issue",),
+    "oom": ("memory_issue",),
+    "instab": ("numerical_instability",),
+    "underflow": ("numerical_instability",),
+    "condition": ("numerical_instability",),
+}
+
+# (PATTERNS key, data key, drop NaN/Inf values) in extraction order
+METRIC_SERIES = [
+    ("loss", "loss_values", True),
+    ("val_loss", "val_loss_values", True),
+    ("accuracy", "accuracy_values", False),
+    ("gradient_norm", "gradient_norms", False),
+    ("rhat", "rhat_values", False),
+]
+
+ALL_SCAN_CHECKS = frozenset(
+    check for checks in SCAN_KEYWORDS.values() for check in checks
+)
+
+
+def scan_line(line_lower: str, keywords: Dict[str, Tuple] = SCAN_KEYWORDS) -> set:
+    """Return the checks that can possibly match this (lowercased) line.
+
+    Only valid for ASCII lines: IGNORECASE matching and str.lower() disagree
+    on a handful of Unicode characters, so other lines use ALL_SCAN_CHECKS.
+    keywords is a profile's keyword table (default: the generic one).
+    """
+    active = set()
+    for keyword, checks in keywords.items():
+        if keyword in line_lower:
+            active.update(checks)
+    return active
+
+
+# Byte-level keywords for the mmap reader, searched in a lowercased window of
+# the mapped file: lines without any keyword are counted but never decoded
+BYTE_SCAN_KEYWORDS = [(k.encode(), checks) for k, checks in SCAN_KEYWORDS.items()]
+
+# Bytes that make a line unsafe for the byte-level scan: non-ASCII
+# (decoded with errors='ignore'), CR (universal newlines) and \x1c-\x1f
+# (whitespace for str.strip() and str regexes, but not for bytes)
+NEEDS_TEXT_DECODE = re.compile(b'[\r\x1c-\x1f\x80-\xff]')
+
+# Window size for the mmap reader; bounds the lowercased copy held in memory
+MMAP_WINDOW_BYTES = 1024 * 1024
+
+
+# ============================================================================
+# LOG FORMAT PROFILES
+# ============================================================================
+
+# The generic PATTERNS must cope with any framework, so they match loosely:
+# "norm" is sklearn's weight norm, "loss=" inside "val_loss=", "acc:" inside
+# "val_acc:", and every "0 divergences" progress bar is a divergence event.
+# A profile replaces the metric patterns with anchored ones for one output
+# format (and may tighten event patterns); warnings, errors and the other
+# critical events keep the generic matchers. Each metric pattern lists the
+# lowercased keywords it needs, which feed the scanner's prefilter.
+
+# Unsigned or signed decimal/scientific number; "nan" and "inf" never match
+_NUMBER = r'([-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)'
+
+
+def _word_key(key: str, prefixes: Tuple[str, ...] = ()) -> str:
+    """Regex for key starting a word (not "val_loss" for "loss"), optionally
+    behind one of prefixes ("train_loss"). The literal comes first and the
+    boundary is checked behind it, so re can jump straight to the key
+    instead of trying a lookbehind at every position (about 5x faster)."""
+    checks = [rf'(?<![\w.]{key})'] + [rf'(?<=(?<![\w.]){p}{key})' for p in prefixes]
+    return key + '(?:' + '|'.join(checks) + ')'
+
+
+PROFILE_SPECS = {
+    "keras": {
+        "description": "Keras fit() progress and PyTorch Lightning epoch bars",
+        "detect": [
+            r'^Epoch \d+/\d+\s*$',
+            r'^\s*\d+/\d+ \[[=>.]*\] - ',
+            r'^Epoch \d+: +\d+%\|',
+        ],
+        "patterns": {
+            "epoch": (r'^Epoch (\d+)\b', ("epoch",)),
+            "loss": (_word_key("loss", ("train_",)) + r'(?:_step|_epoch)?[:=] ?' + _NUMBER,
+                     ("loss",)),
+            "val_loss": (_word_key("val_loss") + r'(?:_epoch)?[:=] ?' + _NUMBER, ("val_loss",)),
+            "accuracy": (_word_key("acc", ("train_",)) + r'(?:uracy)?(?:_step|_epoch)?[:=] ?' + _NUMBER,
+                         ("acc",)),
+            "gradient_norm": (_word_key("grad") + r'(?:ient)?_norm(?:_total)?[:=] ?' + _NUMBER,
+                              ("norm",)),
+        },
+    },
+    "pymc": {
+        "description": "PyMC sampler progress, ADVI fits and ArviZ diagnostics",
+        "detect": [
+            r'^Sampling \d+ chains?\b',
+            r'\d+ divergences?\b',
+            r'^(?:Auto-assigning NUTS sampler|Initializing NUTS|NUTS: \[|Multiprocess sampling)',
+            r'\b(?:r_hat|ess_bulk)\b',
+        ],
+        "patterns": {
+            "rhat": (r'hat(?:(?<=(?<![\w.])[rR][-_]hat)|(?<=(?<![\w.])[rR]hat))[:=] ?' + _NUMBER,
+                     ("hat",)),
+            "loss": (r'Average Loss = ' + _NUMBER, ("average loss",)),
+        },
+        "events": {
+            # "0 divergences" is in every healthy progress bar, and an R-hat
+            # only counts when its own value is high (not "ess_bulk=2031")
+            "divergence": [
+                r'\b[1-9]\d* divergences?\b',
+                r'\bdiverged\b',
+                r'not.*converg',
+                r'failed.*converg',
+                r'r[-_]?hat[:=] ?(?:1\.[1-9]|[2-9]|\d{2,})',
+            ],
+        },
+    },
+    "sklearn": {
+        "description": "scikit-learn verbose output (MLP, SGD, GridSearchCV)",
+        "detect": [
+            r'^Iteration \d+, loss = ',
+            r'^-- Epoch \d+\s*$',
+            r'^Norm: .*Avg\. loss: ',
+            r'^\[CV\] ',
+            r'^Fitting \d+ folds for each of \d+ candidates',
+        ],
+        "patterns": {
+            "epoch": (r'^(?:Iteration|-- Epoch) (\d+)', ("iteration", "epoch")),
+            "loss": (r'loss(?:(?<=, loss) = |(?<=Avg\. loss): )' + _NUMBER, ("loss",)),
+            "accuracy": (_word_key("score") + '=' + _NUMBER, ("score=",)),
+        },
+    },
+    "statsmodels": {
+        "description": "statsmodels fit(disp=True) optimizer reports and warnings",
+        "detect": [
+            r'^Optimization terminated successfully\.',
+            r'^\s*Current function value: ',
+            r'^\s*(?:Function|Gradient) evaluations: \d+',
+            r'(?:Convergence|HessianInversion)Warning',
+        ],
+        "patterns": {
+            "loss": (r'^\s*Current function value: ' + _NUMBER, ("current function value",)),
+        },
+    },
+}
+
+# Checks every profile keeps from the generic tables
+COMMON_CHECKS = frozenset(CRITICAL_PATTERNS) | {"nan_inf", "warning", "error"}
+
+# Head of the log read by detect_profile()
+PROFILE_DETECT_BYTES = 64 * 1024
+
+# A profile is picked when at least this many sample lines look like it,
+# it beats every other profile by PROFILE_DOMINANCE, and its patterns read
+# PROFILE_MIN_COVERAGE of the sample lines the generic patterns take metric
+# values from; mixed logs stay generic
+PROFILE_MIN_LINES = 3
+PROFILE_DOMINANCE = 2
+PROFILE_MIN_COVERAGE = 0.9
+
+
+def build_profile(description: str, detect: List, patterns: Dict[str, Any],
+                  events: Dict[str, Any], keywords: Dict[str, Tuple]) -> Dict[str, Any]:
+    """Bundle compiled matchers and the scanner tables derived from them."""
+    return {
+        "description": description,
+        "detect": detect,
+        "patterns": patterns,
+        "events": events,
+        "keywords": keywords,
+        "byte_keywords": [(k.encode(), checks) for k, checks in keywords.items()],
+        "all_checks": frozenset(check for checks in keywords.values() for check in checks)
+    }
+
+
+def compile_profile(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Compile a PROFILE_SPECS entry on top of the generic common checks."""
+    patterns = {check: PATTERNS[check] for check in ("warning", "error", "nan_inf")}
+    keywords = defaultdict(list)
+    for keyword, checks in SCAN_KEYWORDS.items():
+        keywords[keyword].extend(c for c in checks if c in COMMON_CHECKS)
+
+    for check, (regex, check_keywords) in spec["patterns"].items():
+        patterns[check] = re.compile(regex)
+        for keyword in check_keywords:
+            keywords[keyword].append(check)
+
+    events = dict(CRITICAL_REGEXES)
+    for event_type, regexes in spec.get("events", {}).items():
+        events[event_type] = re.compile('|'.join(f'(?:{p})' for p in regexes))
+
+    return build_profile(
+        spec["description"],
+        [re.compile(p) for p in spec["detect"]],
+        patterns,
+        events,
+        {k: tuple(dict.fromkeys(checks)) for k, checks in keywords.items() if checks}
+    )
+
+
+LOG_PROFILES = {
+    "generic": build_profile("Any framework (loose keyword patterns)", [],
+                             PATTERNS, CRITICAL_REGEXES, SCAN_KEYWORDS),
+}
+LOG_PROFILES.update((name, compile_profile(spec)) for name, spec in PROFILE_SPECS.items())
+
+GENERIC_PROFILE = LOG_PROFILES["generic"]
+
+
+def get_profile(name: str) -> Dict[str, Any]:
+    """Compiled profile by name (see LOG_PROFILES)."""
+    try:
+        return LOG_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown log format profile: {name} "
+                         f"(choose from {', '.join(LOG_PROFILES)})") from None
+
+
+def metric_lines(lines: List[str], patterns: Dict[str, Any]) -> List[bool]:
+    """Per line, whether any metric-series pattern in patterns matches."""
+    regexes = [patterns[name] for name, _, _ in METRIC_SERIES if name in patterns]
+    return [any(regex.search(line) for regex in regexes) for line in lines]
+
+
+def detect_profile_text(text: str) -> str:
+    """Name of the profile whose detect patterns match most sample lines."""
+    lines = text.splitlines()
+    hits = {}
+    for name, profile in LOG_PROFILES.items():
+        if profile["detect"]:
+            hits[name] = sum(
+                1 for line in lines
+                if any(regex.search(line) for regex in profile["detect"])
+            )
+    if not hits:
+        return "generic"
+
+    ranked = sorted(hits.items(), key=lambda item: -item[1])
+    best, best_hits = ranked[0]
+    runner_up = ranked[1][1] if len(ranked) > 1 else 0
+    if best_hits < PROFILE_MIN_LINES or best_hits < PROFILE_DOMINANCE * runner_up:
+        return "generic"
+
+    generic = metric_lines(lines, PATTERNS)
+    covered = metric_lines(lines, LOG_PROFILES[best]["patterns"])
+    wanted = sum(generic)
+    if wanted and sum(g and c for g, c in zip(generic, covered)) < PROFILE_MIN_COVERAGE * wanted:
+        return "generic"
+    return best
+
+
+def detect_profile(log_path: str, sample_bytes: int = PROFILE_DETECT_BYTES) -> str:
+    """Detect the log format from its first sample_bytes (decompressed)."""
+    with open_log_text(log_path) as f:
+        return detect_profile_text(f.read(sample_bytes))
+
+
+def resolve_profile(profile: str, log_path: str) -> str:
+    """Turn "auto" into the detected profile name; validate any other name."""
+    if profile == "auto":
+        return detect_profile(log_path)
+    get_profile(profile)
+    return profile
+
+
+# ============================================================================
+# STREAMING ACCUMULATORS
+# ============================================================================
+
+# Bucket budget per metric series. Up to this many values each bucket holds a
+# single value and the series analytics are exact; beyond it adjacent buckets
+# are merged pairwise, so memory stays flat however long the log is.
+SERIES_BUCKETS = 4096
+
+# Trailing values kept exactly (MCMC convergence looks at the last 5 R-hats)
+RECENT_VALUES = 5
+
+# Threshold crossings reported as struggle points: (type, operator, threshold)
+SERIES_FLAGS = {
+    "gradient_norms": (("gradient_explosion", ">", 1e5), ("gradient_vanishing", "<", 1e-7)),
+    "rhat_values": (("rhat_divergence", ">", 1.1),),
+}
+
+# Crossings listed individually per series; the rest are only counted
+MAX_FLAGGED_ENTRIES = 20
+
+# Warning/error entries kept verbatim (the summary shows the first five)
+FIRST_MESSAGES = 5
+
+# Distinct message shapes counted exactly for the frequent-message ranking
+MAX_TRACKED_MESSAGES = 256
+
+# Numbers are masked so "step 120" and "step 121" count as one message shape
+MESSAGE_NUMBERS = re.compile(r'\d+(?:\.\d+)?(?:e[+-]?\d+)?', re.IGNORECASE)
+
+# Occurrences sampled per critical event type
+EVENT_SAMPLE_SIZE = 5
+
+
+def merge_moments(a: Tuple, b: Tuple) -> Tuple:
+    """Combine two (count, mean, M2, min) buckets of consecutive values.
+
+    Chan et al.'s pairwise form of Welford's update, so M2 / (count - 1)
+    stays a numerically stable sample variance.
+    """
+    n_a, mean_a, m2_a, min_a = a
+    n_b, mean_b, m2_b, min_b = b
+    if not n_a:
+        return b
+    if not n_b:
+        return a
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    return (
+        n,
+        mean_a + delta * n_b / n,
+        m2_a + m2_b + delta * delta * n_a * n_b / n,
+        min_a if min_a <= min_b else min_b,
+    )
+
+
+class SeriesStats:
+    """Constant-memory accumulator for one metric series (loss, R-hat, ...).
+
+    Kept exactly: count, first/last entries, max and the entry of the first
+    minimum, the running sum, the last RECENT_VALUES values, the Welford
+    variance of consecutive differences, and the first MAX_FLAGGED_ENTRIES
+    threshold crossings. The values themselves are folded into at most
+    SERIES_BUCKETS (count, mean, M2, min) buckets; while each bucket holds
+    one value, exact_values() returns the series. keep_series additionally
+    stores every value in an array('d').
+
+    Buckets cover equal runs of lines, so the layout depends only on where
+    the values are in the log: the value on line L of a segment (file) that
+    follows line S goes to bucket (S, (L - S - 1) // width), with width the
+    smallest power of two leaving at most SERIES_BUCKETS non-empty buckets.
+    A chunk that knows how many lines of its segment precede it (see
+    start_segment) builds the same buckets as a serial parse, so streamed,
+    resumed and merged accumulators agree without keeping the values.
+    """
+
+    def __init__(self, flags: Tuple = (), keep_series: bool = False):
+        self.flags = flags
+        self.count = 0
+        self.first = None
+        self.last_value = None
+        self.last_epoch = None
+        self.last_line = None
+        self.min_entry = None
+        self.min_value = None
+        self.max_value = None
+        self.total = 0
+        self.abs_total = 0
+        self.diff_mean = 0.0
+        self.diff_m2 = 0.0
+        self.recent = deque(maxlen=RECENT_VALUES)
+        self.buckets = []
+        self.keys = []
+        self.segment = 0
+        self.width = 1
+        self.flag_counts = {}
+        self.flagged = []
+        self.series = array('d') if keep_series else None
+
+    def add(self, value: float, epoch: Optional[int], line: int) -> None:
+        count = self.count
+        if count:
+            # Welford update over consecutive differences
+            delta = value - self.last_value
+            step = delta - self.diff_mean
+            self.diff_mean += step / count
+            self.diff_m2 += step * (delta - self.diff_mean)
+            if value < self.min_value:
+                self.min_value = value
+                self.min_entry = {"epoch": epoch, "value": value, "line": line}
+            if value > self.max_value:
+                self.max_value = value
+        else:
+            self.first = self.min_entry = {"epoch": epoch, "value": value, "line": line}
+            self.min_value = self.max_value = value
+
+        self.last_value = value
+        self.last_epoch = epoch
+        self.last_line = line
+        self.count = count + 1
+        self.total += value
+        self.abs_total += abs(value)
+        self.recent.append(value)
+        if self.series is not None:
+            self.series.append(value)
+        self._append_bucket(value, line)
+
+        for name, op, threshold in self.flags:
+            if (value > threshold) if op == ">" else (value < threshold):
+                self.flag_counts[name] = self.flag_counts.get(name, 0) + 1
+                if len(self.flagged) < MAX_FLAGGED_ENTRIES:
+                    self.flagged.append((name, {"epoch": epoch, "value": value, "line": line}))
+                break
+
+    def start_segment(self, origin: int) -> None:
+        """Lines after line number origin belong to a new segment (file);
+        a negative origin says -origin lines of the segment precede line 1."""
+        self.segment = origin
+
+    def _append_bucket(self, value: float, line: int) -> None:
+        """Fold a value into the bucket of its line."""
+        key = (self.segment, (line - self.segment - 1) // self.width)
+        if self.keys and self.keys[-1] == key:
+            n, mean, m2, low = self.buckets[-1]
+            n += 1
+            step = value - mean
+            mean += step / n
+            self.buckets[-1] = (n, mean, m2 + step * (value - mean), value if value < low else low)
+        else:
+            self.keys.append(key)
+            self.buckets.append((1, value, 0.0, value))
+            if len(self.buckets) > SERIES_BUCKETS:
+                self._compress()
+
+    def _coarsen(self, width: int) -> None:
+        """Regroup the buckets for a larger power-of-two width."""
+        factor = width // self.width
+        if factor > 1:
+            keys, buckets = [], []
+            for (segment, k), bucket in zip(self.keys, self.buckets):
+                key = (segment, k // factor)
+                if keys and keys[-1] == key:
+                    buckets[-1] = merge_moments(buckets[-1], bucket)
+                else:
+                    keys.append(key)
+                    buckets.append(bucket)
+            self.keys, self.buckets, self.width = keys, buckets, width
+
+    def _compress(self) -> None:
+        """Double the width until at most SERIES_BUCKETS buckets are left."""
+        while len(self.buckets) > SERIES_BUCKETS:
+            self._coarsen(self.width * 2)
+
+    def merge(self, other: "SeriesStats") -> None:
+        """Append the series accumulated by other (which follows this one).
+
+        other must be rebased to this accumulator's line numbering first;
+        its buckets are then keyed like this one's, and only need coarsening
+        to the larger width.
+        """
+        if not other.count:
+            self.segment = other.segment
+            return
+        if not self.count:
+            series = self.series
+            self.__dict__.update(other.__dict__)
+            if series is None:
+                self.series = None
+            return
+
+        # Differences: the one across the boundary, then other's own
+        delta = other.first["value"] - self.last_value
+        diffs = merge_moments((self.count - 1, self.diff_mean, self.diff_m2, 0.0),
+                              (1, delta, 0.0, 0.0))
+        diffs = merge_moments(diffs, (other.count - 1, other.diff_mean, other.diff_m2, 0.0))
+        _, self.diff_mean, self.diff_m2, _ = diffs
+
+        if other.min_value < self.min_value:
+            self.min_value, self.min_entry = other.min_value, other.min_entry
+        if other.max_value > self.max_value:
+            self.max_value = other.max_value
+        self.last_value, self.last_epoch, self.last_line = (
+            other.last_value, other.last_epoch, other.last_line)
+        self.count += other.count
+        self.total += other.total
+        self.abs_total += other.abs_total
+        self.recent.extend(other.recent)
+        if self.series is not None and other.series is not None:
+            self.series.extend(other.series)
+
+        for name, n in other.flag_counts.items():
+            self.flag_counts[name] = self.flag_counts.get(name, 0) + n
+        self.flagged.extend(other.flagged[:MAX_FLAGGED_ENTRIES - len(self.flagged)])
+
+        width = max(self.width, other.width)
+        self._coarsen(width)
+        other._coarsen(width)
+        keys, buckets = other.keys, other.buckets
+        if keys[0] == self.keys[-1]:
+            # The bucket straddling the chunk boundary
+            self.buckets[-1] = merge_moments(self.buckets[-1], buckets[0])
+            keys, buckets = keys[1:], buckets[1:]
+        self.keys.extend(keys)
+        self.buckets.extend(buckets)
+        self.segment = other.segment
+        self._compress()
+
+    def rebase(self, line_offset: int, carried_epoch: int) -> None:
+        """Shift chunk-local line numbers and resolve leading unknown epochs."""
+        self.segment += line_offset
+        if not self.count:
+            return
+        self.keys = [(segment + line_offset, k) for segment, k in self.keys]
+        _rebase_entries([self.first, self.min_entry] + [entry for _, entry in self.flagged],
+                        line_offset, carried_epoch)
+        self.last_line += line_offset
+        if self.last_epoch is None:
+            self.last_epoch = carried_epoch
+
+    def exact_values(self) -> Optional[Any]:
+        """The full series if it is still known exactly, else None."""
+        if self.series is not None:
+            return self.series
+        if len(self.buckets) == self.count:
+            return [bucket[1] for bucket in self.buckets]
+        return None
+
+    def diff_stdev(self) -> float:
+        """Sample standard deviation of consecutive differences."""
+        if self.count < 3:
+            return 0
+        return math.sqrt(max(self.diff_m2, 0.0) / (self.count - 2))
+
+    def half_means(self) -> Tuple[float, float]:
+        """Means of the first count//2 values and of the rest (bucket estimate)."""
+        half = self.count // 2
+        first_total = total = 0.0
+        seen = 0
+        for count, mean, _, _ in self.buckets:
+            first_total += mean * min(count, max(half - seen, 0))
+            total += mean * count
+            seen += count
+        return first_total / half, (total - first_total) / (self.count - half)
+
+    def tail_stats(self, size: int) -> Tuple[float, float]:
+        """Mean and sample stdev of the last size values (bucket estimate)."""
+        tail = (0, 0.0, 0.0, 0.0)
+        for count, mean, m2, low in reversed(self.buckets):
+            take = min(count, size - tail[0])
+            if take <= 0:
+                break
+            tail = merge_moments((take, mean, m2 * take / count, low), tail)
+        n, mean, m2, _ = tail
+        return mean, math.sqrt(max(m2, 0.0) / (n - 1)) if n > 1 else 0
+
+    def first_index_at_or_below(self, target: float) -> Optional[int]:
+        """Index of the first value <= target (start of its bucket)."""
+        index = 0
+        for count, _, _, low in self.buckets:
+            if low <= target:
+                return index
+            index += count
+        return None
+
+    def unlisted_flags(self) -> Dict[str, int]:
+        """Threshold crossings counted beyond the listed entries, per type."""
+        listed = defaultdict(int)
+        for name, _ in self.flagged:
+            listed[name] += 1
+        return {
+            name: n - listed[name]
+            for name, n in self.flag_counts.items() if n > listed[name]
+        }
+
+
+class MessageStats:
+    """Warnings or errors: total count, the first FIRST_MESSAGES entries, and
+    exact counts per message shape (numbers masked) for up to
+    MAX_TRACKED_MESSAGES shapes. Shapes first seen after that are counted in
+    untracked only."""
+
+    def __init__(self):
+        self.count = 0
+        self.first = []
+        self.shapes = {}
+        self.untracked = 0
+
+    def add(self, message: str, epoch: Optional[int], line: int) -> None:
+        self.count += 1
+        if len(self.first) < FIRST_MESSAGES:
+            self.first.append({"epoch": epoch, "message": message, "line": line})
+        self._count_shape(MESSAGE_NUMBERS.sub('#', message[:100]), 1)
+
+    def _count_shape(self, shape: str, n: int) -> None:
+        if shape in self.shapes:
+            self.shapes[shape] += n
+        elif len(self.shapes) < MAX_TRACKED_MESSAGES:
+            self.shapes[shape] = n
+        else:
+            self.untracked += n
+
+    def merge(self, other: "MessageStats") -> None:
+        self.count += other.count
+        self.first.extend(other.first[:FIRST_MESSAGES - len(self.first)])
+        for shape, n in other.shapes.items():
+            self._count_shape(shape, n)
+        self.untracked += other.untracked
+
+    def rebase(self, line_offset: int, carried_epoch: int) -> None:
+        _rebase_entries(self.first, line_offset, carried_epoch)
+
+    def most_common(self, k: int) -> List[Tuple[str, int]]:
+        """Top k message shapes by count (ties keep first-seen order)."""
+        return sorted(self.shapes.items(), key=lambda item: -item[1])[:k]
+
+
+class EventStats:
+    """Occurrences of one critical event type: count, first occurrence and a
+    bottom-k sample of EVENT_SAMPLE_SIZE occurrences ranked by
+    (crc32(context), line). The ranking is deterministic, so merging chunk
+    samples gives exactly the sample of a serial pass."""
+
+    def __init__(self):
+        self.count = 0
+        self.first = None
+        self.sample = []
+
+    def add(self, epoch: Optional[int], line: int, context: str) -> None:
+        entry = {"epoch": epoch, "line": line, "context": context}
+        self.count += 1
+        if self.first is None:
+            self.first = entry
+        # Lines only grow within a pass, so an equal hash never outranks
+        rank = zlib.crc32(context.encode('utf-8'))
+        if len(self.sample) < EVENT_SAMPLE_SIZE or rank < self.sample[-1][0]:
+            self.sample.append((rank, entry))
+            self.sample.sort(key=lambda item: (item[0], item[1]["line"]))
+            del self.sample[EVENT_SAMPLE_SIZE:]
+
+    def merge(self, other: "EventStats") -> None:
+        self.count += other.count
+        if self.first is None:
+            self.first = other.first
+        self.sample = sorted(self.sample + other.sample,
+                             key=lambda item: (item[0], item[1]["line"]))[:EVENT_SAMPLE_SIZE]
+
+    def rebase(self, line_offset: int, carried_epoch: int) -> None:
+        _rebase_entries([self.first] + [entry for _, entry in self.sample],
+                        line_offset, carried_epoch)
+
+    def sample_lines(self) -> List[int]:
+        return sorted(entry["line"] for _, entry in self.sample)
+
+
+# ============================================================================
+# LOG SOURCES
+# ============================================================================
+
+# Leading bytes of the compressed formats we can stream (zstd needs zstandard)
+COMPRESSION_MAGIC = [
+    (b'\x1f\x8b', "gzip"),
+    (b'\xfd7zXZ\x00', "xz"),
+    (b'BZh', "bz2"),
+    (b'\x28\xb5\x2f\xfd', "zstd"),
+]
+
+# logrotate segment number: training_full.log.3.gz is older than .log.1
+ROTATION_SUFFIX = re.compile(r'\.(\d+)(?:\.(?:gz|xz|lzma|bz2|zst))?$')
+
+
+def detect_compression(log_path: str) -> Optional[str]:
+    """Name of the compression format of log_path, or None for plain text."""
+    with open(log_path, 'rb') as f:
+        head = f.read(6)
+    for magic, name in COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def open_log_text(log_path: str) -> io.TextIOWrapper:
+    """Open a plain or compressed log for streaming text reads.
+
+    Decompression happens on the fly, no temp files; lines and decoding are
+    the same as open(log_path, 'r', encoding='utf-8', errors='ignore').
+    """
+    compression = detect_compression(log_path)
+    if compression == "gzip":
+        raw = gzip.open(log_path, 'rb')
+    elif compression == "xz":
+        raw = lzma.open(log_path, 'rb')
+    elif compression == "bz2":
+        raw = bz2.open(log_path, 'rb')
+    elif compression == "zstd":
+        if not HAS_ZSTD:
+            raise RuntimeError(f"{log_path} is zstd-compressed: pip install zstandard")
+        raw = io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(open(log_path, 'rb'), closefd=True)
+        )
+    else:
+        raw = open(log_path, 'rb')
+    return io.TextIOWrapper(raw, encoding='utf-8', errors='ignore')
+
+
+def rotation_order_key(log_path: str) -> Tuple[int, str]:
+    """Sort key putting rotated segments oldest first, the live log last."""
+    match = ROTATION_SUFFIX.search(os.path.basename(log_path))
+    return (-int(match.group(1)) if match else 0, log_path)
+
+
+def resolve_log_paths(log_arg: str) -> List[str]:
+    """Expand a log path or glob (e.g. 'logs/training_full.log*') into
+    its segments in rotation order."""
+    if any(c in log_arg for c in '*?['):
+        paths = [p for p in glob.glob(log_arg) if os.path.isfile(p)]
+    else:
+        paths = [log_arg] if os.path.isfile(log_arg) else []
+    return sorted(paths, key=rotation_order_key)
+
+
 # ============================================================================
 # ANALYSIS FUNCTIONS
 # ============================================================================
 
-def parse_log_file(log_path: str) -> Dict[str, Any]:
-    """Parse a training log file and extract all relevant information."""
+def new_log_data(keep_series: bool = False) -> Dict[str, Any]:
+    """Create an empty parse result. Its size does not grow with the log:
+    metrics, messages and events go into streaming accumulators, and the
+    full metric series are only stored when keep_series is set."""
+
+    def series(key: str) -> SeriesStats:
+        return SeriesStats(SERIES_FLAGS.get(key, ()), keep_series)
+
+    return {
+        "epochs": [],
+        "loss_values": series("loss_values"),
+        "val_loss_values": series("val_loss_values"),
+        "accuracy_values": series("accuracy_values"),
+        "gradient_norms": series("gradient_norms"),
+        "learning_rates": series("learning_rates"),
+        "rhat_values": series("rhat_values"),
+        "rmse_values": series("rmse_values"),
+        "warnings": MessageStats(),
+        "errors": MessageStats(),
+        "times": series("times"),
+        "raw_lines": 0,
+        "critical_events": defaultdict(EventStats)
+    }
+
+
+def start_segment(data: Dict[str, Any], origin: Optional[int] = None) -> None:
+    """Start a new segment (file) in data's metric series after line origin
+    (default: the lines parsed so far); see SeriesStats.start_segment."""
+    origin = data["raw_lines"] if origin is None else origin
+    for value in data.values():
+        if isinstance(value, SeriesStats):
+            value.start_segment(origin)
+
+
+def parse_line(line: str, line_lower: str, active: set, line_num: int,
+               current_epoch: Optional[int], data: Dict[str, Any],
+               seen_epochs: set, profile: Dict[str, Any] = GENERIC_PROFILE) -> Optional[int]:
+    """Run the candidate checks on one line and record matches in data.
+
+    Returns the epoch in effect after this line.
+    """
+    patterns = profile["patterns"]
+
+    # Extract epoch
+    if "epoch" in active:
+        epoch_match = patterns["epoch"].search(line)
+        if epoch_match:
+            current_epoch = int(epoch_match.group(1))
+            if current_epoch not in seen_epochs:
+                seen_epochs.add(current_epoch)
+                data["epochs"].append(current_epoch)
+
+    # Extract numeric metrics
+    for pattern_name, key, finite_only in METRIC_SERIES:
+        if pattern_name not in active:
+            continue
+        metric_match = patterns[pattern_name].search(line)
+        if metric_match:
+            try:
+                value = float(metric_match.group(1))
+            except ValueError:
+                continue
+            if finite_only and (math.isnan(value) or math.isinf(value)):
+                continue
+            data[key].add(value, current_epoch, line_num)
+
+    # Extract warnings
+    if "warning" in active:
+        warn_match = patterns["warning"].search(line)
+        if warn_match:
+            data["warnings"].add(warn_match.group(1)[:200], current_epoch, line_num)  # Truncate
+
+    # Extract errors
+    if "error" in active:
+        error_match = patterns["error"].search(line)
+        if error_match:
+            data["errors"].add(error_match.group(1)[:200], current_epoch, line_num)
+
+    # Check for critical events
+    for event_type, regex in profile["events"].items():
+        if event_type in active and regex.search(line_lower):
+            data["critical_events"][event_type].add(current_epoch, line_num, line[:200].strip())
+
+    # Check for NaN/Inf
+    if "nan_inf" in active and patterns["nan_inf"].search(line):
+        data["critical_events"]["nan_inf"].add(current_epoch, line_num, line[:200].strip())
+
+    return current_epoch
+
+
+def parse_lines(lines: Iterable[str], data: Dict[str, Any],
+                current_epoch: Optional[int] = 0, profile: str = "generic") -> Optional[int]:
+    """Parse lines into data, continuing its line numbering.
+
+    Single pass per line: the keyword prefilter (scan_line) selects the
+    candidate patterns, and only those precompiled regexes are evaluated.
+    profile names the log format (see LOG_PROFILES).
+    Returns the epoch in effect after the last line, so callers can resume.
+    """
+
+    seen_epochs = set(data["epochs"])
+    line_num = data["raw_lines"]
+    compiled = get_profile(profile)
+    keywords = compiled["keywords"]
+    all_checks = compiled["all_checks"]
+
+    for line in lines:
+        line_num += 1
+
+        line_lower = line.lower()
+        active = scan_line(line_lower, keywords) if line.isascii() else all_checks
+        if active:
+            current_epoch = parse_line(line, line_lower, active, line_num,
+                                       current_epoch, data, seen_epochs, compiled)
+
+    data["raw_lines"] = line_num
+    return current_epoch
+
+
+def split_universal_newlines(text: str) -> List[str]:
+    """Split decoded text the way text-mode open() iterates it.
+
+    CRLF and a lone CR both end a line and become LF; empty text is no line.
+    """
+    if '\r' not in text:
+        return [text] if text else []
+    parts = text.replace('\r\n', '\n').split('\r')
+    lines = [part + '\n' for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines
+
+
+def parse_buffer(buf: Any, start: int, end: int, data: Dict[str, Any],
+                 current_epoch: Optional[int] = 0,
+                 window_bytes: int = MMAP_WINDOW_BYTES,
+                 profile: str = "generic") -> Optional[int]:
+    """Parse buf[start:end] (bytes or mmap) into data, decoding only lines
+    that can match.
+
+    The buffer is walked in newline-aligned windows. Each window is lowercased
+    once and every keyword is located with bytes.find(), which gives both the
+    lines worth looking at and their candidate checks; all other lines are
+    counted with bytes.count() and never decoded. Lines that are not plain
+    ASCII (NEEDS_TEXT_DECODE) are decoded and scanned as text, so the result
+    is identical to parse_lines() on the decoded file.
+    """
+
+    seen_epochs = set(data["epochs"])
+    line_num = data["raw_lines"]
+    needs_decode = NEEDS_TEXT_DECODE.search
+    compiled = get_profile(profile)
+    keywords = compiled["keywords"]
+    byte_keywords = compiled["byte_keywords"]
+    all_checks = compiled["all_checks"]
+
+    window_start = start
+    while window_start < end:
+        window_end = min(window_start + window_bytes, end)
+        if window_end < end:
+            newline = buf.find(b'\n', window_end - 1, end)
+            window_end = end if newline < 0 else newline + 1
+
+        raw = buf[window_start:window_end]
+        low = raw.lower()
+        size = len(raw)
+
+        def next_special_from(pos: int) -> int:
+            match = needs_decode(raw, pos)
+            return match.start() if match else size
+
+        def next_keyword_from(keyword: bytes, pos: int) -> int:
+            found = low.find(keyword, pos)
+            return size if found < 0 else found
+
+        next_special = next_special_from(0)
+        next_keyword = [next_keyword_from(k, 0) for k, _ in byte_keywords]
+
+        pos = 0
+        while pos < size:
+            target = min(next_special, min(next_keyword))
+            if target >= size:
+                # Only plain keyword-free lines left in this window
+                line_num += low.count(b'\n', pos, size)
+                if not low.endswith(b'\n'):
+                    line_num += 1
+                break
+
+            # Skip ahead to the line holding the next keyword/special byte
+            line_start = low.rfind(b'\n', pos, target) + 1
+            if line_start > pos:
+                line_num += low.count(b'\n', pos, line_start)
+                pos = line_start
+
+            newline = raw.find(b'\n', pos)
+            stop = size if newline < 0 else newline + 1
+
+            active = set()
+            for i, (keyword, checks) in enumerate(byte_keywords):
+                if next_keyword[i] < stop:
+                    active.update(checks)
+                    next_keyword[i] = next_keyword_from(keyword, stop)
+
+            if next_special < stop:
+                text = raw[pos:stop].decode('utf-8', errors='ignore')
+                for line in split_universal_newlines(text):
+                    line_num += 1
+                    line_lower = line.lower()
+                    line_active = scan_line(line_lower, keywords) if line.isascii() else all_checks
+                    if line_active:
+                        current_epoch = parse_line(line, line_lower, line_active, line_num,
+                                                   current_epoch, data, seen_epochs, compiled)
+                next_special = next_special_from(stop)
+            else:
+                line_num += 1
+                line = raw[pos:stop].decode('ascii')
+                current_epoch = parse_line(line, line.lower(), active, line_num,
+                                           current_epoch, data, seen_epochs, compiled)
+
+            pos = stop
+
+        # Drop the mapped pages of the finished window so resident memory stays
+        # at about one window, however large the file is
+        release_from = window_start - window_start % mmap.PAGESIZE
+        if hasattr(buf, 'madvise') and hasattr(mmap, 'MADV_DONTNEED') and window_end > release_from:
+            buf.madvise(mmap.MADV_DONTNEED, release_from, window_end - release_from)
+
+        window_start = window_end
+
+    data["raw_lines"] = line_num
+    return current_epoch
+
+
+def parse_into(log_path: str, data: Dict[str, Any], current_epoch: Optional[int] = 0,
+               use_mmap: bool = False, profile: str = "generic") -> Optional[int]:
+    """Parse one log file into data, continuing its line numbering.
+
+    Compressed logs are decompressed as a stream; use_mmap applies to plain
+    files only. Returns the epoch in effect after the last line.
+    """
+    if detect_compression(log_path):
+        with open_log_text(log_path) as f:
+            return parse_lines(f, data, current_epoch, profile)
+
+    if use_mmap:
+        if os.path.getsize(log_path) == 0:
+            return current_epoch
+        with open(log_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return parse_buffer(mm, 0, len(mm), data, current_epoch, profile=profile)
+
+    with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
+        return parse_lines(f, data, current_epoch, profile)
+
+
+def parse_log_file(log_path: str, use_mmap: bool = False,
+                   keep_series: bool = False, profile: str = "generic") -> Dict[str, Any]:
+    """Parse a training log file and extract all relevant information.
+
+    With use_mmap, the file is memory-mapped and scanned at the byte level
+    (see parse_buffer). With the generic profile, extracts the same entries
+    as parse_log_file_reference(); see new_log_data() for keep_series.
+    """
+
+    data = new_log_data(keep_series)
+    parse_into(log_path, data, 0, use_mmap, profile)
+    return data
+
+
+# ============================================================================
+# PARALLEL CHUNKED PARSING
+# ============================================================================
+
+# Don't split below this size; smaller chunks cost more in process overhead
+# than they save in parse time
+MIN_CHUNK_BYTES = 16 * 1024 * 1024
+
+# Accumulators in the parse result whose entries carry "epoch" and "line" fields
+ENTRY_KEYS = [
+    "loss_values", "val_loss_values", "accuracy_values", "gradient_norms",
+    "rhat_values", "warnings", "errors"
+]
+
+
+def split_byte_ranges(log_path: str, n_chunks: int, start: int = 0,
+                      end: Optional[int] = None) -> List[Tuple[int, int]]:
+    """Split a file (or its bytes start:end, end on a line boundary) into up
+    to n_chunks byte ranges that end on newlines."""
+    if end is None:
+        end = os.path.getsize(log_path)
+    size = end - start
+    if n_chunks <= 1 or size <= 0:
+        return [(start, end)]
+
+    boundaries = [start]
+    with open(log_path, 'rb') as f:
+        for i in range(1, n_chunks):
+            f.seek(max(start + size * i // n_chunks - 1, boundaries[-1]))
+            f.readline()  # Advance past the next newline
+            pos = f.tell()
+            if pos >= end:
+                break
+            if pos > boundaries[-1]:
+                boundaries.append(pos)
+    boundaries.append(end)
+
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def iter_text_lines(f: BinaryIO, start: int, end: int) -> Iterator[str]:
+    """Yield decoded lines of a byte range exactly as text-mode open() would."""
+    f.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        raw = f.readline(remaining)
+        if not raw:
+            break
+        remaining -= len(raw)
+        yield from split_universal_newlines(raw.decode('utf-8', errors='ignore'))
+
+
+def parse_range(log_path: str, start: int, end: int, data: Dict[str, Any],
+                current_epoch: Optional[int] = 0, use_mmap: bool = False,
+                profile: str = "generic") -> Optional[int]:
+    """Parse bytes start:end (starting on a line) of a plain log into data.
+    Returns the epoch in effect after the last line."""
+    if end <= start:
+        return current_epoch
+    with open(log_path, 'rb') as f:
+        if use_mmap:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return parse_buffer(mm, start, end, data, current_epoch, profile=profile)
+        return parse_lines(iter_text_lines(f, start, end), data, current_epoch, profile)
+
+
+def count_lines(log_path: str, start: int, end: int) -> int:
+    """Lines the parsers number in bytes start:end of a plain log (a range
+    ending on a newline): LF, CRLF and a lone CR each end a line."""
+    lines = 0
+    carried_cr = False
+    with open(log_path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(MMAP_WINDOW_BYTES, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            lines += block.count(b'\n') + block.count(b'\r') - block.count(b'\r\n')
+            if carried_cr and block.startswith(b'\n'):
+                lines -= 1  # A CRLF split across blocks
+            carried_cr = block.endswith(b'\r')
+    return lines
+
+
+def parse_chunk(log_path: str, start: int, end: int, use_mmap: bool = False,
+                keep_series: bool = False, profile: str = "generic",
+                lines_before: int = 0) -> Tuple[Dict[str, Any], Optional[int]]:
+    """Parse one byte range. Entries before the chunk's first epoch marker get
+    epoch None; merge_chunks() fills them in from the preceding chunks.
+
+    lines_before (the file's lines before start, see count_lines) places the
+    metric buckets as a serial parse would, so the chunk merges without its
+    raw values.
+    """
+    data = new_log_data(keep_series)
+    start_segment(data, -lines_before)
+    last_epoch = parse_range(log_path, start, end, data, None, use_mmap, profile)
+    return data, last_epoch
+
+
+def _rebase_entries(entries: List[Dict], line_offset: int, carried_epoch: int) -> None:
+    """Shift chunk-local line numbers and resolve the leading unknown epochs.
+
+    An accumulator can hold the same entry in several fields; each is
+    shifted once.
+    """
+    seen = set()
+    for entry in entries:
+        if entry is None or id(entry) in seen:
+            continue
+        seen.add(id(entry))
+        entry["line"] += line_offset
+        if entry["epoch"] is None:
+            entry["epoch"] = carried_epoch
+
+
+def merge_chunks(chunks: List[Tuple[Dict[str, Any], Optional[int]]],
+                 keep_series: bool = False,
+                 carried_epoch: Optional[int] = 0) -> Dict[str, Any]:
+    """Merge per-chunk results in file order into one parse result.
+
+    Epoch reconciliation: current_epoch is carried across lines, so entries a
+    chunk recorded before its first epoch marker belong to the last epoch seen
+    in any earlier chunk (carried_epoch if none; None leaves them unresolved
+    for a later merge).
+    """
+    merged = new_log_data(keep_series)
+    seen_epochs = set()
+
+    for data, last_epoch in chunks:
+        line_offset = merged["raw_lines"]
+
+        for key in ENTRY_KEYS:
+            data[key].rebase(line_offset, carried_epoch)
+            merged[key].merge(data[key])
+
+        for event_type, events in data["critical_events"].items():
+            events.rebase(line_offset, carried_epoch)
+            merged["critical_events"][event_type].merge(events)
+
+        for epoch in data["epochs"]:
+            if epoch not in seen_epochs:
+                seen_epochs.add(epoch)
+                merged["epochs"].append(epoch)
+
+        merged["raw_lines"] += data["raw_lines"]
+        if last_epoch is not None:
+            carried_epoch = last_epoch
+
+    return merged
+
+
+def parse_chunks(pool: ProcessPoolExecutor, log_path: str, ranges: List[Tuple[int, int]],
+                 lines_before: int = 0, use_mmap: bool = False, keep_series: bool = False,
+                 profile: str = "generic") -> List[Tuple[Dict[str, Any], Optional[int]]]:
+    """Count the lines of each byte range, then parse the ranges as chunks;
+    lines_before is the file's line count before the first range."""
+    counts = list(pool.map(count_lines, [log_path] * (len(ranges) - 1),
+                           *zip(*ranges[:-1]))) if len(ranges) > 1 else []
+    offsets = [lines_before]
+    for count in counts:
+        offsets.append(offsets[-1] + count)
+    futures = [
+        pool.submit(parse_chunk, log_path, start, end, use_mmap, keep_series, profile, offset)
+        for (start, end), offset in zip(ranges, offsets)
+    ]
+    return [future.result() for future in futures]
+
+
+def parse_log_file_parallel(log_path: str, workers: int,
+                            min_chunk_bytes: int = MIN_CHUNK_BYTES,
+                            use_mmap: bool = False,
+                            keep_series: bool = False,
+                            profile: str = "generic") -> Dict[str, Any]:
+    """Parse a large log in newline-aligned chunks across worker processes.
+
+    Falls back to the serial parser when the file is too small to split
+    or compressed (a compressed stream can't be entered mid-way).
+    The result matches parse_log_file(), bucket estimates included: a
+    counting pre-pass gives each chunk the lines before it (count_lines).
+    """
+    size = os.path.getsize(log_path)
+    n_chunks = min(workers, size // max(min_chunk_bytes, 1))
+    if n_chunks <= 1 or detect_compression(log_path):
+        return parse_log_file(log_path, use_mmap, keep_series, profile)
+
+    ranges = split_byte_ranges(log_path, n_chunks)
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        chunks = parse_chunks(pool, log_path, ranges, 0, use_mmap, keep_series, profile)
+
+    return merge_chunks(chunks, keep_series)
+
+
+def parse_segment(log_path: str, use_mmap: bool = False, keep_series: bool = False,
+                  profile: str = "generic") -> Tuple[Dict[str, Any], Optional[int]]:
+    """Parse one rotated segment as a chunk for merge_chunks()."""
+    data = new_log_data(keep_series)
+    last_epoch = parse_into(log_path, data, None, use_mmap, profile)
+    return data, last_epoch
+
+
+def parse_log_segments(paths: List[str], workers: int = 1, use_mmap: bool = False,
+                       keep_series: bool = False, profile: str = "generic") -> Dict[str, Any]:
+    """Parse log segments (see resolve_log_paths) as one continuous log.
+
+    A single segment may be split into byte-range chunks; several segments
+    are parsed one per worker and merged in rotation order.
+    """
+    if len(paths) == 1:
+        if workers > 1:
+            return parse_log_file_parallel(paths[0], workers, use_mmap=use_mmap,
+                                           keep_series=keep_series, profile=profile)
+        return parse_log_file(paths[0], use_mmap, keep_series, profile)
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            futures = [
+                pool.submit(parse_segment, path, use_mmap, keep_series, profile)
+                for path in paths
+            ]
+            chunks = [future.result() for future in futures]
+        return merge_chunks(chunks, keep_series)
+
+    data = new_log_data(keep_series)
+    current_epoch = 0
+    for path in paths:
+        start_segment(data)
+        current_epoch = parse_into(path, data, current_epoch, use_mmap, profile)
+    return data
+
+
+def parse_log_file_reference(log_path: str) -> Dict[str, Any]:
+    """Original per-pattern parser, kept as the baseline for --benchmark."""
 
     data = {
         "epochs": [],
@@ -302,38 +1577,277 @@ def parse_log_file(log_path: str) -> Dict[str, Any]:
     return data
 
 
-def calculate_oscillation(values: List[Dict]) -> Dict[str, Any]:
-    """Calculate oscillation score from a series of values."""
+def accumulate_entries(entries: Dict[str, Any]) -> Dict[str, Any]:
+    """Fold the list-based output of parse_log_file_reference() into the
+    accumulators of new_log_data(), so both can be summarized."""
+    data = new_log_data()
+    data["epochs"] = list(entries["epochs"])
+    data["raw_lines"] = entries["raw_lines"]
 
-    if len(values) < 3:
-        return {
-            "score": 0,
-            "severity": "Insufficient data",
-            "trend": "unknown"
-        }
+    for key in ENTRY_KEYS:
+        field = "message" if key in ("warnings", "errors") else "value"
+        for entry in entries[key]:
+            data[key].add(entry[field], entry["epoch"], entry["line"])
+
+    for event_type, events in entries["critical_events"].items():
+        for event in events:
+            data["critical_events"][event_type].add(event["epoch"], event["line"], event["context"])
+
+    return data
+
+
+# ============================================================================
+# SERIES ANALYTICS
+# ============================================================================
 
-    raw_values = [v["value"] for v in values]
+# Rolling oscillation window: 5% of the series, at least 10 points
+ROLLING_WINDOW_FRACTION = 0.05
+MIN_ROLLING_WINDOW = 10
+
+# Rolling score above which a window counts as oscillating (severity "High")
+HIGH_OSCILLATION = 0.2
+
+# Change points in volatility (|first difference|): at most this many, each
+# segment at least MIN_SEGMENT_FRACTION of the series, and a split must
+# reach an F-like score of CHANGE_POINT_PENALTY * log(n)
+MAX_CHANGE_POINTS = 5
+MIN_SEGMENT_FRACTION = 0.05
+CHANGE_POINT_PENALTY = 4.0
+
+
+def as_float_array(values: Any) -> "np.ndarray":
+    """View an array('d') as a NumPy array without copying; copy anything else."""
+    if isinstance(values, array):
+        return np.frombuffer(values, dtype=np.float64)
+    return np.asarray(values, dtype=np.float64)
+
+
+def oscillation_stats(values: Any, use_numpy: Optional[bool] = None) -> Tuple[float, float, float, float]:
+    """Mean |value|, stdev of first differences, and the means of the first
+    and second half of the series."""
+    n = len(values)
+    half = n // 2
+    if HAS_NUMPY if use_numpy is None else use_numpy:
+        v = as_float_array(values)
+        return (
+            float(np.abs(v).mean()),
+            float(np.diff(v).std(ddof=1)),
+            float(v[:half].mean()),
+            float(v[half:].mean()),
+        )
+
+    derivatives = [values[i] - values[i-1] for i in range(1, n)]
+    return (
+        sum(abs(v) for v in values) / n,
+        statistics.stdev(derivatives),
+        sum(values[:half]) / half,
+        sum(values[half:]) / (n - half),
+    )
 
-    # Calculate first derivative (changes between consecutive values)
-    derivatives = []
-    for i in range(1, len(raw_values)):
-        derivatives.append(raw_values[i] - raw_values[i-1])
 
-    if not derivatives:
+def convergence_stats(values: Any, tail_size: int, target: float,
+                      use_numpy: Optional[bool] = None) -> Tuple[float, float, Optional[int]]:
+    """Mean and stdev of the last tail_size values, and the index of the
+    first value <= target (None if never reached)."""
+    if HAS_NUMPY if use_numpy is None else use_numpy:
+        v = as_float_array(values)
+        tail = v[-tail_size:]
+        reached = v <= target
+        index = int(np.argmax(reached)) if reached.any() else None
+        return float(tail.mean()), float(tail.std(ddof=1)), index
+
+    tail = values[-tail_size:]
+    index = None
+    for i, v in enumerate(values):
+        if v <= target:
+            index = i
+            break
+    return sum(tail) / len(tail), statistics.stdev(tail), index
+
+
+def rolling_oscillation(values: Any, window: int,
+                        use_numpy: Optional[bool] = None) -> Dict[str, Any]:
+    """Oscillation score (stdev of differences / mean |value|) over every
+    window of consecutive differences, from running sums in O(n)."""
+    n_windows = len(values) - window
+    if HAS_NUMPY if use_numpy is None else use_numpy:
+        v = as_float_array(values)
+        d = np.diff(v)
+        s1 = np.concatenate(([0.0], np.cumsum(d)))
+        s2 = np.concatenate(([0.0], np.cumsum(d * d)))
+        sa = np.concatenate(([0.0], np.cumsum(np.abs(v[1:]))))
+        sum_d = s1[window:] - s1[:-window]
+        var = np.maximum((s2[window:] - s2[:-window] - sum_d * sum_d / window) / (window - 1), 0.0)
+        mean_abs = (sa[window:] - sa[:-window]) / window
+        scores = np.sqrt(var) / np.where(mean_abs == 0, 1e-10, mean_abs)
+        peak = int(np.argmax(scores))
+        max_score, final_score = float(scores[peak]), float(scores[-1])
+        high = int(np.count_nonzero(scores > HIGH_OSCILLATION))
+    else:
+        sum_d = sum_d2 = sum_abs = 0.0
+        peak, max_score, score, high = 0, -1.0, 0.0, 0
+        for i in range(1, len(values)):
+            d = values[i] - values[i-1]
+            sum_d += d
+            sum_d2 += d * d
+            sum_abs += abs(values[i])
+            if i > window:
+                old = values[i-window] - values[i-window-1]
+                sum_d -= old
+                sum_d2 -= old * old
+                sum_abs -= abs(values[i-window])
+            if i >= window:
+                var = max((sum_d2 - sum_d * sum_d / window) / (window - 1), 0.0)
+                mean_abs = sum_abs / window or 1e-10
+                score = math.sqrt(var) / mean_abs
+                if score > max_score:
+                    peak, max_score = i - window, score
+                if score > HIGH_OSCILLATION:
+                    high += 1
+        final_score = score
+
+    return {
+        "window": window,
+        "max_score": round(max_score, 4),
+        "max_at_pct": round(100 * (peak + window / 2) / len(values), 1),
+        "final_score": round(final_score, 4),
+        "high_fraction": round(high / n_windows, 4)
+    }
+
+
+def _best_split(prefix: List[float], prefix_sq: List[float], start: int, end: int,
+                min_size: int, use_numpy: bool) -> Tuple[float, int]:
+    """Best mean-shift split of z[start:end] given prefix sums of z and z**2.
+
+    Returns (F-like score, split index); score is between-segment sum of
+    squares over the pooled within-segment variance.
+    """
+    n = end - start
+    if n < 2 * min_size or n < 3:
+        return 0.0, -1
+    total = prefix[end] - prefix[start]
+    ss = prefix_sq[end] - prefix_sq[start] - total * total / n
+
+    if use_numpy:
+        k = np.arange(min_size, n - min_size + 1)
+        left = prefix[start + k] - prefix[start]
+        gain = (left - total * k / n) ** 2 * n / (k * (n - k))
+        best = int(np.argmax(gain))
+        gain_best, split = float(gain[best]), start + int(k[best])
+    else:
+        gain_best, split = -1.0, -1
+        for k in range(min_size, n - min_size + 1):
+            left = prefix[start + k] - prefix[start]
+            gain = (left - total * k / n) ** 2 * n / (k * (n - k))
+            if gain > gain_best:
+                gain_best, split = gain, start + k
+
+    within = (ss - gain_best) / (n - 2)
+    if within <= 0:
+        return (math.inf if gain_best > 0 else 0.0), split
+    return gain_best / within, split
+
+
+def detect_change_points(values: Any, use_numpy: Optional[bool] = None) -> List[Dict[str, Any]]:
+    """Points where the volatility (|first difference|) of a series shifts.
+
+    Binary segmentation on the mean of |diff|: the segment with the best
+    split is split while its score beats CHANGE_POINT_PENALTY * log(n).
+    """
+    use_numpy = HAS_NUMPY if use_numpy is None else use_numpy
+    if use_numpy:
+        z = np.abs(np.diff(as_float_array(values)))
+        prefix = np.concatenate(([0.0], np.cumsum(z)))
+        prefix_sq = np.concatenate(([0.0], np.cumsum(z * z)))
+    else:
+        z = [abs(values[i] - values[i-1]) for i in range(1, len(values))]
+        prefix, prefix_sq = [0.0], [0.0]
+        for x in z:
+            prefix.append(prefix[-1] + x)
+            prefix_sq.append(prefix_sq[-1] + x * x)
+
+    n = len(z)
+    if n < 4:
+        return []
+    min_size = max(int(n * MIN_SEGMENT_FRACTION), 2)
+    threshold = CHANGE_POINT_PENALTY * math.log(n)
+
+    candidates = {(0, n): _best_split(prefix, prefix_sq, 0, n, min_size, use_numpy)}
+    splits = []
+    while candidates and len(splits) < MAX_CHANGE_POINTS:
+        segment = max(candidates, key=lambda seg: candidates[seg][0])
+        score, split = candidates.pop(segment)
+        if score < threshold or split < 0:
+            break
+        start, end = segment
+        splits.append((split, start, end))
+        for part in ((start, split), (split, end)):
+            candidates[part] = _best_split(prefix, prefix_sq, part[0], part[1], min_size, use_numpy)
+
+    change_points = []
+    for split, start, end in sorted(splits):
+        before = (prefix[split] - prefix[start]) / (split - start)
+        after = (prefix[end] - prefix[split]) / (end - split)
+        change_points.append({
+            "index": split,
+            "at_pct": round(100 * split / len(values), 1),
+            "volatility_ratio": round(float(after / before), 2) if before else None
+        })
+    return change_points
+
+
+def calculate_windowed_oscillation(series: SeriesStats) -> Dict[str, Any]:
+    """Rolling oscillation and volatility change points of a series.
+
+    Only computed on the exact series (see SeriesStats.exact_values): on
+    bucket means the windows would smooth the differences away and the
+    indices would count buckets. Empty for longer series unless they were
+    parsed with keep_series.
+    """
+    values = series.exact_values()
+    if values is None:
+        return {}
+
+    window = max(int(len(values) * ROLLING_WINDOW_FRACTION), MIN_ROLLING_WINDOW)
+    if len(values) <= window + 1:
+        return {}
+
+    return {
+        "rolling": rolling_oscillation(values, window),
+        "change_points": detect_change_points(values)
+    }
+
+
+def calculate_oscillation(series: SeriesStats) -> Dict[str, Any]:
+    """Calculate oscillation score from a series of values.
+
+    Exact while the series is known value by value (see
+    SeriesStats.exact_values); beyond that the derivative spread comes from
+    the streaming Welford state and the trend from the bucket means, and the
+    result is marked "approximate".
+    """
+
+    if series.count < 3:
         return {
             "score": 0,
             "severity": "Insufficient data",
             "trend": "unknown"
         }
 
+    raw_values = series.exact_values()
+
     # Oscillation score = std of derivatives / mean of absolute values
     # Higher score = more oscillation
     try:
-        mean_abs = sum(abs(v) for v in raw_values) / len(raw_values)
+        if raw_values is not None:
+            mean_abs, std_deriv, first_half, second_half = oscillation_stats(raw_values)
+        else:
+            mean_abs = series.abs_total / series.count
+            std_deriv = series.diff_stdev()
+            first_half, second_half = series.half_means()
+
         if mean_abs == 0:
             mean_abs = 1e-10
-
-        std_deriv = statistics.stdev(derivatives) if len(derivatives) > 1 else 0
         oscillation_score = std_deriv / mean_abs
 
         # Determine severity
@@ -347,25 +1861,22 @@ def calculate_oscillation(values: List[Dict]) -> Dict[str, Any]:
             severity = "Low"
 
         # Determine trend
-        if len(raw_values) >= 2:
-            first_half = sum(raw_values[:len(raw_values)//2]) / (len(raw_values)//2)
-            second_half = sum(raw_values[len(raw_values)//2:]) / (len(raw_values) - len(raw_values)//2)
-
-            if second_half < first_half * 0.9:
-                trend = "decreasing"
-            elif second_half > first_half * 1.1:
-                trend = "increasing"
-            else:
-                trend = "stable"
+        if second_half < first_half * 0.9:
+            trend = "decreasing"
+        elif second_half > first_half * 1.1:
+            trend = "increasing"
         else:
-            trend = "unknown"
+            trend = "stable"
 
-        return {
+        result = {
             "score": round(oscillation_score, 4),
             "severity": severity,
             "trend": trend,
             "std_derivative": round(std_deriv, 6)
         }
+        if raw_values is None:
+            result["approximate"] = True
+        return result
 
     except Exception as e:
         return {
@@ -375,25 +1886,37 @@ def calculate_oscillation(values: List[Dict]) -> Dict[str, Any]:
         }
 
 
-def calculate_convergence(values: List[Dict]) -> Dict[str, Any]:
-    """Analyze convergence characteristics."""
+def calculate_convergence(series: SeriesStats) -> Dict[str, Any]:
+    """Analyze convergence characteristics.
 
-    if len(values) < 5:
+    Exact while the series is known value by value; beyond that the tail
+    statistics and the 90% point are estimated from the buckets and the
+    result is marked "approximate".
+    """
+
+    if series.count < 5:
         return {
             "converged": "unknown",
             "speed": "unknown",
             "final_value": None
         }
 
-    raw_values = [v["value"] for v in values]
+    raw_values = series.exact_values()
+    initial = series.first["value"]
+    final = series.last_value
 
     # Check if converged (last 10% of values have low variance)
-    tail_size = max(len(raw_values) // 10, 3)
-    tail = raw_values[-tail_size:]
+    tail_size = max(series.count // 10, 3)
+
+    # Convergence speed target: 90% of the improvement (for loss, lower is better)
+    target_90 = initial - (0.9 * (initial - final))
 
     try:
-        tail_std = statistics.stdev(tail) if len(tail) > 1 else 0
-        tail_mean = sum(tail) / len(tail)
+        if raw_values is not None:
+            tail_mean, tail_std, speed_epoch = convergence_stats(raw_values, tail_size, target_90)
+        else:
+            tail_mean, tail_std = series.tail_stats(tail_size)
+            speed_epoch = series.first_index_at_or_below(target_90)
 
         # Coefficient of variation
         if tail_mean != 0:
@@ -405,36 +1928,24 @@ def calculate_convergence(values: List[Dict]) -> Dict[str, Any]:
         converged = cv < 0.05
 
         # Convergence speed (epochs to reach 90% of improvement)
-        if len(raw_values) >= 2:
-            initial = raw_values[0]
-            final = raw_values[-1]
-            improvement = initial - final  # For loss, lower is better
-
-            target_90 = initial - (0.9 * improvement)
-
-            speed_epoch = None
-            for i, v in enumerate(raw_values):
-                if v <= target_90:
-                    speed_epoch = i
-                    break
-
-            if speed_epoch is not None:
-                speed = "fast" if speed_epoch < len(raw_values) * 0.3 else "slow"
-            else:
-                speed = "did not reach 90%"
+        if speed_epoch is not None:
+            speed = "fast" if speed_epoch < series.count * 0.3 else "slow"
         else:
-            speed = "unknown"
+            speed = "did not reach 90%"
 
-        return {
+        result = {
             "converged": converged,
             "speed": speed,
-            "final_value": round(raw_values[-1], 6),
-            "initial_value": round(raw_values[0], 6),
+            "final_value": round(final, 6),
+            "initial_value": round(initial, 6),
             "improvement_pct": round(
-                100 * (raw_values[0] - raw_values[-1]) / max(abs(raw_values[0]), 1e-10), 2
+                100 * (initial - final) / max(abs(initial), 1e-10), 2
             ),
             "tail_cv": round(cv, 4)
         }
+        if raw_values is None:
+            result["approximate"] = True
+        return result
 
     except Exception as e:
         return {
@@ -448,9 +1959,9 @@ def identify_struggle_points(data: Dict) -> List[Dict]:
 
     struggles = []
 
-    # Check for gradient issues
-    for norm in data["gradient_norms"]:
-        if norm["value"] > 1e5:
+    # Check for gradient issues (the first MAX_FLAGGED_ENTRIES crossings)
+    for flag, norm in data["gradient_norms"].flagged:
+        if flag == "gradient_explosion":
             struggles.append({
                 "type": "gradient_explosion",
                 "epoch": norm["epoch"],
@@ -459,7 +1970,7 @@ def identify_struggle_points(data: Dict) -> List[Dict]:
                 "severity": "critical",
                 "physical_meaning": "Scale mismatch or wrong functional form (additive vs multiplicative)"
             })
-        elif norm["value"] < 1e-7:
+        else:
             struggles.append({
                 "type": "gradient_vanishing",
                 "epoch": norm["epoch"],
@@ -470,19 +1981,29 @@ def identify_struggle_points(data: Dict) -> List[Dict]:
             })
 
     # Check for R-hat divergence
-    for rhat in data["rhat_values"]:
-        if rhat["value"] > 1.1:
+    for _, rhat in data["rhat_values"].flagged:
+        struggles.append({
+            "type": "rhat_divergence",
+            "epoch": rhat["epoch"],
+            "line": rhat["line"],
+            "value": rhat["value"],
+            "severity": "critical" if rhat["value"] > 1.3 else "warning",
+            "physical_meaning": "Hidden subgroups or violated pooling assumption"
+        })
+
+    # Crossings beyond the listed ones: one count per type
+    for key in SERIES_FLAGS:
+        series = data[key]
+        for flag, unlisted in series.unlisted_flags().items():
             struggles.append({
-                "type": "rhat_divergence",
-                "epoch": rhat["epoch"],
-                "line": rhat["line"],
-                "value": rhat["value"],
-                "severity": "critical" if rhat["value"] > 1.3 else "warning",
-                "physical_meaning": "Hidden subgroups or violated pooling assumption"
+                "type": flag,
+                "count": series.flag_counts[flag],
+                "unlisted": unlisted,
+                "severity": "warning" if flag == "rhat_divergence" and series.max_value <= 1.3 else "critical"
             })
 
     # Check loss oscillation
-    if data["loss_values"]:
+    if data["loss_values"].count:
         osc = calculate_oscillation(data["loss_values"])
         if osc["severity"] in ["High", "Very High"]:
             struggles.append({
@@ -494,19 +2015,22 @@ def identify_struggle_points(data: Dict) -> List[Dict]:
 
     # Add critical events
     for event_type, events in data["critical_events"].items():
-        if events:
+        if events.count:
             struggles.append({
                 "type": event_type,
-                "count": len(events),
-                "first_occurrence": events[0],
+                "count": events.count,
+                "first_occurrence": events.first,
                 "severity": "critical"
             })
 
     return struggles
 
 
-def generate_summary(data: Dict, log_path: str) -> Dict[str, Any]:
-    """Generate the final summary JSON for @metacognition_agent."""
+def generate_summary(data: Dict, log_path: str, profile: Optional[str] = None) -> Dict[str, Any]:
+    """Generate the final summary JSON for @metacognition_agent.
+
+    profile, if given, is recorded as meta.format.
+    """
 
     # Basic info
     summary = {
@@ -531,71 +2055,85 @@ def generate_summary(data: Dict, log_path: str) -> Dict[str, Any]:
         "recommendations": []
     }
 
+    if profile:
+        summary["meta"]["format"] = profile
+
     # Loss analysis
-    if data["loss_values"]:
-        values = [v["value"] for v in data["loss_values"]]
+    loss = data["loss_values"]
+    if loss.count:
+        initial, final = loss.first["value"], loss.last_value
         summary["loss"] = {
-            "initial": round(values[0], 6),
-            "final": round(values[-1], 6),
-            "min": round(min(values), 6),
-            "max": round(max(values), 6),
-            "improvement_pct": round(100 * (values[0] - values[-1]) / max(abs(values[0]), 1e-10), 2)
+            "initial": round(initial, 6),
+            "final": round(final, 6),
+            "min": round(loss.min_value, 6),
+            "max": round(loss.max_value, 6),
+            "improvement_pct": round(100 * (initial - final) / max(abs(initial), 1e-10), 2)
         }
-        summary["oscillation"]["loss"] = calculate_oscillation(data["loss_values"])
-        summary["convergence"]["loss"] = calculate_convergence(data["loss_values"])
+        summary["oscillation"]["loss"] = calculate_oscillation(loss)
+        windows = calculate_windowed_oscillation(loss)
+        if windows:
+            summary["oscillation"]["loss_windows"] = windows
+        summary["convergence"]["loss"] = calculate_convergence(loss)
 
     # Validation loss
-    if data["val_loss_values"]:
-        values = [v["value"] for v in data["val_loss_values"]]
+    val_loss = data["val_loss_values"]
+    if val_loss.count:
         summary["validation"] = {
-            "final_val_loss": round(values[-1], 6),
-            "best_val_loss": round(min(values), 6),
-            "best_epoch": data["val_loss_values"][values.index(min(values))]["epoch"]
+            "final_val_loss": round(val_loss.last_value, 6),
+            "best_val_loss": round(val_loss.min_value, 6),
+            "best_epoch": val_loss.min_entry["epoch"]
         }
 
         # Check for overfitting
-        if data["loss_values"]:
-            train_final = data["loss_values"][-1]["value"]
-            val_final = values[-1]
+        if loss.count:
+            train_final = loss.last_value
+            val_final = val_loss.last_value
             if val_final > train_final * 1.5:
                 summary["events"]["overfitting_suspected"] = True
 
     # Gradient analysis
-    if data["gradient_norms"]:
-        norms = [v["value"] for v in data["gradient_norms"]]
+    norms = data["gradient_norms"]
+    if norms.count:
         summary["gradients"] = {
-            "max_norm": max(norms),
-            "mean_norm": round(sum(norms) / len(norms), 6),
-            "explosion_detected": any(n > 1e5 for n in norms),
-            "vanishing_detected": any(n < 1e-7 for n in norms)
+            "max_norm": norms.max_value,
+            "mean_norm": round(norms.total / norms.count, 6),
+            "explosion_detected": norms.max_value > 1e5,
+            "vanishing_detected": norms.min_value < 1e-7
         }
 
     # MCMC analysis
-    if data["rhat_values"]:
-        rhats = [v["value"] for v in data["rhat_values"]]
+    rhats = data["rhat_values"]
+    if rhats.count:
         summary["mcmc"] = {
-            "max_rhat": round(max(rhats), 4),
-            "mean_rhat": round(sum(rhats) / len(rhats), 4),
-            "converged": all(r < 1.05 for r in rhats[-5:]) if len(rhats) >= 5 else "unknown"
+            "max_rhat": round(rhats.max_value, 4),
+            "mean_rhat": round(rhats.total / rhats.count, 4),
+            "converged": all(r < 1.05 for r in rhats.recent) if rhats.count >= 5 else "unknown"
         }
 
     # Event counts
-    summary["events"]["warning_count"] = len(data["warnings"])
-    summary["events"]["error_count"] = len(data["errors"])
+    summary["events"]["warning_count"] = data["warnings"].count
+    summary["events"]["error_count"] = data["errors"].count
     summary["events"]["top_warnings"] = [
-        w["message"][:100] for w in data["warnings"][:5]
+        w["message"][:100] for w in data["warnings"].first
     ]
     summary["events"]["top_errors"] = [
-        e["message"][:100] for e in data["errors"][:5]
+        e["message"][:100] for e in data["errors"].first
+    ]
+    summary["events"]["frequent_warnings"] = [
+        {"message": shape, "count": n} for shape, n in data["warnings"].most_common(3)
+    ]
+    summary["events"]["frequent_errors"] = [
+        {"message": shape, "count": n} for shape, n in data["errors"].most_common(3)
     ]
 
     # Critical events
     for event_type, events in data["critical_events"].items():
-        if events:
+        if events.count:
             summary["events"][event_type] = {
-                "count": len(events),
-                "first_epoch": events[0]["epoch"],
-                "first_line": events[0]["line"]
+                "count": events.count,
+                "first_epoch": events.first["epoch"],
+                "first_line": events.first["line"],
+                "sample_lines": events.sample_lines()
             }
 
     # Struggles
@@ -638,11 +2176,919 @@ def generate_summary(data: Dict, log_path: str) -> Dict[str, Any]:
     return summary
 
 
+def write_summary(summary: Dict[str, Any], output_path: str) -> int:
+    """Write the summary JSON atomically (readers never see a partial file).
+
+    Returns the size in bytes.
+    """
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+    os.replace(tmp_path, output_path)
+    return os.path.getsize(output_path)
+
+
+# ============================================================================
+# FOLLOW MODE
+# ============================================================================
+
+# Bump when the pickled state layout changes; older state files are ignored
+FOLLOW_STATE_VERSION = 4
+
+# Largest read per step, so a burst of new output doesn't spike memory
+FOLLOW_READ_BYTES = 64 * 1024 * 1024
+
+
+def new_follow_state(log_path: str, keep_series: bool = False,
+                     profile: str = "generic") -> Dict[str, Any]:
+    """Parse state of a growing log: where to resume and what was seen so far.
+
+    "format" is the profile in use; with profile "auto" it stays None (and
+    the generic patterns are used) until follow_update() can detect it.
+    """
+    return {
+        "version": FOLLOW_STATE_VERSION,
+        "log_path": os.path.abspath(log_path),
+        "inode": None,
+        "offset": 0,
+        "epoch": 0,
+        "profile": profile,
+        "format": None if profile == "auto" else profile,
+        "data": new_log_data(keep_series)
+    }
+
+
+def load_follow_state(state_path: str, log_path: str, keep_series: bool = False,
+                      profile: str = "generic") -> Dict[str, Any]:
+    """Resume from state_path if it was saved for this log, else start fresh."""
+    try:
+        with open(state_path, 'rb') as f:
+            state = pickle.load(f)
+        if (state.get("version") == FOLLOW_STATE_VERSION
+                and state.get("log_path") == os.path.abspath(log_path)
+                and state.get("profile") == profile
+                and (state["data"]["loss_values"].series is not None) == keep_series):
+            return state
+    except (OSError, EOFError, AttributeError, pickle.UnpicklingError):
+        pass
+    return new_follow_state(log_path, keep_series, profile)
+
+
+def save_follow_state(state: Dict[str, Any], state_path: str) -> None:
+    """Write the state atomically; a unique temporary file keeps concurrent
+    writers (batch workers sharing the parse cache) from clobbering it."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(state_path)),
+                                    suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, state_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def follow_format(f: BinaryIO, final: bool = False) -> Optional[str]:
+    """Detected profile of a followed log, or None while it is too short to
+    tell: detection is retried until a profile matches or the log holds
+    PROFILE_DETECT_BYTES (as detect_profile() samples it)."""
+    f.seek(0)
+    head = f.read(PROFILE_DETECT_BYTES)
+    settled = final or len(head) >= PROFILE_DETECT_BYTES
+    if not settled:
+        head = head[:head.rfind(b'\n') + 1]
+    detected = detect_profile_text(head.decode('utf-8', errors='ignore'))
+    return detected if settled or detected != "generic" else None
+
+
+def follow_update(state: Dict[str, Any], final: bool = False) -> int:
+    """Parse the bytes appended to the log since the last update.
+
+    Only complete lines are consumed; a trailing partial line waits for the
+    next update unless final is set. A log that shrank or was replaced
+    (rotation) is parsed again from the start, and so is a log parsed with
+    the generic patterns while its format was undecided, once a profile
+    matches. Returns the bytes consumed.
+    """
+    log_path = state["log_path"]
+    try:
+        stat = os.stat(log_path)
+    except FileNotFoundError:
+        return 0
+
+    if stat.st_ino != state["inode"] or stat.st_size < state["offset"]:
+        if state["inode"] is not None:
+            print(f"  Log was truncated or replaced, starting over: {log_path}")
+        keep_series = state["data"]["loss_values"].series is not None
+        state.update(new_follow_state(log_path, keep_series, state["profile"]),
+                     inode=stat.st_ino)
+
+    consumed = 0
+    with open(log_path, 'rb') as f:
+        if state["format"] is None:
+            detected = follow_format(f, final)
+            if detected not in (None, "generic") and state["offset"]:
+                keep_series = state["data"]["loss_values"].series is not None
+                state.update(offset=0, epoch=0, data=new_log_data(keep_series))
+            state["format"] = detected
+
+        while True:
+            f.seek(state["offset"])
+            raw = f.read(FOLLOW_READ_BYTES)
+            if not raw:
+                break
+
+            at_eof = len(raw) < FOLLOW_READ_BYTES
+            end = raw.rfind(b'\n') + 1
+            if final and at_eof:
+                end = len(raw)
+            elif not end:
+                if at_eof:
+                    break  # Partial line; the writer hasn't finished it yet
+                end = len(raw)  # A single line longer than the read size
+
+            state["epoch"] = parse_buffer(raw, 0, end, state["data"], state["epoch"],
+                                          profile=state["format"] or "generic")
+            state["offset"] += end
+            consumed += end
+
+    return consumed
+
+
+def follow(log_path: str, output_path: str, interval: float = 60.0,
+           keep_series: bool = False, state_path: Optional[str] = None,
+           profile: str = "auto") -> None:
+    """Tail a growing log and rewrite the summary every interval seconds.
+
+    The parse state is saved next to the summary, so a restarted follower
+    resumes where it stopped; each refresh parses only the new bytes.
+    Stops on Ctrl-C or SIGTERM after writing a final summary that includes
+    any unterminated last line.
+    """
+    state_path = state_path or f"{output_path}.state"
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    state = load_follow_state(state_path, log_path, keep_series, profile)
+
+    print(f"\nLog Analyzer for Phase 5.8 (follow mode)")
+    print(f"=" * 40)
+    print(f"Source: {log_path}")
+    print(f"Output: {output_path}")
+    print(f"State: {state_path} (resuming at byte {state['offset']:,})")
+    print(f"Format: {state['format'] or 'auto-detected from the first 64KB'}")
+    print(f"Refresh: every {interval:g}s, Ctrl-C to stop\n")
+
+    written = False
+    try:
+        while True:
+            consumed = follow_update(state)
+            if consumed or (not written and state["inode"] is not None):
+                summary = generate_summary(state["data"], log_path, state["format"])
+                size = write_summary(summary, output_path)
+                save_follow_state(state, state_path)
+                written = True
+                print(f"  [{datetime.now():%H:%M:%S}] +{consumed:,} bytes, "
+                      f"{state['data']['raw_lines']:,} lines, "
+                      f"{len(summary['struggles'])} struggles -> {size:,} bytes")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        final_state = copy.deepcopy(state)
+        follow_update(final_state, final=True)
+        if final_state["inode"] is not None:
+            write_summary(generate_summary(final_state["data"], log_path, final_state["format"]),
+                          output_path)
+        print(f"\n  Stopped at byte {final_state['offset']:,}. Done!")
+
+
+# ============================================================================
+# PARSE CACHE
+# ============================================================================
+
+# Cache directory created next to the logs (output/implementation/logs/.cache/)
+PARSE_CACHE_DIRNAME = ".cache"
+
+# Entries beyond this total size are evicted, least recently used first
+PARSE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Bytes hashed before the parsed offset, to check that a grown log still
+# holds what was parsed
+CACHE_PROBE_BYTES = 64 * 1024
+
+# Longest first line that goes into the cache key
+CACHE_HEAD_BYTES = 4096
+
+
+def default_cache_dir(log_path: str) -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(log_path)), PARSE_CACHE_DIRNAME)
+
+
+def probe_hash(f: BinaryIO, start: int, end: int) -> str:
+    f.seek(start)
+    return hashlib.sha1(f.read(end - start)).hexdigest()
+
+
+def cache_entry_path(log_path: str, cache_dir: str, profile: str = "generic",
+                     keep_series: bool = False) -> str:
+    """Entry file for a log. The key is the log's file identity (device and
+    inode) and its first line, not its name or size: a segment renamed by
+    rotation and a log that grows keep their entry, and a new file that
+    reuses an inode gets its own. load_cache_entry() checks the rest."""
+    with open(log_path, 'rb') as f:
+        head = f.readline(CACHE_HEAD_BYTES)
+        stat = os.fstat(f.fileno())
+    key = hashlib.sha1(head + f"\0{stat.st_dev}\0{stat.st_ino}\0{profile}\0{keep_series}".encode())
+    return os.path.join(cache_dir, f"{key.hexdigest()[:32]}.pkl")
+
+
+def load_cache_entry(entry_path: str, log_path: str) -> Optional[Dict[str, Any]]:
+    """The cached parse state for log_path, or None if there is none or the
+    log no longer starts with the bytes it was parsed from.
+
+    An entry is a follow state (see new_follow_state) plus the identity of
+    the log when it was saved. Plain logs that only grew are reusable;
+    compressed logs only while size and mtime are unchanged.
+    """
+    try:
+        with open(entry_path, 'rb') as f:
+            entry = pickle.load(f)
+    except (OSError, EOFError, AttributeError, pickle.UnpicklingError):
+        return None
+    if entry.get("version") != FOLLOW_STATE_VERSION:
+        return None
+
+    stat = os.stat(log_path)
+    if stat.st_size < entry["offset"]:
+        return None
+    if entry["compressed"] and (stat.st_size, stat.st_mtime_ns) != (entry["size"], entry["mtime_ns"]):
+        return None
+    with open(log_path, 'rb') as f:
+        offset = entry["offset"]
+        if probe_hash(f, max(offset - CACHE_PROBE_BYTES, 0), offset) != entry["tail_hash"]:
+            return None
+    return entry
+
+
+def save_cache_entry(entry: Dict[str, Any], entry_path: str, log_path: str,
+                     max_bytes: int = PARSE_CACHE_MAX_BYTES) -> None:
+    """Record the log's identity in the entry, write it and evict old entries."""
+    stat = os.stat(log_path)
+    entry["size"] = stat.st_size
+    entry["mtime_ns"] = stat.st_mtime_ns
+    with open(log_path, 'rb') as f:
+        entry["tail_hash"] = probe_hash(f, max(entry["offset"] - CACHE_PROBE_BYTES, 0), entry["offset"])
+    save_follow_state(entry, entry_path)
+    evict_cache(os.path.dirname(entry_path), max_bytes, keep=entry_path)
+
+
+def evict_cache(cache_dir: str, max_bytes: int = PARSE_CACHE_MAX_BYTES,
+                keep: Optional[str] = None) -> int:
+    """Delete least recently used entries until the cache fits max_bytes.
+    Returns the number of entries removed."""
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith('.pkl'):
+            path = os.path.join(cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue  # Evicted by a concurrent batch worker
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+        total -= size
+    return removed
+
+
+def last_line_end(log_path: str, start: int, end: int) -> int:
+    """Offset just past the last newline in bytes start:end (start if none)."""
+    with open(log_path, 'rb') as f:
+        pos = end
+        while pos > start:
+            block_start = max(pos - CACHE_PROBE_BYTES, start)
+            f.seek(block_start)
+            newline = f.read(pos - block_start).rfind(b'\n')
+            if newline >= 0:
+                return block_start + newline + 1
+            pos = block_start
+    return start
+
+
+def extend_cache_entry(entry: Dict[str, Any], workers: int = 1, use_mmap: bool = False) -> int:
+    """Parse what the log gained since the entry was saved into the entry.
+
+    Plain logs: the complete lines after entry["offset"], in parallel chunks
+    when there is enough new data (see parse_log_file_parallel). Compressed logs are parsed whole (the
+    entry is empty then). Returns the bytes consumed.
+    """
+    log_path = entry["log_path"]
+    profile = entry["format"]
+
+    if entry["compressed"]:
+        if entry["offset"]:
+            return 0
+        entry["epoch"] = parse_into(log_path, entry["data"], entry["epoch"], use_mmap, profile)
+        entry["offset"] = os.path.getsize(log_path)
+        return entry["offset"]
+
+    start = entry["offset"]
+    end = last_line_end(log_path, start, os.path.getsize(log_path))
+    n_chunks = min(workers, (end - start) // MIN_CHUNK_BYTES)
+    if n_chunks > 1:
+        ranges = split_byte_ranges(log_path, n_chunks, start, end)
+        keep_series = entry["data"]["loss_values"].series is not None
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+            chunks = parse_chunks(pool, log_path, ranges, entry["data"]["raw_lines"],
+                                  use_mmap, keep_series, profile)
+        entry["data"] = merge_chunks([(entry["data"], entry["epoch"])] + chunks,
+                                     keep_series, carried_epoch=None)
+        for _, last_epoch in chunks:
+            if last_epoch is not None:
+                entry["epoch"] = last_epoch
+    else:
+        entry["epoch"] = parse_range(log_path, start, end, entry["data"], entry["epoch"],
+                                     use_mmap, profile)
+
+    entry["offset"] = end
+    return end - start
+
+
+def parse_cached(log_path: str, cache_dir: str, workers: int = 1, use_mmap: bool = False,
+                 keep_series: bool = False, profile: str = "generic",
+                 max_bytes: int = PARSE_CACHE_MAX_BYTES) -> Tuple[Tuple[Dict[str, Any], Optional[int]], str]:
+    """Parse one log segment through the cache in cache_dir.
+
+    Returns the (data, last_epoch) chunk for merge_chunks() and how the
+    cache was used: "hit" (nothing to parse), "extended" (only the new tail
+    was parsed) or "miss". A trailing unterminated line is parsed into the
+    result but not into the cache, since the writer may still extend it.
+    Entries hold the bounded accumulators (and the series with keep_series).
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    entry_path = cache_entry_path(log_path, cache_dir, profile, keep_series)
+    entry = load_cache_entry(entry_path, log_path)
+
+    status = "hit"
+    if entry is None:
+        status = "miss"
+        entry = new_follow_state(log_path, keep_series, profile)
+        entry.update(epoch=None, compressed=bool(detect_compression(log_path)))
+    entry.update(log_path=os.path.abspath(log_path), inode=os.stat(log_path).st_ino)
+
+    consumed = extend_cache_entry(entry, workers, use_mmap)
+    if consumed or status == "miss":
+        status = "extended" if status == "hit" else status
+        save_cache_entry(entry, entry_path, log_path, max_bytes)
+    else:
+        try:
+            os.utime(entry_path)  # Most recently used
+        except OSError:
+            pass  # Evicted by a concurrent batch worker
+
+    result = entry
+    size = os.path.getsize(log_path)
+    if not entry["compressed"] and entry["offset"] < size:
+        result = copy.deepcopy(entry)
+        result["epoch"] = parse_range(log_path, entry["offset"], size, result["data"],
+                                      result["epoch"], use_mmap, entry["format"])
+    return (result["data"], result["epoch"]), status
+
+
+def parse_log_segments_cached(paths: List[str], cache_dir: Optional[str] = None,
+                              workers: int = 1, use_mmap: bool = False,
+                              keep_series: bool = False, profile: str = "generic",
+                              max_bytes: int = PARSE_CACHE_MAX_BYTES) -> Tuple[Dict[str, Any], List[str]]:
+    """parse_log_segments() through the parse cache (default: .cache next
+    to the logs). Returns the parse result and each segment's cache status."""
+    cache_dir = cache_dir or default_cache_dir(paths[-1])
+    chunks, statuses = [], []
+    for path in paths:
+        chunk, status = parse_cached(path, cache_dir, workers, use_mmap, keep_series,
+                                     profile, max_bytes)
+        chunks.append(chunk)
+        statuses.append(status)
+    return merge_chunks(chunks, keep_series), statuses
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+# Representative line shapes from PyMC, Keras/PyTorch and sklearn training logs
+SYNTHETIC_LINE_TEMPLATES = [
+    "Epoch {epoch}/500 - step {step} - loss: {loss:.5f} - val_loss: {val:.5f} - acc: {acc:.4f}",
+    "epoch {epoch} | train_loss={loss:.6f} | grad_norm={grad:.3e} | lr=1e-4",
+    "INFO {step}: batch processed in 0.{step}s, samples/sec=1532.4",
+    "Sampling 4 chains, 0 divergences: {acc:.0%}|###      | {step}/8000 [00:12<00:40]",
+    "Sampling 4 chains for 1_000 tune and 2_000 draw iterations took 32 seconds.",
+    "    beta[{step}]   mean=0.412  sd=0.051  r_hat={rhat:.3f}  ess_bulk=2031",
+    "UserWarning: The number of effective samples is smaller than 10% for some parameters.",
+    "DEBUG checkpoint saved to output/implementation/models/model_{epoch}.pkl",
+]
+
+SYNTHETIC_RARE_LINES = [
+    "RuntimeWarning: overflow encountered in exp",
+    "loss: nan - gradient explosion detected at step {step}",
+    "ERROR: CUDA out of memory. Tried to allocate 2.00 GiB",
+    "ConvergenceWarning: lbfgs failed to converge (status=1)",
+]
+
+
+def generate_synthetic_log(log_path: str, n_lines: int, seed: int = 42) -> None:
+    """Write a synthetic training log with realistic line mix for benchmarking."""
+    rng = random.Random(seed)
+    epoch = 1
+    loss = 2.5
+
+    with open(log_path, 'w', encoding='utf-8') as f:
+        for step in range(n_lines):
+            if step % 200 == 0:
+                epoch += 1
+                loss *= 0.995
+            if rng.random() < 0.002:
+                template = rng.choice(SYNTHETIC_RARE_LINES)
+            else:
+                template = rng.choice(SYNTHETIC_LINE_TEMPLATES)
+            f.write(template.format(
+                epoch=epoch,
+                step=step,
+                loss=loss * (1 + 0.05 * rng.random()),
+                val=loss * 1.1,
+                acc=min(0.99, 1 - loss / 3),
+                grad=10 ** rng.uniform(-2, 2),
+                rhat=1 + rng.random() * 0.15
+            ) + "\n")
+
+
+def comparable_summary(data: Dict, log_path: str) -> str:
+    """Summary JSON without the generation timestamp, for equality checks."""
+    summary = generate_summary(data, log_path)
+    summary["meta"].pop("generated", None)
+    return json.dumps(summary, sort_keys=False)
+
+
+def run_benchmark(log_path: Optional[str] = None, n_lines: int = 200000,
+                  workers: int = 1) -> Dict[str, Any]:
+    """Compare parser throughput (lines/sec) and check that summaries match."""
+
+    print(f"\nLog Analyzer Benchmark")
+    print(f"=" * 40)
+
+    tmp_dir = None
+    if log_path is None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        log_path = os.path.join(tmp_dir.name, "synthetic_training.log")
+        generate_synthetic_log(log_path, n_lines)
+        print(f"Source: synthetic log ({n_lines:,} lines)")
+    else:
+        print(f"Source: {log_path}")
+
+    parsers = [
+        ("reference", parse_log_file_reference),
+        ("scanner", parse_log_file),
+        ("mmap", lambda path: parse_log_file(path, use_mmap=True)),
+    ]
+    if workers > 1:
+        parsers.append((
+            f"parallel x{workers}",
+            lambda path: parse_log_file_parallel(path, workers, min_chunk_bytes=1)
+        ))
+
+    results = {}
+    baseline = None
+
+    try:
+        for name, parser in parsers:
+            start = time.perf_counter()
+            data = parser(log_path)
+            elapsed = time.perf_counter() - start
+
+            if parser is parse_log_file_reference:
+                data = accumulate_entries(data)
+            summary = comparable_summary(data, log_path)
+            if baseline is None:
+                baseline = summary
+
+            results[name] = {
+                "seconds": round(elapsed, 3),
+                "lines_per_sec": round(data["raw_lines"] / max(elapsed, 1e-9)),
+                "identical": summary == baseline
+            }
+    finally:
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+
+    reference_rate = results["reference"]["lines_per_sec"]
+    print(f"\n  {'Parser':<14} {'Seconds':>9} {'Lines/sec':>12} {'Speedup':>8}  Identical")
+    for name, r in results.items():
+        speedup = r["lines_per_sec"] / max(reference_rate, 1)
+        print(f"  {name:<14} {r['seconds']:>9.3f} {r['lines_per_sec']:>12,} {speedup:>7.2f}x  {r['identical']}")
+
+    return results
+
+
+# Per-profile sample lines: (template, {series key: value field}, events the
+# line should raise). Unlisted series must stay empty; the loose generic
+# patterns misread several of these (val_loss as loss, weight "Norm:" as a
+# gradient norm, "0 divergences" and "ess_bulk=2031" as divergences).
+PROFILE_SAMPLE_LINES = {
+    "keras": [
+        ("Epoch {epoch}/100", {}, ()),
+        ("{step}/500 [==============================] - 3s 6ms/step - loss: {loss} - accuracy: {acc}"
+         " - val_loss: {val} - val_accuracy: {vacc}",
+         {"loss_values": "loss", "accuracy_values": "acc", "val_loss_values": "val"}, ()),
+        ("{step}/500 [=====>........................] - ETA: 12s - loss: {loss} - accuracy: {acc}",
+         {"loss_values": "loss", "accuracy_values": "acc"}, ()),
+        ("Epoch {epoch}: 100%|##########| 50/50 [00:02<00:00, 21.3it/s, v_num=0, "
+         "train_loss_step={loss}, val_loss={val}, val_acc={vacc}]",
+         {"loss_values": "loss", "val_loss_values": "val"}, ()),
+        ("Epoch {epoch}: val_accuracy improved from {vacc} to {acc}, saving model to model.keras", {}, ()),
+        ("Restoring model weights from the end of the best epoch: {epoch}.", {}, ()),
+        (" layer_normalization (LayerNormalization)   (None, 128)   256", {}, ()),
+    ],
+    "pymc": [
+        ("Sampling 4 chains, 0 divergences: {pct}% |####      | {step}/12000 [00:12<00:40]", {}, ()),
+        ("Sampling 4 chains for 1_000 tune and 2_000 draw iterations (4_000 + 8_000 draws total)"
+         " took 31 seconds.", {}, ()),
+        ("    beta[{param}]   mean=0.412  sd=0.051  r_hat={rhat}  ess_bulk=2031",
+         {"rhat_values": "rhat"}, ()),
+        ("Finished [100%]: Average Loss = {loss}", {"loss_values": "loss"}, ()),
+        ("Auto-assigning NUTS sampler...", {}, ()),
+        ("NUTS: [alpha, beta, sigma]", {}, ()),
+        ("There were {k} divergences after tuning. Increase `target_accept` or reparameterize.",
+         {}, ("divergence",)),
+    ],
+    "sklearn": [
+        ("Iteration {it}, loss = {loss}", {"loss_values": "loss"}, ()),
+        ("-- Epoch {epoch}", {}, ()),
+        ("Norm: {grad}, NNZs: 20, Bias: 0.151234, T: {it}, Avg. loss: {loss}",
+         {"loss_values": "loss"}, ()),
+        ("Total training time: 0.01 seconds.", {}, ()),
+        ("[CV] END ...C=1.0, gamma=0.01, kernel=rbf;, score={acc} total time=   0.2s",
+         {"accuracy_values": "acc"}, ()),
+        ("Fitting 5 folds for each of 24 candidates, totalling 120 fits", {}, ()),
+        ("ConvergenceWarning: lbfgs failed to converge (status=1)", {}, ("divergence",)),
+    ],
+    "statsmodels": [
+        ("Optimization terminated successfully.", {}, ()),
+        ("         Current function value: {loss}", {"loss_values": "loss"}, ()),
+        ("         Iterations: {it}", {}, ()),
+        ("         Function evaluations: {it}", {}, ()),
+        ("         Gradient evaluations: {it}", {}, ()),
+        ("ConvergenceWarning: Maximum Likelihood optimization failed to converge. Check mle_retvals",
+         {}, ("divergence",)),
+        ("const          {acc}      0.123      4.567      0.000       0.321       0.876", {}, ()),
+        ("Dep. Variable:                      y   No. Observations:                 {it}", {}, ()),
+    ],
+}
+
+# Series and events scored by run_profile_benchmark()
+SCORED_SERIES = [key for _, key, _ in METRIC_SERIES]
+SCORED_EVENTS = ["divergence"]
+
+
+def generate_profile_log(log_path: str, profile: str, n_lines: int,
+                         seed: int = 42) -> Dict[str, List[float]]:
+    """Write a synthetic log in one profile's format.
+
+    Returns the values each series should receive (and a 1 per expected
+    event, keyed by event type).
+    """
+    rng = random.Random(seed)
+    templates = PROFILE_SAMPLE_LINES[profile]
+    expected = {key: [] for key in SCORED_SERIES + SCORED_EVENTS}
+    loss = 2.5
+
+    with open(log_path, 'w', encoding='utf-8') as f:
+        for step in range(n_lines):
+            loss *= 0.99999
+            fields = {
+                "epoch": step // 200 + 1,
+                "step": step % 500 + 1,
+                "it": step // 7 + 1,
+                "pct": step % 100,
+                "param": step % 8,
+                "k": rng.randint(1, 40),
+                "loss": f"{loss * (1 + 0.05 * rng.random()):.4f}",
+                "val": f"{loss * 1.1 + 1:.4f}",
+                "acc": f"{min(0.99, 1 - loss / 3):.4f}",
+                "vacc": f"{min(0.98, 0.9 - loss / 3):.4f}",
+                "grad": f"{10 ** rng.uniform(-2, 1):.4f}",
+                "rhat": f"{1 + rng.random() * 0.05:.3f}"
+            }
+            template, series, events = rng.choice(templates)
+            f.write(template.format(**fields) + "\n")
+            for key, field in series.items():
+                expected[key].append(float(fields[field]))
+            for event_type in events:
+                expected[event_type].append(1.0)
+
+    return expected
+
+
+def score_extraction(data: Dict[str, Any], expected: Dict[str, List[float]]) -> Tuple[float, float]:
+    """(precision, recall) of the extracted values against the expected ones.
+
+    Series are compared as multisets of values, events by count. data must
+    be parsed with keep_series.
+    """
+    correct = extracted = wanted = 0
+    for key in SCORED_SERIES:
+        got = defaultdict(int)
+        for value in data[key].series:
+            got[round(value, 6)] += 1
+        for value in expected[key]:
+            if got[round(value, 6)] > 0:
+                got[round(value, 6)] -= 1
+                correct += 1
+        extracted += len(data[key].series)
+        wanted += len(expected[key])
+    for event_type in SCORED_EVENTS:
+        count = data["critical_events"][event_type].count if event_type in data["critical_events"] else 0
+        correct += min(count, len(expected[event_type]))
+        extracted += count
+        wanted += len(expected[event_type])
+    return correct / max(extracted, 1), correct / max(wanted, 1)
+
+
+def run_profile_benchmark(n_lines: int = 200000, repeats: int = 3) -> Dict[str, Any]:
+    """For each format profile: detection, and throughput (best of repeats)
+    and accuracy of the profile against the generic patterns on a log in
+    that format."""
+
+    print(f"\nLog Analyzer Profile Benchmark")
+    print(f"=" * 40)
+    print(f"Source: synthetic logs ({n_lines:,} lines per profile)")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name in PROFILE_SAMPLE_LINES:
+            log_path = os.path.join(tmp_dir, f"{name}.log")
+            expected = generate_profile_log(log_path, name, n_lines)
+            detected = detect_profile(log_path)
+            for parser in ("generic", name):
+                elapsed = float('inf')
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    data = parse_log_file(log_path, keep_series=True, profile=parser)
+                    elapsed = min(elapsed, time.perf_counter() - start)
+                precision, recall = score_extraction(data, expected)
+                results[(name, parser)] = {
+                    "detected": detected,
+                    "seconds": round(elapsed, 3),
+                    "lines_per_sec": round(data["raw_lines"] / max(elapsed, 1e-9)),
+                    "precision": round(precision, 4),
+                    "recall": round(recall, 4)
+                }
+
+    print(f"\n  {'Log format':<12} {'Detected':<12} {'Parser':<12} {'Lines/sec':>12} "
+          f"{'Speedup':>8} {'Precision':>10} {'Recall':>8}")
+    for (name, parser), r in results.items():
+        speedup = r["lines_per_sec"] / max(results[(name, "generic")]["lines_per_sec"], 1)
+        print(f"  {name:<12} {r['detected']:<12} {parser:<12} {r['lines_per_sec']:>12,} "
+              f"{speedup:>7.2f}x {r['precision']:>10.4f} {r['recall']:>8.4f}")
+
+    return results
+
+
+def run_analytics_benchmark(n_points: int = 10**7,
+                            python_points: int = 10**6) -> Dict[str, Any]:
+    """Time the series analytics with NumPy against the pure-Python loops.
+
+    The Python loops run on the first python_points values only (they take
+    minutes at 10^7); compare the ns/point columns.
+    """
+
+    print(f"\nLog Analyzer Analytics Benchmark")
+    print(f"=" * 40)
+
+    rng = random.Random(42)
+    values = array('d', (
+        2.5 * math.exp(-3 * i / n_points) * (1 + 0.05 * rng.random()) for i in range(n_points)
+    ))
+    print(f"Series: {n_points:,} points (Python loops: {min(python_points, n_points):,})")
+
+    window = max(int(n_points * ROLLING_WINDOW_FRACTION), MIN_ROLLING_WINDOW)
+    steps = [
+        ("oscillation", lambda v, np_: oscillation_stats(v, np_)),
+        ("convergence", lambda v, np_: convergence_stats(v, max(len(v) // 10, 3), 1.0, np_)),
+        ("rolling", lambda v, np_: rolling_oscillation(v, min(window, len(v) // 2), np_)),
+        ("change points", lambda v, np_: detect_change_points(v, np_)),
+    ]
+    impls = [("python", False, values[:python_points])]
+    if HAS_NUMPY:
+        impls.insert(0, ("numpy", True, values))
+    else:
+        print("  numpy not installed: timing the Python loops only")
+
+    results = {}
+    for step, fn in steps:
+        for impl, use_numpy, series in impls:
+            start = time.perf_counter()
+            fn(series, use_numpy)
+            elapsed = time.perf_counter() - start
+            results[(step, impl)] = {
+                "points": len(series),
+                "seconds": round(elapsed, 3),
+                "ns_per_point": round(1e9 * elapsed / len(series), 1)
+            }
+
+    print(f"\n  {'Step':<14} {'Impl':<7} {'Points':>11} {'Seconds':>9} {'ns/point':>9}")
+    for (step, impl), r in results.items():
+        print(f"  {step:<14} {impl:<7} {r['points']:>11,} {r['seconds']:>9.3f} {r['ns_per_point']:>9.1f}")
+
+    return results
+
+
+# ============================================================================
+# BATCH MODE
+# ============================================================================
+
+# tools.log_analyzer.compression_target in config.yaml
+COMPRESSION_TARGET_BYTES = 10240
+
+# Per-model comparison fields, dropped in this order while comparison.json
+# is over budget (log, final_loss, convergence_speed and struggles stay)
+OPTIONAL_COMPARISON_FIELDS = [
+    "raw_lines", "epochs", "explosion", "max_rhat", "oscillation",
+    "best_val_loss", "improvement_pct", "converged", "critical_struggles"
+]
+
+# Compression and rotation suffixes stripped to find the log a file belongs to
+SEGMENT_SUFFIX = re.compile(r'(?:\.\d+)?(?:\.(?:gz|xz|lzma|bz2|zst))?$')
+
+
+def find_batch_logs(log_arg: str) -> Dict[str, List[str]]:
+    """Map log name -> segment paths (rotation order) for a directory or glob.
+
+    model_1.log.2.gz, model_1.log.1 and model_1.log are one log, "model_1".
+    """
+    if os.path.isdir(log_arg):
+        paths = glob.glob(os.path.join(log_arg, "*.log*"))
+    else:
+        paths = glob.glob(log_arg)
+
+    groups = defaultdict(list)
+    for path in paths:
+        if os.path.isfile(path):
+            base = SEGMENT_SUFFIX.sub('', path, count=1)
+            groups[base[:-4] if base.endswith('.log') else base].append(path)
+
+    names = [os.path.basename(key) for key in groups]
+    unique = len(set(names)) == len(names)
+    return {
+        (os.path.basename(key) if unique else os.path.relpath(key)): sorted(paths, key=rotation_order_key)
+        for key, paths in sorted(groups.items())
+    }
+
+
+def comparison_row(name: str, summary: Dict[str, Any]) -> Dict[str, Any]:
+    """One model's line in comparison.json."""
+    convergence = summary["convergence"].get("loss", {})
+    struggles = summary["struggles"]
+    return {
+        "log": name,
+        "final_loss": summary["loss"].get("final"),
+        "convergence_speed": convergence.get("speed", "unknown"),
+        "struggles": len(struggles),
+        "critical_struggles": sum(1 for s in struggles if s.get("severity") == "critical"),
+        "converged": convergence.get("converged", "unknown"),
+        "improvement_pct": summary["loss"].get("improvement_pct"),
+        "best_val_loss": summary["validation"].get("best_val_loss"),
+        "oscillation": summary["oscillation"].get("loss", {}).get("severity"),
+        "max_rhat": summary["mcmc"].get("max_rhat"),
+        "explosion": summary["gradients"].get("explosion_detected"),
+        "epochs": summary["training"]["total_epochs"],
+        "raw_lines": summary["meta"]["raw_lines"]
+    }
+
+
+def analyze_log(name: str, paths: List[str], output_dir: str,
+                keep_series: bool = False, profile: str = "auto",
+                cache: bool = True, cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Batch worker: summarize one log, write <name>_summary.json and return
+    its comparison row (or an error row; one bad log doesn't stop the batch).
+    With profile "auto" each log's format is detected separately."""
+    try:
+        profile = resolve_profile(profile, paths[0])
+        if cache:
+            data, _ = parse_log_segments_cached(paths, cache_dir, keep_series=keep_series,
+                                                profile=profile)
+        else:
+            data = parse_log_segments(paths, keep_series=keep_series, profile=profile)
+        summary = generate_summary(data, paths[-1], profile)
+        write_summary(summary, os.path.join(output_dir, f"{os.path.basename(name)}_summary.json"))
+        return comparison_row(name, summary)
+    except Exception as e:
+        return {"log": name, "error": str(e)[:200]}
+
+
+def build_comparison(rows: List[Dict[str, Any]],
+                     budget: int = COMPRESSION_TARGET_BYTES) -> Dict[str, Any]:
+    """Rank runs by final loss and fit the comparison into budget bytes.
+
+    Optional fields are dropped first (OPTIONAL_COMPARISON_FIELDS), then the
+    worst-ranked runs.
+    """
+    rows = sorted(rows, key=lambda r: (r.get("final_loss") is None, r.get("final_loss") or 0))
+    ranked = [r for r in rows if r.get("final_loss") is not None]
+
+    comparison = {
+        "meta": {
+            "generated": datetime.now().isoformat(),
+            "logs": len(rows),
+            "version": "1.0"
+        },
+        "best_final_loss": ranked[0]["log"] if ranked else None,
+        "fastest_convergence": [r["log"] for r in rows if r.get("convergence_speed") == "fast"],
+        "models": rows
+    }
+
+    def size() -> int:
+        return len(json.dumps(comparison, indent=2))
+
+    for field in OPTIONAL_COMPARISON_FIELDS:
+        if size() <= budget:
+            break
+        for row in rows:
+            row.pop(field, None)
+
+    while size() > budget and len(comparison["models"]) > 1:
+        comparison["models"] = comparison["models"][:-1]
+        comparison["meta"]["omitted"] = len(rows) - len(comparison["models"])
+
+    return comparison
+
+
+def batch(log_arg: str, output_dir: str, workers: int = 1, keep_series: bool = False,
+          profile: str = "auto", cache: bool = True,
+          cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Analyze every log under a directory or glob in one process pool."""
+
+    print(f"\nLog Analyzer for Phase 5.8 (batch mode)")
+    print(f"=" * 40)
+    print(f"Source: {log_arg}")
+    print(f"Output: {output_dir}\n")
+
+    logs = find_batch_logs(log_arg)
+    if not logs:
+        print(f"  Error: No logs found: {log_arg}")
+        sys.exit(1)
+
+    rows = []
+    if workers > 1 and len(logs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(logs))) as pool:
+            futures = [
+                pool.submit(analyze_log, name, paths, output_dir, keep_series, profile,
+                            cache, cache_dir)
+                for name, paths in logs.items()
+            ]
+            for future in futures:
+                rows.append(future.result())
+                print(f"  Analyzed: {rows[-1]['log']}")
+    else:
+        for name, paths in logs.items():
+            rows.append(analyze_log(name, paths, output_dir, keep_series, profile,
+                                    cache, cache_dir))
+            print(f"  Analyzed: {name}")
+
+    for row in rows:
+        if "error" in row:
+            print(f"  Error in {row['log']}: {row['error']}")
+
+    comparison = build_comparison(rows)
+    comparison_path = os.path.join(output_dir, "comparison.json")
+    size = write_summary(comparison, comparison_path)
+
+    print(f"\n  Comparison created: {comparison_path}")
+    print(f"  Size: {size:,} bytes")
+    print(f"  Best final loss: {comparison['best_final_loss']}")
+    print(f"\n  Done!")
+
+    return comparison
+
+
 # ============================================================================
 # MAIN FUNCTION
 # ============================================================================
 
-def main(log_path: str, output_path: str) -> None:
+def main(log_path: str, output_path: str, workers: int = 1, use_mmap: bool = False,
+         keep_series: bool = False, profile: str = "auto", cache: bool = True,
+         cache_dir: Optional[str] = None) -> None:
     """Main analysis pipeline."""
 
     print(f"\nLog Analyzer for Phase 5.8")
@@ -650,31 +3096,38 @@ def main(log_path: str, output_path: str) -> None:
     print(f"Source: {log_path}")
     print(f"Output: {output_path}\n")
 
-    # Check file exists
-    if not os.path.exists(log_path):
+    # Check file exists (a glob expands to its rotated segments)
+    paths = resolve_log_paths(log_path)
+    if not paths:
         print(f"  Error: Log file not found: {log_path}")
         sys.exit(1)
 
     # Parse log
     print("Parsing log file...")
-    data = parse_log_file(log_path)
+    if len(paths) > 1:
+        print(f"  Segments: {', '.join(os.path.basename(p) for p in paths)}")
+    detected = resolve_profile(profile, paths[0])
+    print(f"  Format: {detected}" + (" (auto-detected)" if profile == "auto" else ""))
+    if cache:
+        cache_dir = cache_dir or default_cache_dir(paths[-1])
+        data, statuses = parse_log_segments_cached(paths, cache_dir, workers, use_mmap,
+                                                   keep_series, detected)
+        print(f"  Cache: {', '.join(statuses)} ({cache_dir})")
+    else:
+        data = parse_log_segments(paths, workers, use_mmap, keep_series, detected)
 
     print(f"  Lines parsed: {data['raw_lines']:,}")
     print(f"  Epochs found: {len(data['epochs'])}")
-    print(f"  Loss values: {len(data['loss_values'])}")
-    print(f"  Warnings: {len(data['warnings'])}")
-    print(f"  Errors: {len(data['errors'])}")
+    print(f"  Loss values: {data['loss_values'].count}")
+    print(f"  Warnings: {data['warnings'].count}")
+    print(f"  Errors: {data['errors'].count}")
 
     # Generate summary
     print("\nGenerating summary...")
-    summary = generate_summary(data, log_path)
+    summary = generate_summary(data, log_path, detected)
 
     # Write output
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2)
-
-    output_size = os.path.getsize(output_path)
+    output_size = write_summary(summary, output_path)
     print(f"\n  Summary created: {output_path}")
     print(f"  Size: {output_size:,} bytes")
 
@@ -694,20 +3147,111 @@ def main(log_path: str, output_path: str) -> None:
 
 
 if __name__ == "__main__":
-    if len(sys.argv) >= 3:
-        main(sys.argv[1], sys.argv[2])
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Log Analyzer: compress training logs for Phase 5.8",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Example:
+  python log_analyzer.py output/implementation/logs/training_full.log logs/summary.json
+  python log_analyzer.py training_full.log logs/summary.json --workers 16
+  python log_analyzer.py training_full.log logs/summary.json --follow --interval 30
+  python log_analyzer.py "logs/training_full.log*" logs/summary.json
+  python log_analyzer.py --batch output/implementation/logs/ logs/ --workers 0
+  python log_analyzer.py --benchmark [training_log]
+  python log_analyzer.py --benchmark-profiles
+
+Logs may be gzip/xz/bz2 (or zstd with the zstandard package) compressed;
+a quoted glob is read as one log, rotated segments (.log.2.gz, .log.1,
+.log) oldest first.
+
+The log format (Keras/Lightning, PyMC/ArviZ, sklearn, statsmodels) is
+detected from the first 64KB and parsed with that profile's anchored
+patterns; mixed or unrecognized logs use the generic patterns. Override
+with --profile.
+
+Parse results are cached in .cache/ next to the log (keyed by the log's
+inode and first line, checked against its size and a hash before the
+parsed offset): re-running on an unchanged log parses nothing, and on a log that
+only grew parses just the new tail. Least recently used entries are
+evicted above 512MB; --no-cache bypasses the cache.
+
+--batch takes a directory or quoted glob of several logs (e.g. model_1.log
+... model_5.log) and an output directory. It writes <log>_summary.json per
+log and comparison.json ranking the runs (kept under 10KB).
+
+Series longer than 4096 values are summarized from fixed-size buckets;
+estimated oscillation and convergence figures are marked "approximate",
+and rolling windows and change points are only reported with
+--keep-series.
+
+Output JSON structure:
+  - meta: Source file info
+  - training: Epoch counts
+  - loss: Initial/final/min/max loss
+  - oscillation: Oscillation score and severity, rolling windows, change points
+  - convergence: Convergence analysis
+  - struggles: Identified struggle points with physical meaning
+  - recommendations: Suggested actions
+"""
+    )
+    parser.add_argument("training_log", nargs="?",
+                        help="Training log to analyze (plain, compressed or a quoted glob)")
+    parser.add_argument("output_json", nargs="?",
+                        help="Where to write the summary JSON (output directory with --batch)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Parse large logs in parallel chunks (0 = all cores)")
+    parser.add_argument("--mmap", action="store_true",
+                        help="Memory-map the log and scan it at the byte level")
+    parser.add_argument("--batch", action="store_true",
+                        help="Analyze every log in a directory or glob and compare them")
+    parser.add_argument("--follow", action="store_true",
+                        help="Tail a growing log and rewrite the summary periodically")
+    parser.add_argument("--interval", type=float, default=60.0,
+                        help="Seconds between --follow refreshes (default: 60)")
+    parser.add_argument("--profile", default="auto", choices=["auto"] + list(LOG_PROFILES),
+                        help="Log format profile (default: auto-detect from the first 64KB)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Don't read or update the parse cache")
+    parser.add_argument("--cache-dir",
+                        help="Parse cache directory (default: .cache next to the log)")
+    parser.add_argument("--keep-series", action="store_true",
+                        help="Keep full metric series in memory for exact statistics, rolling "
+                             "windows and change points on very long runs")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Compare parser throughput (uses a synthetic log if none given)")
+    parser.add_argument("--benchmark-lines", type=int, default=200000,
+                        help="Synthetic log size for --benchmark and --benchmark-profiles "
+                             "(default: 200000)")
+    parser.add_argument("--benchmark-analytics", action="store_true",
+                        help="Time the series analytics, NumPy vs pure Python")
+    parser.add_argument("--benchmark-points", type=int, default=10**7,
+                        help="Series length for --benchmark-analytics (default: 10^7)")
+    parser.add_argument("--benchmark-profiles", action="store_true",
+                        help="Throughput and accuracy of each format profile vs the generic patterns")
+
+    args = parser.parse_args()
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+
+    if args.benchmark_analytics:
+        run_analytics_benchmark(args.benchmark_points)
+    elif args.benchmark_profiles:
+        run_profile_benchmark(args.benchmark_lines)
+    elif args.benchmark:
+        run_benchmark(args.training_log, args.benchmark_lines, workers)
+    elif args.batch and args.training_log and args.output_json:
+        batch(args.training_log, args.output_json, workers, args.keep_series, args.profile,
+              not args.no_cache, args.cache_dir)
+    elif args.follow and args.training_log and args.output_json:
+        if any(c in args.training_log for c in '*?[') \
+                or (os.path.isfile(args.training_log) and detect_compression(args.training_log)):
+            parser.error("--follow needs a single uncompressed log")
+        follow(args.training_log, args.output_json, args.interval, args.keep_series,
+               profile=args.profile)
+    elif args.training_log and args.output_json:
+        main(args.training_log, args.output_json, workers, args.mmap, args.keep_series,
+             args.profile, not args.no_cache, args.cache_dir)
     else:
-        print("Usage: python log_analyzer.py <training_log> <output_json>")
-        print("")
-        print("Example:")
-        print("  python log_analyzer.py output/implementation/logs/training_full.log logs/summary.json")
-        print("")
-        print("Output JSON structure:")
-        print("  - meta: Source file info")
-        print("  - training: Epoch counts")
-        print("  - loss: Initial/final/min/max loss")
-        print("  - oscillation: Oscillation score and severity")
-        print("  - convergence: Convergence analysis")
-        print("  - struggles: Identified struggle points with physical meaning")
-        print("  - recommendations: Suggested actions")
+        parser.print_help()
         sys.exit(1)
@@ -4,9 +4,15 @@ MMBench Score: Automated rule-based scoring for MCM/ICM papers.
 
 Usage:
     python mmbench_score.py <workspace_path> <output_json>
+    python mmbench_score.py --batch <workspaces_dir_or_glob> <benchmarks_dir> [--workers N]
 
 Example:
     python mmbench_score.py workspace/2025_C/ benchmarks/run_report_20260124.json
+    python mmbench_score.py --batch "experiments/trail-*" benchmarks/
+
+In-process (no subprocess or JSON file; see WorkspaceScorer):
+    scorer = WorkspaceScorer("workspace/2025_C/")
+    scorer.score(["memo_exists", "abstract_quality"]).passed
 
 This script:
 1. Scans workspace for required deliverables
@@ -31,10 +37,40 @@ import os
 import re
 import sys
 import json
+import gzip
+import time
+import glob
+import fnmatch
+import sqlite3
+import cProfile
+import hashlib
+import argparse
 from pathlib import Path
 from datetime import datetime
+from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional, Any
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+# Optional: YAML rule files (JSON rule files work without it)
+try:
+    import yaml
+    HAS_YAML = True
+except ImportError:
+    HAS_YAML = False
+
+# Optional: PDF text extraction (PyMuPDF preferred, pdfplumber as in style_analyzer)
+try:
+    import fitz  # PyMuPDF
+    HAS_PYMUPDF = True
+except ImportError:
+    HAS_PYMUPDF = False
+
+try:
+    import pdfplumber
+    HAS_PDFPLUMBER = True
+except ImportError:
+    HAS_PDFPLUMBER = False
 
 
 # ============================================================================
@@ -92,43 +128,578 @@ FILE_PATTERNS = {
     ],
     "dev_diary": [
         "dev_diary*.md", "diary*.md"
+    ],
+    "readme": [
+        "README.md", "README.txt"
+    ],
+    "requirements": [
+        "requirements.txt", "environment.yml", "Pipfile"
+    ],
+    "manifest": [
+        "VERSION_MANIFEST.json", "manifest.json"
     ]
 }
 
 
+# ============================================================================
+# CONTENT PATTERNS
+# ============================================================================
+
+SENSITIVITY_KEYWORDS = ["sensitivity analysis", "robustness check", "parameter sweep"]
+
+UQ_PATTERNS = [
+    r'confidence interval',
+    r'95%?\s*CI',
+    r'p\s*[<>]\s*0\.\d+',
+    r'standard error',
+    r'uncertainty',
+    r'credible interval',
+    r'bootstrap',
+    r'±\s*\d',
+    r'\(\s*\d+\.?\d*\s*[-–]\s*\d+\.?\d*\s*\)',  # Range notation
+]
+
+# Pattern sets searched (case-insensitively) in the papers by the checkers
+CONTENT_PATTERNS = {
+    "sensitivity": SENSITIVITY_KEYWORDS,
+    "uncertainty": UQ_PATTERNS,
+}
+
+
 # ============================================================================
 # CHECKER FUNCTIONS
 # ============================================================================
 
+# Characters that make a pattern a glob rather than a literal filename
+GLOB_CHARS = re.compile(r'[*?\[]')
+
+_GLOB_REGEXES: Dict[str, Any] = {}
+
+
+def compile_glob(pattern: str) -> Any:
+    """Case-insensitive regex for a filename glob, compiled once per pattern."""
+    regex = _GLOB_REGEXES.get(pattern)
+    if regex is None:
+        regex = _GLOB_REGEXES[pattern] = re.compile(fnmatch.translate(pattern), re.IGNORECASE)
+    return regex
+
+
+for _patterns in FILE_PATTERNS.values():
+    for _pattern in _patterns:
+        compile_glob(_pattern)
+
+
+class FileCatalog:
+    """Every file under a workspace, from a single os.walk (or a listing of
+    (directory, filenames) in walk order, as taken by watch mode).
+
+    Files are indexed by lowercased basename, extension and directory, and
+    glob queries are memoized, so all checkers share one walk however many
+    patterns they ask for. Results keep os.walk order.
+    """
+
+    def __init__(self, workspace: str, plan: Optional["RulePlan"] = None,
+                 pdf_cache_dir: Optional[str] = None,
+                 listing: Optional[List[Tuple[str, List[str]]]] = None):
+        self.workspace = workspace
+        self.plan = plan or default_plan()
+        self.pdf_cache_dir = pdf_cache_dir
+        self.cost: Dict[Any, float] = defaultdict(float)  # Seconds by pattern id / rule name
+        self.paths: List[str] = []
+        self.names: List[str] = []  # Lowercased basenames, same order as paths
+        self.by_name: Dict[str, List[int]] = defaultdict(list)
+        self.by_ext: Dict[str, List[int]] = defaultdict(list)
+        self.by_dir: Dict[str, List[int]] = defaultdict(list)
+        self._matches: Dict[str, List[int]] = {}
+        self._documents: Optional["DocumentStore"] = None
+        self.recorder: Optional["CheckInputs"] = None  # Set while a checker runs incrementally
+        self.stats: Optional["CheckStats"] = None  # Set while a checker runs
+
+        start = time.perf_counter()
+        if listing is None:
+            listing = [(root, files) for root, _, files in os.walk(workspace)]
+        for root, files in listing:
+            for filename in files:
+                index = len(self.paths)
+                name = filename.lower()
+                self.paths.append(os.path.join(root, filename))
+                self.names.append(name)
+                self.by_name[name].append(index)
+                dot = name.rfind('.')
+                if dot >= 0:
+                    self.by_ext[name[dot:]].append(index)
+                self.by_dir[root].append(index)
+        self.walk_seconds = time.perf_counter() - start
+
+    def match(self, pattern: str) -> List[int]:
+        """Indices of the files whose basename matches a glob (any case).
+
+        Literal names and "*.ext" patterns are answered from the indexes;
+        other globs scan the basenames once with the compiled regex.
+        """
+        indices = self._matches.get(pattern)
+        if indices is not None:
+            return indices
+
+        lowered = pattern.lower()
+        suffix = lowered[2:]
+        if not GLOB_CHARS.search(lowered):
+            indices = self.by_name.get(lowered, [])
+        elif lowered.startswith('*.') and not GLOB_CHARS.search(suffix) and '.' not in suffix:
+            indices = self.by_ext.get(lowered[1:], [])
+        else:
+            regex = compile_glob(pattern)
+            indices = [i for i, name in enumerate(self.names) if regex.match(name)]
+
+        self._matches[pattern] = indices
+        return indices
+
+    def find(self, patterns: List[str]) -> List[str]:
+        """Paths of files matching any of the patterns."""
+        if len(patterns) == 1:
+            indices = self.match(patterns[0])
+        else:
+            indices = sorted(set().union(*(self.match(p) for p in patterns)))
+        paths = [self.paths[i] for i in indices]
+        if self.recorder is not None:
+            self.recorder.queries[tuple(patterns)] = paths_digest(paths)
+        if self.stats is not None:
+            self.stats.queries += 1
+        return paths
+
+    @property
+    def documents(self) -> "DocumentStore":
+        """Document store for the papers in this catalog (created on first use)."""
+        if self._documents is None:
+            self._documents = DocumentStore(self)
+        return self._documents
+
+    def under(self, directory: str) -> List[str]:
+        """Paths of all files below a workspace-relative directory."""
+        top = os.path.normpath(os.path.join(self.workspace, directory))
+        paths = [
+            self.paths[i]
+            for root, indices in self.by_dir.items()
+            if root == top or root.startswith(top + os.sep)
+            for i in indices
+        ]
+        if self.recorder is not None:
+            self.recorder.dirs[directory] = paths_digest(paths)
+        if self.stats is not None:
+            self.stats.queries += 1
+        return paths
+
+
+def paths_digest(paths: List[str]) -> str:
+    """Short digest of a query result, as stored in the rescoring manifest."""
+    return hashlib.sha1("\n".join(paths).encode('utf-8', errors='surrogateescape')).hexdigest()[:16]
+
+
 def find_files(workspace: str, patterns: List[str]) -> List[str]:
-    """Find files matching any of the given patterns."""
-    matches = []
+    """Find files matching any of the given patterns (walks the workspace;
+    score_workspace shares one FileCatalog between the checkers instead)."""
+    return FileCatalog(workspace).find(patterns)
 
-    for root, dirs, files in os.walk(workspace):
-        for filename in files:
+
+# ============================================================================
+# PDF TEXT
+# ============================================================================
+
+def is_pdf(path: str) -> bool:
+    return path.lower().endswith('.pdf')
+
+
+def pdf_extractor() -> Optional[str]:
+    """Name of the PDF text extractor available, or None."""
+    if HAS_PYMUPDF:
+        return "pymupdf"
+    if HAS_PDFPLUMBER:
+        return "pdfplumber"
+    return None
+
+
+def extract_pdf_text(pdf_path: str, extractor: str) -> str:
+    """Text of every page of a PDF, pages joined by newlines."""
+    if extractor == "pymupdf":
+        with fitz.open(pdf_path) as pdf:
+            return '\n'.join(page.get_text() for page in pdf)
+
+    text_parts = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            page_text = page.extract_text()
+            if page_text:
+                text_parts.append(page_text)
+    return '\n'.join(text_parts)
+
+
+def cached_pdf_text(pdf_path: str, digest: str, cache_dir: Optional[str]) -> str:
+    """PDF text, from <cache_dir>/<sha1>.<extractor>.txt.gz when extracted before.
+
+    Keyed by content hash, so a PDF copied between workspaces or re-scored
+    in a later run is extracted once.
+    """
+    extractor = pdf_extractor()
+    if extractor is None:
+        raise RuntimeError(f"{pdf_path} is a PDF: pip install pymupdf (or pdfplumber)")
+
+    cache_path = os.path.join(cache_dir, f"{digest}.{extractor}.txt.gz") if cache_dir else None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+                return f.read()
+        except (OSError, EOFError, UnicodeDecodeError):
+            pass  # Corrupt entry: extract again
+
+    text = extract_pdf_text(pdf_path, extractor)
+    if cache_path:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, cache_path)
+    return text
+
+
+# ============================================================================
+# DOCUMENT STORE
+# ============================================================================
+
+ABSTRACT_PATTERN = re.compile(
+    r'(?:abstract|summary)[\s:]*\n*(.*?)(?:\n\n|introduction|keywords|\\section)',
+    re.IGNORECASE | re.DOTALL
+)
+
+CAPTION_PATTERN = re.compile(
+    r'(?:figure|fig\.?)\s*\d+[:\.\s]+([^.]+\.)',
+    re.IGNORECASE
+)
+
+def extract_abstract(doc: "Document") -> Optional[str]:
+    """Abstract/summary text (first 1500 chars), or None if there is none."""
+    match = ABSTRACT_PATTERN.search(doc.raw)
+    return match.group(1)[:1500] if match else None
+
+
+def extract_captions(doc: "Document") -> List[str]:
+    """Figure caption sentences ("Figure 3: ... .")."""
+    return CAPTION_PATTERN.findall(doc.raw)
+
+
+def extract_sensitivity(doc: "Document") -> Optional[str]:
+    """The sensitivity-analysis phrase the paper uses, or None."""
+    return next(iter(doc.found("sensitivity")), None)
+
+
+def extract_uncertainty(doc: "Document") -> List[str]:
+    """Uncertainty patterns found in the paper."""
+    return doc.found("uncertainty")
+
+
+SECTION_EXTRACTORS = {
+    "abstract": extract_abstract,
+    "captions": extract_captions,
+    "sensitivity": extract_sensitivity,
+    "uncertainty": extract_uncertainty,
+}
+
+
+class Document:
+    """One text file (paper, code) or PDF. The text is read (or extracted,
+    through the PDF text cache) on first access and kept, raw and
+    lowercased; sections (SECTION_EXTRACTORS) are extracted and rule plan
+    patterns evaluated once each. stamp is [size, mtime_ns, sha1] of the
+    file that was read."""
+
+    def __init__(self, path: str, store: "DocumentStore"):
+        self.path = path
+        self.store = store
+        self.stamp: Optional[List[Any]] = None
+        self._raw: Optional[str] = None
+        self._lower: Optional[str] = None
+        self._sections: Dict[str, Any] = {}
+        self._hits: Dict[int, bool] = {}
+
+    @property
+    def raw(self) -> str:
+        if self._raw is None:
+            with open(self.path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                data = f.read()
+            digest = hashlib.sha1(data).hexdigest()
+            self.stamp = [stat.st_size, stat.st_mtime_ns, digest]
+            stats = self.store.catalog.stats
+            if stats is not None:
+                stats.files_read += 1
+                stats.bytes_read += len(data)
+            if is_pdf(self.path):
+                text = cached_pdf_text(self.path, digest, self.store.catalog.pdf_cache_dir)
+            else:
+                text = data.decode('utf-8', errors='ignore')
+            # Same text as open(..., 'r', errors='ignore'): universal newlines
+            self._raw = text.replace('\r\n', '\n').replace('\r', '\n')
+        return self._raw
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.raw.lower()
+        return self._lower
+
+    def section(self, name: str) -> Any:
+        if name not in self._sections:
+            self._sections[name] = SECTION_EXTRACTORS[name](self)
+        return self._sections[name]
+
+    def search(self, ids: List[int]) -> List[bool]:
+        """Whether each rule plan pattern occurs in the document.
+
+        Patterns are evaluated once per document however many rules share
+        them; the time spent goes to catalog.cost by pattern id.
+        """
+        hits = self._hits
+        cost = self.store.catalog.cost
+        matchers = self.store.catalog.plan.matchers
+        for i in ids:
+            if i not in hits:
+                needle, regex, case_sensitive = matchers[i]
+                text = self.raw if case_sensitive else self.lower
+                start = time.perf_counter()
+                hits[i] = needle in text if needle is not None else regex.search(text) is not None
+                cost[i] += time.perf_counter() - start
+        return [hits[i] for i in ids]
+
+    def found(self, pattern_set: str) -> List[str]:
+        """Patterns of a plan pattern set (CONTENT_PATTERNS) found in the document."""
+        plan = self.store.catalog.plan
+        ids = plan.pattern_sets[pattern_set]
+        return [plan.patterns[i] for i, hit in zip(ids, self.search(ids)) if hit]
+
+
+class DocumentStore:
+    """Paper files shared by the checkers, each loaded at most once."""
+
+    def __init__(self, catalog: FileCatalog):
+        self.catalog = catalog
+        self._documents: Dict[str, Document] = {}
+
+    def get(self, path: str) -> Document:
+        doc = self._documents.get(path)
+        if doc is None:
+            doc = self._documents[path] = Document(path, self)
+        if self.catalog.recorder is not None:
+            self.catalog.recorder.documents[path] = doc
+        if self.catalog.stats is not None:
+            self.catalog.stats.touched.add(path)
+        return doc
+
+    def adopt(self, other: "DocumentStore", paths: Any) -> None:
+        """Take over the documents other has loaded for the given paths
+        (files known to be unchanged), with their text and pattern results."""
+        for path, doc in other._documents.items():
+            if path in paths and path not in self._documents:
+                doc.store = self
+                self._documents[path] = doc
+
+    def papers(self) -> List[Document]:
+        """Memo/paper candidates, in catalog order.
+
+        PDFs are included when a PDF extractor is installed, unless a text
+        paper with the same name sits next to them (paper.pdf compiled from
+        paper.tex is the same paper).
+        """
+        paths = self.catalog.find(self.catalog.plan.file_patterns["memo"])
+        sources = {os.path.splitext(path)[0] for path in paths if not is_pdf(path)}
+        extractable = pdf_extractor() is not None
+        return [
+            self.get(path) for path in paths
+            if not is_pdf(path) or (extractable and os.path.splitext(path)[0] not in sources)
+        ]
+
+    def code(self) -> List[Document]:
+        """Main code files (scripts and notebooks), in catalog order."""
+        return [self.get(path) for path in self.catalog.find(self.catalog.plan.file_patterns["code_main"])]
+
+
+# ============================================================================
+# RULE PLAN
+# ============================================================================
+
+# Regex metacharacters; patterns without any are matched as plain substrings
+REGEX_META = re.compile(r'[\\.^$*+?{}\[\]|()]')
+
+# Document sets a content rule can search (DocumentStore methods)
+RULE_TARGETS = ("papers", "code")
+
+RULE_FILE_KEYS = {"weights", "thresholds", "file_patterns", "content_patterns", "rules"}
+
+_DEFAULT_PLAN: Optional["RulePlan"] = None
+_RULE_PLANS: Dict[str, "RulePlan"] = {}
+
+
+class RulePlan:
+    """Scoring configuration compiled once: weights, thresholds, file
+    patterns, content pattern sets and custom rules.
+
+    Every content regex, from the checkers' pattern sets and the custom
+    rules alike, goes into one table deduplicated by (pattern, case), so a
+    document evaluates each at most once however many rules use it
+    (Document.search); patterns without regex syntax are substring tests.
+    Globs are precompiled for the shared FileCatalog query cache.
+
+    A rule file (YAML, or JSON) overrides any of the tables and adds rules:
+
+        weights: {documentation: 0}         # must still sum to 100
+        thresholds: {memo_min_words: 300}
+        file_patterns: {code_main: ["main.py", "src/*.py"]}
+        content_patterns: {sensitivity: ["sensitivity analysis", "tornado"]}
+        rules:
+          - name: data_sources             # content rule: distinct patterns found
+            weight: 5                      # in the best document of the target
+            content: ["data source", "retrieved from", "doi:\\s*\\S+"]
+            target: papers                 # papers (default) or code
+            min_matches: 2
+            case_sensitive: false
+            message: "Cite the data sources"
+          - name: results_tables           # files rule: matching files
+            weight: 5
+            files: ["results*.csv", "*table*.tex"]
+            min_matches: 1
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, source: Optional[str] = None):
+        config = config or {}
+        unknown = set(config) - RULE_FILE_KEYS
+        if unknown:
+            raise ValueError(f"Unknown rule file sections: {', '.join(sorted(unknown))}")
+
+        self.source = source
+        self.weights = self._merge("weights", SCORING_WEIGHTS, config)
+        self.thresholds = self._merge("thresholds", THRESHOLDS, config)
+        self.file_patterns = self._merge("file_patterns", FILE_PATTERNS, config)
+        for patterns in self.file_patterns.values():
             for pattern in patterns:
-                # Simple glob matching
-                pattern_re = pattern.replace("*", ".*").replace("?", ".")
-                if re.match(pattern_re, filename, re.IGNORECASE):
-                    matches.append(os.path.join(root, filename))
-                    break
+                compile_glob(pattern)
+
+        # Pattern table: patterns[i] and matchers[i] = (needle, regex, case_sensitive)
+        self.patterns: List[str] = []
+        self.matchers: List[Tuple[Optional[str], Any, bool]] = []
+        self._ids: Dict[Tuple[str, bool], int] = {}
+        self.pattern_sets = {
+            name: [self.add_pattern(p) for p in patterns]
+            for name, patterns in self._merge("content_patterns", CONTENT_PATTERNS, config).items()
+        }
+
+        self.rules: List[Dict[str, Any]] = []
+        for spec in config.get("rules") or []:
+            self.rules.append(self.compile_rule(spec))
+
+        total = sum(self.weights.values()) + sum(rule["weight"] for rule in self.rules)
+        if total != MAX_SCORE:
+            raise ValueError(f"Weights must sum to {MAX_SCORE}, got {total} "
+                             f"(lower built-in weights to make room for custom rules)")
+
+        self.fingerprint = hashlib.sha1(
+            json.dumps(config, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def _merge(section: str, defaults: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+        overrides = config.get(section) or {}
+        unknown = set(overrides) - set(defaults)
+        if unknown:
+            raise ValueError(f"Unknown {section}: {', '.join(sorted(unknown))}")
+        return {**defaults, **overrides}
+
+    def add_pattern(self, pattern: str, case_sensitive: bool = False) -> int:
+        """Id of a content pattern in the table (added on first use)."""
+        key = (pattern, case_sensitive)
+        if key not in self._ids:
+            try:
+                regex = re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"Bad content pattern {pattern!r}: {e}")
+            needle = None
+            if not REGEX_META.search(pattern):
+                needle = pattern if case_sensitive else pattern.lower()
+            self._ids[key] = len(self.matchers)
+            self.patterns.append(pattern)
+            self.matchers.append((needle, regex, case_sensitive))
+        return self._ids[key]
+
+    def compile_rule(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate a custom rule and resolve its patterns."""
+        name = spec.get("name")
+        if not name or name in self.weights or any(r["name"] == name for r in self.rules):
+            raise ValueError(f"Rule needs a unique name not used by a built-in check: {name!r}")
+        if ("files" in spec) == ("content" in spec):
+            raise ValueError(f"Rule {name}: give either files or content patterns")
+
+        rule = {
+            "name": name,
+            "weight": int(spec.get("weight", 0)),
+            "min_matches": max(1, int(spec.get("min_matches", 1))),
+            "message": spec.get("message", "")
+        }
+        if "files" in spec:
+            rule["kind"] = "files"
+            rule["patterns"] = list(spec["files"])
+            for pattern in rule["patterns"]:
+                compile_glob(pattern)
+        else:
+            target = spec.get("target", "papers")
+            if target not in RULE_TARGETS:
+                raise ValueError(f"Rule {name}: target must be one of {', '.join(RULE_TARGETS)}")
+            rule["kind"] = "content"
+            rule["target"] = target
+            rule["ids"] = [self.add_pattern(p, bool(spec.get("case_sensitive", False)))
+                           for p in spec["content"]]
+        return rule
+
+
+def default_plan() -> RulePlan:
+    """Plan for the built-in tables (no rule file)."""
+    global _DEFAULT_PLAN
+    if _DEFAULT_PLAN is None:
+        _DEFAULT_PLAN = RulePlan()
+    return _DEFAULT_PLAN
+
+
+def load_rule_plan(rules_path: Optional[str]) -> RulePlan:
+    """Compile a YAML/JSON rule file (once per process), or the default plan."""
+    if not rules_path:
+        return default_plan()
+    if rules_path not in _RULE_PLANS:
+        with open(rules_path, 'r', encoding='utf-8') as f:
+            if rules_path.endswith('.json'):
+                config = json.load(f)
+            elif HAS_YAML:
+                config = yaml.safe_load(f)
+            else:
+                raise RuntimeError(f"{rules_path} is YAML: pip install pyyaml (or use a .json rule file)")
+        _RULE_PLANS[rules_path] = RulePlan(config, rules_path)
+    return _RULE_PLANS[rules_path]
 
-    return matches
 
+# ============================================================================
+# CHECKER FUNCTIONS (continued)
+# ============================================================================
 
-def check_memo_exists(workspace: str) -> Dict[str, Any]:
+def check_memo_exists(workspace: str, catalog: Optional[FileCatalog] = None) -> Dict[str, Any]:
     """Check if memo/paper exists and has sufficient content."""
+    if catalog is None:
+        catalog = FileCatalog(workspace)
+    plan = catalog.plan
 
     result = {
         "check": "memo_exists",
         "passed": False,
         "score": 0,
-        "max_score": SCORING_WEIGHTS["memo_exists"],
+        "max_score": plan.weights["memo_exists"],
         "details": {}
     }
 
     # Find memo files
-    memo_files = find_files(workspace, FILE_PATTERNS["memo"])
+    memo_files = catalog.find(plan.file_patterns["memo"])
 
     if not memo_files:
         result["details"]["message"] = "No memo or paper file found"
@@ -139,25 +710,31 @@ def check_memo_exists(workspace: str) -> Dict[str, Any]:
     result["details"]["file_found"] = memo_path
 
     try:
-        if memo_path.endswith('.pdf'):
-            # Can't easily check PDF content without dependencies
+        content = None
+        if not is_pdf(memo_path) or pdf_extractor() is not None:
+            content = catalog.documents.get(memo_path).raw
+
+        if content is None:
+            # No PDF extractor installed
             result["passed"] = True
             result["score"] = result["max_score"]
             result["details"]["message"] = "PDF file exists (content not verified)"
+        elif is_pdf(memo_path) and not content.strip():
+            # Scanned PDF without a text layer
+            result["passed"] = True
+            result["score"] = result["max_score"]
+            result["details"]["message"] = "PDF has no extractable text (content not verified)"
         else:
-            with open(memo_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-
             word_count = len(content.split())
             result["details"]["word_count"] = word_count
 
-            if word_count >= THRESHOLDS["memo_min_words"]:
+            if word_count >= plan.thresholds["memo_min_words"]:
                 result["passed"] = True
                 result["score"] = result["max_score"]
                 result["details"]["message"] = f"Memo has {word_count} words"
             else:
-                result["score"] = int(result["max_score"] * word_count / THRESHOLDS["memo_min_words"])
-                result["details"]["message"] = f"Memo too short ({word_count} < {THRESHOLDS['memo_min_words']} words)"
+                result["score"] = int(result["max_score"] * word_count / plan.thresholds["memo_min_words"])
+                result["details"]["message"] = f"Memo too short ({word_count} < {plan.thresholds['memo_min_words']} words)"
 
     except Exception as e:
         result["details"]["error"] = str(e)
@@ -165,19 +742,22 @@ def check_memo_exists(workspace: str) -> Dict[str, Any]:
     return result
 
 
-def check_sensitivity_analysis(workspace: str) -> Dict[str, Any]:
+def check_sensitivity_analysis(workspace: str, catalog: Optional[FileCatalog] = None) -> Dict[str, Any]:
     """Check if sensitivity analysis is present."""
+    if catalog is None:
+        catalog = FileCatalog(workspace)
+    plan = catalog.plan
 
     result = {
         "check": "sensitivity_analysis",
         "passed": False,
         "score": 0,
-        "max_score": SCORING_WEIGHTS["sensitivity_analysis"],
+        "max_score": plan.weights["sensitivity_analysis"],
         "details": {}
     }
 
     # Find sensitivity files
-    sens_files = find_files(workspace, FILE_PATTERNS["sensitivity_analysis"])
+    sens_files = catalog.find(plan.file_patterns["sensitivity_analysis"])
 
     if sens_files:
         result["passed"] = True
@@ -187,17 +767,9 @@ def check_sensitivity_analysis(workspace: str) -> Dict[str, Any]:
         return result
 
     # Also check paper content for sensitivity section
-    memo_files = find_files(workspace, FILE_PATTERNS["memo"])
-
-    for memo_path in memo_files:
-        if memo_path.endswith('.pdf'):
-            continue
-
+    for doc in catalog.documents.papers():
         try:
-            with open(memo_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read().lower()
-
-            if any(kw in content for kw in ["sensitivity analysis", "robustness check", "parameter sweep"]):
+            if doc.section("sensitivity"):
                 result["passed"] = True
                 result["score"] = result["max_score"]
                 result["details"]["message"] = "Sensitivity analysis section found in paper"
@@ -210,37 +782,26 @@ def check_sensitivity_analysis(workspace: str) -> Dict[str, Any]:
     return result
 
 
-def check_abstract_quality(workspace: str) -> Dict[str, Any]:
+def check_abstract_quality(workspace: str, catalog: Optional[FileCatalog] = None) -> Dict[str, Any]:
     """Check abstract contains sufficient numbers."""
+    if catalog is None:
+        catalog = FileCatalog(workspace)
+    plan = catalog.plan
 
     result = {
         "check": "abstract_quality",
         "passed": False,
         "score": 0,
-        "max_score": SCORING_WEIGHTS["abstract_quality"],
+        "max_score": plan.weights["abstract_quality"],
         "details": {}
     }
 
-    # Find paper files
-    memo_files = find_files(workspace, FILE_PATTERNS["memo"])
-
-    for memo_path in memo_files:
-        if memo_path.endswith('.pdf'):
-            continue
-
+    for doc in catalog.documents.papers():
         try:
-            with open(memo_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-
             # Try to find abstract section
-            abstract_match = re.search(
-                r'(?:abstract|summary)[\s:]*\n*(.*?)(?:\n\n|introduction|keywords|\\section)',
-                content,
-                re.IGNORECASE | re.DOTALL
-            )
-
-            if abstract_match:
-                abstract = abstract_match.group(1)[:1500]
+            abstract = doc.section("abstract")
+
+            if abstract is not None:
                 result["details"]["abstract_length"] = len(abstract)
 
                 # Count numbers
@@ -255,14 +816,14 @@ def check_abstract_quality(workspace: str) -> Dict[str, Any]:
                 result["details"]["percentages_found"] = len(percentages)
                 result["details"]["pvalues_found"] = len(pvalues)
 
-                if total_quant >= THRESHOLDS["abstract_numbers_min"]:
+                if total_quant >= plan.thresholds["abstract_numbers_min"]:
                     result["passed"] = True
                     result["score"] = result["max_score"]
                     result["details"]["message"] = f"Abstract has {total_quant} numbers (good)"
                 else:
                     # Partial credit
-                    result["score"] = int(result["max_score"] * total_quant / THRESHOLDS["abstract_numbers_min"])
-                    result["details"]["message"] = f"Abstract has {total_quant} numbers (need ≥{THRESHOLDS['abstract_numbers_min']})"
+                    result["score"] = int(result["max_score"] * total_quant / plan.thresholds["abstract_numbers_min"])
+                    result["details"]["message"] = f"Abstract has {total_quant} numbers (need ≥{plan.thresholds['abstract_numbers_min']})"
 
                 return result
 
@@ -273,19 +834,22 @@ def check_abstract_quality(workspace: str) -> Dict[str, Any]:
     return result
 
 
-def check_code_runnable(workspace: str) -> Dict[str, Any]:
+def check_code_runnable(workspace: str, catalog: Optional[FileCatalog] = None) -> Dict[str, Any]:
     """Check if main code file exists."""
+    if catalog is None:
+        catalog = FileCatalog(workspace)
+    plan = catalog.plan
 
     result = {
         "check": "code_runnable",
         "passed": False,
         "score": 0,
-        "max_score": SCORING_WEIGHTS["code_runnable"],
+        "max_score": plan.weights["code_runnable"],
         "details": {}
     }
 
     # Find code files
-    code_files = find_files(workspace, FILE_PATTERNS["code_main"])
+    code_files = catalog.find(plan.file_patterns["code_main"])
 
     if not code_files:
         result["details"]["message"] = "No main code file found"
@@ -297,8 +861,7 @@ def check_code_runnable(workspace: str) -> Dict[str, Any]:
     for code_path in code_files:
         if code_path.endswith('.py'):
             try:
-                with open(code_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
+                content = catalog.documents.get(code_path).raw
 
                 lines = len([l for l in content.split('\n') if l.strip() and not l.strip().startswith('#')])
 
@@ -318,47 +881,24 @@ def check_code_runnable(workspace: str) -> Dict[str, Any]:
     return result
 
 
-def check_uncertainty_quantification(workspace: str) -> Dict[str, Any]:
+def check_uncertainty_quantification(workspace: str, catalog: Optional[FileCatalog] = None) -> Dict[str, Any]:
     """Check for uncertainty quantification in results."""
+    if catalog is None:
+        catalog = FileCatalog(workspace)
+    plan = catalog.plan
 
     result = {
         "check": "uncertainty_quantification",
         "passed": False,
         "score": 0,
-        "max_score": SCORING_WEIGHTS["uncertainty_quantification"],
+        "max_score": plan.weights["uncertainty_quantification"],
         "details": {}
     }
 
-    # Find paper files
-    memo_files = find_files(workspace, FILE_PATTERNS["memo"])
-
-    uq_patterns = [
-        r'confidence interval',
-        r'95%?\s*CI',
-        r'p\s*[<>]\s*0\.\d+',
-        r'standard error',
-        r'uncertainty',
-        r'credible interval',
-        r'bootstrap',
-        r'±\s*\d',
-        r'\(\s*\d+\.?\d*\s*[-–]\s*\d+\.?\d*\s*\)',  # Range notation
-    ]
-
-    for memo_path in memo_files:
-        if memo_path.endswith('.pdf'):
-            continue
-
+    for doc in catalog.documents.papers():
         try:
-            with open(memo_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read().lower()
-
-            matches = 0
-            found_patterns = []
-
-            for pattern in uq_patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    matches += 1
-                    found_patterns.append(pattern)
+            found_patterns = list(doc.section("uncertainty"))
+            matches = len(found_patterns)
 
             if matches >= 3:
                 result["passed"] = True
@@ -378,35 +918,24 @@ def check_uncertainty_quantification(workspace: str) -> Dict[str, Any]:
     return result
 
 
-def check_figure_captions(workspace: str) -> Dict[str, Any]:
+def check_figure_captions(workspace: str, catalog: Optional[FileCatalog] = None) -> Dict[str, Any]:
     """Check figure caption quality."""
+    if catalog is None:
+        catalog = FileCatalog(workspace)
+    plan = catalog.plan
 
     result = {
         "check": "figure_captions",
         "passed": False,
         "score": 0,
-        "max_score": SCORING_WEIGHTS["figure_captions"],
+        "max_score": plan.weights["figure_captions"],
         "details": {}
     }
 
-    # Find paper files
-    memo_files = find_files(workspace, FILE_PATTERNS["memo"])
-
-    for memo_path in memo_files:
-        if memo_path.endswith('.pdf'):
-            continue
-
+    for doc in catalog.documents.papers():
         try:
-            with open(memo_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-
             # Find figure captions
-            caption_pattern = re.compile(
-                r'(?:figure|fig\.?)\s*\d+[:\.\s]+([^.]+\.)',
-                re.IGNORECASE
-            )
-
-            captions = caption_pattern.findall(content)
+            captions = doc.section("captions")
             result["details"]["captions_found"] = len(captions)
 
             if not captions:
@@ -421,7 +950,7 @@ def check_figure_captions(workspace: str) -> Dict[str, Any]:
                 words = len(caption.split())
                 has_marker = any(m in caption.lower() for m in conclusionary_markers)
 
-                if words >= THRESHOLDS["figure_caption_min_words"] and has_marker:
+                if words >= plan.thresholds["figure_caption_min_words"] and has_marker:
                     good_captions += 1
 
             result["details"]["good_captions"] = good_captions
@@ -444,19 +973,22 @@ def check_figure_captions(workspace: str) -> Dict[str, Any]:
     return result
 
 
-def check_concept_diagrams(workspace: str) -> Dict[str, Any]:
+def check_concept_diagrams(workspace: str, catalog: Optional[FileCatalog] = None) -> Dict[str, Any]:
     """Check for concept diagrams (Mode B visualization)."""
+    if catalog is None:
+        catalog = FileCatalog(workspace)
+    plan = catalog.plan
 
     result = {
         "check": "concept_diagrams",
         "passed": False,
         "score": 0,
-        "max_score": SCORING_WEIGHTS["concept_diagrams"],
+        "max_score": plan.weights["concept_diagrams"],
         "details": {}
     }
 
     # Find mermaid/diagram files
-    diagram_files = find_files(workspace, FILE_PATTERNS["mermaid"])
+    diagram_files = catalog.find(plan.file_patterns["mermaid"])
 
     if diagram_files:
         result["passed"] = True
@@ -466,7 +998,7 @@ def check_concept_diagrams(workspace: str) -> Dict[str, Any]:
         return result
 
     # Also check figures directory for flowcharts
-    figure_files = find_files(workspace, FILE_PATTERNS["figures"])
+    figure_files = catalog.find(plan.file_patterns["figures"])
     flowchart_figs = [f for f in figure_files if any(kw in f.lower() for kw in ["flow", "diagram", "concept", "architecture"])]
 
     if flowchart_figs:
@@ -480,20 +1012,23 @@ def check_concept_diagrams(workspace: str) -> Dict[str, Any]:
     return result
 
 
-def check_narrative_arc(workspace: str) -> Dict[str, Any]:
+def check_narrative_arc(workspace: str, catalog: Optional[FileCatalog] = None) -> Dict[str, Any]:
     """Check for narrative arc documentation."""
+    if catalog is None:
+        catalog = FileCatalog(workspace)
+    plan = catalog.plan
 
     result = {
         "check": "narrative_arc",
         "passed": False,
         "score": 0,
-        "max_score": SCORING_WEIGHTS["narrative_arc"],
+        "max_score": plan.weights["narrative_arc"],
         "details": {}
     }
 
     # Find narrative arc files
-    arc_files = find_files(workspace, FILE_PATTERNS["narrative_arc"])
-    diary_files = find_files(workspace, FILE_PATTERNS["dev_diary"])
+    arc_files = catalog.find(plan.file_patterns["narrative_arc"])
+    diary_files = catalog.find(plan.file_patterns["dev_diary"])
 
     if arc_files:
         result["passed"] = True
@@ -513,25 +1048,28 @@ def check_narrative_arc(workspace: str) -> Dict[str, Any]:
     return result
 
 
-def check_documentation(workspace: str) -> Dict[str, Any]:
+def check_documentation(workspace: str, catalog: Optional[FileCatalog] = None) -> Dict[str, Any]:
     """Check for general documentation quality."""
+    if catalog is None:
+        catalog = FileCatalog(workspace)
+    plan = catalog.plan
 
     result = {
         "check": "documentation",
         "passed": False,
         "score": 0,
-        "max_score": SCORING_WEIGHTS["documentation"],
+        "max_score": plan.weights["documentation"],
         "details": {}
     }
 
     # Check for README
-    readme_files = find_files(workspace, ["README.md", "README.txt"])
+    readme_files = catalog.find(plan.file_patterns["readme"])
 
     # Check for requirements
-    req_files = find_files(workspace, ["requirements.txt", "environment.yml", "Pipfile"])
+    req_files = catalog.find(plan.file_patterns["requirements"])
 
     # Check for VERSION_MANIFEST
-    manifest_files = find_files(workspace, ["VERSION_MANIFEST.json", "manifest.json"])
+    manifest_files = catalog.find(plan.file_patterns["manifest"])
 
     docs_found = 0
     doc_list = []
@@ -563,12 +1101,176 @@ def check_documentation(workspace: str) -> Dict[str, Any]:
     return result
 
 
+def evaluate_rule(rule: Dict[str, Any], workspace: str,
+                  catalog: Optional[FileCatalog] = None) -> Dict[str, Any]:
+    """Score a custom rule from the rule plan (partial credit below min_matches)."""
+    if catalog is None:
+        catalog = FileCatalog(workspace)
+
+    result = {
+        "check": rule["name"],
+        "passed": False,
+        "score": 0,
+        "max_score": rule["weight"],
+        "details": {}
+    }
+
+    needed = rule["min_matches"]
+    if rule["kind"] == "files":
+        start = time.perf_counter()
+        files = catalog.find(rule["patterns"])
+        catalog.cost[rule["name"]] += time.perf_counter() - start
+        count = len(files)
+        unit = "files"
+        result["details"]["files_found"] = [os.path.basename(f) for f in files[:5]]
+    else:
+        documents = getattr(catalog.documents, rule["target"])()
+        patterns = catalog.plan.patterns
+        best: List[str] = []
+        for doc in documents:
+            try:
+                found = [patterns[i] for i, hit in zip(rule["ids"], doc.search(rule["ids"])) if hit]
+            except Exception as e:
+                result["details"]["error"] = str(e)
+                continue
+            if len(found) > len(best):
+                best = found
+            if len(best) >= needed:
+                break
+        count = len(best)
+        unit = "patterns"
+        result["details"]["patterns"] = best[:5]
+
+    if count >= needed:
+        result["passed"] = True
+        result["score"] = result["max_score"]
+        result["details"]["message"] = f"Found {count} matching {unit}"
+    else:
+        result["score"] = int(result["max_score"] * count / needed)
+        result["details"]["message"] = rule["message"] or f"Found {count} matching {unit} (need {needed})"
+
+    return result
+
+
+def rule_cost_profile(catalog: FileCatalog, reused: Tuple[str, ...] = ()) -> List[Dict[str, Any]]:
+    """Measured cost of each pattern set and custom rule, most expensive first.
+
+    Content costs are the pattern evaluations (a pattern shared by several
+    rules counts for each); rules reused from the manifest cost nothing.
+    """
+    plan = catalog.plan
+    shared = defaultdict(int)
+    for ids in list(plan.pattern_sets.values()) + [r["ids"] for r in plan.rules if r["kind"] == "content"]:
+        for i in set(ids):
+            shared[i] += 1
+
+    profile = []
+    for name, ids in plan.pattern_sets.items():
+        profile.append({"rule": name, "kind": "pattern_set", "patterns": len(ids),
+                        "ms": round(1000 * sum(catalog.cost[i] for i in ids), 3)})
+    for rule in plan.rules:
+        entry = {"rule": rule["name"], "kind": rule["kind"]}
+        if rule["kind"] == "files":
+            entry["patterns"] = len(rule["patterns"])
+            entry["ms"] = round(1000 * catalog.cost[rule["name"]], 3)
+        else:
+            entry["patterns"] = len(rule["ids"])
+            entry["shared_patterns"] = sum(1 for i in rule["ids"] if shared[i] > 1)
+            entry["ms"] = round(1000 * sum(catalog.cost[i] for i in rule["ids"]), 3)
+        if rule["name"] in reused:
+            entry["cached"] = True
+        profile.append(entry)
+
+    return sorted(profile, key=lambda e: -e["ms"])
+
+
 # ============================================================================
 # MAIN SCORING FUNCTION
 # ============================================================================
 
-def score_workspace(workspace: str) -> Dict[str, Any]:
+CHECKERS = [
+    check_memo_exists,
+    check_sensitivity_analysis,
+    check_abstract_quality,
+    check_code_runnable,
+    check_uncertainty_quantification,
+    check_figure_captions,
+    check_concept_diagrams,
+    check_narrative_arc,
+    check_documentation
+]
+
+
+class CheckStats:
+    """What one checker run cost besides time: files and bytes it read from
+    disk, files it touched (read or shared from the document store) and
+    catalog queries."""
+
+    def __init__(self):
+        self.bytes_read = 0
+        self.files_read = 0
+        self.touched: set = set()
+        self.queries = 0
+
+
+def check_jobs(plan: RulePlan) -> List[Tuple[str, Any]]:
+    """(manifest key, callable(workspace, catalog)) for the checkers, then the plan's rules."""
+    jobs = [(checker.__name__, checker) for checker in CHECKERS]
+    jobs += [(f"rule:{rule['name']}", lambda ws, cat, rule=rule: evaluate_rule(rule, ws, cat))
+             for rule in plan.rules]
+    return jobs
+
+
+def run_check(run: Any, workspace: str, catalog: FileCatalog,
+              profile_dir: Optional[str] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Run one checker with timing and I/O counters (and cProfile when
+    profile_dir is given, dumping <check>.prof there). Returns (result, perf)."""
+    catalog.stats = stats = CheckStats()
+    profiler = cProfile.Profile() if profile_dir else None
+    start = time.perf_counter()
+    try:
+        result = profiler.runcall(run, workspace, catalog) if profiler else run(workspace, catalog)
+    finally:
+        elapsed = time.perf_counter() - start
+        catalog.stats = None
+
+    perf = {
+        "check": result["check"],
+        "ms": round(1000 * elapsed, 3),
+        "bytes_read": stats.bytes_read,
+        "files_read": stats.files_read,
+        "files_touched": len(stats.touched),
+        "queries": stats.queries
+    }
+    if profiler is not None:
+        Path(profile_dir).mkdir(parents=True, exist_ok=True)
+        safe_name = re.sub(r'[^\w.-]+', '_', result["check"])
+        perf["profile"] = os.path.join(profile_dir, f"{safe_name}.prof")
+        profiler.dump_stats(perf["profile"])
+    return result, perf
+
+
+def score_workspace(workspace: str, plan: Optional[RulePlan] = None,
+                    profile_dir: Optional[str] = None,
+                    pdf_cache_dir: Optional[str] = None) -> Dict[str, Any]:
     """Score a workspace and return comprehensive report."""
+    catalog = FileCatalog(workspace, plan, pdf_cache_dir)
+    results = []
+    perf = []
+    for _, run in check_jobs(catalog.plan):
+        result, entry = run_check(run, workspace, catalog, profile_dir)
+        results.append(result)
+        perf.append(entry)
+    return build_report(workspace, results, catalog, perf=perf)
+
+
+def build_report(workspace: str, results: List[Dict[str, Any]],
+                 catalog: Optional[FileCatalog] = None,
+                 reused: Tuple[str, ...] = (),
+                 perf: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Assemble the report from the checker and rule results (CHECKERS, then
+    the plan's rules). With a rule file, the report gets a rules section with
+    the measured cost profile; with per-check perf entries, a perf section."""
 
     report = {
         "meta": {
@@ -585,23 +1287,9 @@ def score_workspace(workspace: str) -> Dict[str, Any]:
         "recommendations": []
     }
 
-    # Run all checks
-    checkers = [
-        check_memo_exists,
-        check_sensitivity_analysis,
-        check_abstract_quality,
-        check_code_runnable,
-        check_uncertainty_quantification,
-        check_figure_captions,
-        check_concept_diagrams,
-        check_narrative_arc,
-        check_documentation
-    ]
-
     total_score = 0
 
-    for checker in checkers:
-        result = checker(workspace)
+    for result in results:
         report["checks"].append(result)
         total_score += result["score"]
 
@@ -650,6 +1338,22 @@ def score_workspace(workspace: str) -> Dict[str, Any]:
             "action": "Add Mermaid flowcharts showing model architecture"
         })
 
+    if catalog is not None and catalog.plan.source:
+        report["rules"] = {
+            "file": catalog.plan.source,
+            "fingerprint": catalog.plan.fingerprint,
+            "cost": rule_cost_profile(catalog, reused)
+        }
+
+    if catalog is not None and perf is not None:
+        report["perf"] = {
+            "catalog_ms": round(1000 * catalog.walk_seconds, 3),
+            "files": len(catalog.paths),
+            "checks_ms": round(sum(entry["ms"] for entry in perf), 3),
+            "bytes_read": sum(entry["bytes_read"] for entry in perf),
+            "checks": perf
+        }
+
     return report
 
 
@@ -667,41 +1371,238 @@ def get_grade(score: int) -> str:
         return "F (Major Issues)"
 
 
-def load_previous_runs(benchmarks_dir: str) -> List[Dict]:
-    """Load previous benchmark runs for trend analysis."""
-    previous = []
+# ============================================================================
+# RUN HISTORY
+# ============================================================================
 
-    if not os.path.exists(benchmarks_dir):
-        return previous
+HISTORY_FILENAME = "history.sqlite"
+
+# Runs averaged for the trend's moving average
+TREND_WINDOW = 5
+
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    report TEXT UNIQUE NOT NULL,
+    workspace TEXT NOT NULL,
+    generated TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    ms REAL
+);
+CREATE INDEX IF NOT EXISTS runs_by_workspace ON runs (workspace, generated);
+CREATE INDEX IF NOT EXISTS runs_by_date ON runs (generated);
+CREATE TABLE IF NOT EXISTS checks (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    max_score INTEGER NOT NULL,
+    passed INTEGER NOT NULL,
+    ms REAL,
+    PRIMARY KEY (run_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS checks_by_name ON checks (name, run_id);
+"""
 
-    for filename in os.listdir(benchmarks_dir):
-        if filename.startswith("run_report_") and filename.endswith(".json"):
-            filepath = os.path.join(benchmarks_dir, filename)
-            try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                    previous.append({
-                        "file": filename,
-                        "date": data.get("meta", {}).get("generated", ""),
-                        "score": data.get("score", 0)
-                    })
-            except Exception:
-                pass
 
-    return sorted(previous, key=lambda x: x["date"])
+def workspace_key(workspace: str) -> str:
+    """Normalized workspace path, for matching reports to their workspace."""
+    return os.path.abspath(workspace) if workspace else ""
+
+
+class RunHistory:
+    """Append-only index of the runs in a benchmarks directory (SQLite).
+
+    One row per run (report file, workspace, date, score) and one per
+    check, so trends, moving averages, regressions and best-ever scores are
+    indexed queries instead of re-parsing every run_report_*.json. Reports
+    not yet indexed are imported when the history is opened. Queries take
+    an optional workspace; without one they cover every run.
+    """
+
+    def __init__(self, benchmarks_dir: str):
+        self.benchmarks_dir = benchmarks_dir or "."
+        Path(self.benchmarks_dir).mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(self.benchmarks_dir, HISTORY_FILENAME))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(HISTORY_SCHEMA)
+        # Histories from before per-check timing
+        for table in ("runs", "checks"):
+            columns = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+            if "ms" not in columns:
+                self.conn.execute(f"ALTER TABLE {table} ADD COLUMN ms REAL")
+        self.sync()
+
+    def __enter__(self) -> "RunHistory":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def sync(self) -> int:
+        """Import run_report_*.json files not indexed yet; returns how many."""
+        known = {row[0] for row in self.conn.execute("SELECT report FROM runs")}
+        added = 0
+        with self.conn:
+            for filename in sorted(os.listdir(self.benchmarks_dir)):
+                if (filename.startswith("run_report_") and filename.endswith(".json")
+                        and filename not in known):
+                    try:
+                        with open(os.path.join(self.benchmarks_dir, filename), 'r') as f:
+                            self._insert(json.load(f), filename)
+                        added += 1
+                    except Exception:
+                        pass
+        return added
+
+    def add(self, report: Dict[str, Any], filename: str) -> None:
+        """Index a report (replacing an earlier run written to the same file)."""
+        with self.conn:
+            self._insert(report, filename)
+
+    def _insert(self, report: Dict[str, Any], filename: str) -> None:
+        meta = report.get("meta", {})
+        perf = report.get("perf", {})
+        # Reused checks weren't run, so they have no timing
+        timings = {p["check"]: p["ms"] for p in perf.get("checks", []) if not p.get("cached")}
+        old = self.conn.execute("SELECT id FROM runs WHERE report = ?", (filename,)).fetchone()
+        if old is not None:
+            self.conn.execute("DELETE FROM checks WHERE run_id = ?", (old[0],))
+            self.conn.execute("DELETE FROM runs WHERE id = ?", (old[0],))
+        run_id = self.conn.execute(
+            "INSERT INTO runs (report, workspace, generated, score, ms) VALUES (?, ?, ?, ?, ?)",
+            (filename, workspace_key(meta.get("workspace", "")),
+             meta.get("generated", ""), report.get("score", 0), perf.get("checks_ms"))
+        ).lastrowid
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO checks (run_id, name, score, max_score, passed, ms) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(run_id, c["check"], c.get("score", 0), c.get("max_score", 0), int(bool(c.get("passed"))),
+              timings.get(c["check"]))
+             for c in report.get("checks", []) if "check" in c]
+        )
+
+    @staticmethod
+    def _where(workspace: Optional[str], prefix: str = "WHERE") -> Tuple[str, Tuple]:
+        if workspace is None:
+            return "", ()
+        return f"{prefix} workspace = ?", (workspace_key(workspace),)
+
+    def runs(self, workspace: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Runs oldest first (the most recent `limit` if given)."""
+        where, args = self._where(workspace)
+        sql = f"SELECT id, report, workspace, generated, score FROM runs {where} ORDER BY generated DESC, id DESC"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        rows = self.conn.execute(sql, args).fetchall()
+        return [
+            {"id": r["id"], "file": r["report"], "date": r["generated"],
+             "score": r["score"], "workspace": r["workspace"]}
+            for r in reversed(rows)
+        ]
+
+    def count(self, workspace: Optional[str] = None) -> int:
+        where, args = self._where(workspace)
+        return self.conn.execute(f"SELECT COUNT(*) FROM runs {where}", args).fetchone()[0]
+
+    def last(self, workspace: Optional[str] = None) -> Optional[Dict]:
+        runs = self.runs(workspace, limit=1)
+        return runs[0] if runs else None
+
+    def moving_average(self, workspace: Optional[str] = None,
+                       window: int = TREND_WINDOW) -> Optional[float]:
+        """Mean score of the last `window` runs."""
+        where, args = self._where(workspace)
+        value = self.conn.execute(
+            f"SELECT AVG(score) FROM (SELECT score FROM runs {where} "
+            f"ORDER BY generated DESC, id DESC LIMIT ?)", args + (window,)
+        ).fetchone()[0]
+        return round(value, 1) if value is not None else None
+
+    def best(self, workspace: Optional[str] = None) -> Optional[Dict]:
+        """Best-scoring run (earliest on ties)."""
+        where, args = self._where(workspace)
+        row = self.conn.execute(
+            f"SELECT report, generated, score FROM runs {where} "
+            f"ORDER BY score DESC, generated, id LIMIT 1", args
+        ).fetchone()
+        return {"file": row["report"], "date": row["generated"], "score": row["score"]} if row else None
+
+    def check_scores(self, run_id: int) -> Dict[str, int]:
+        """Per-check scores of one run."""
+        return dict(self.conn.execute("SELECT name, score FROM checks WHERE run_id = ?", (run_id,)))
+
+    def best_check_scores(self, workspace: Optional[str] = None) -> Dict[str, int]:
+        """Best-ever score of each check."""
+        where, args = self._where(workspace)
+        return dict(self.conn.execute(
+            f"SELECT name, MAX(checks.score) FROM checks JOIN runs ON runs.id = checks.run_id "
+            f"{where} GROUP BY name", args
+        ))
+
+    def check_timings(self, workspace: Optional[str] = None,
+                      window: int = TREND_WINDOW) -> List[Dict]:
+        """Per-check time over its last `window` timed runs, slowest first."""
+        where, args = self._where(workspace, "AND")
+        rows = self.conn.execute(
+            f"""SELECT name, AVG(ms) AS avg_ms, MAX(ms) AS max_ms, COUNT(*) AS runs,
+                       MAX(CASE WHEN rank = 1 THEN ms END) AS last_ms
+                FROM (
+                    SELECT name, checks.ms AS ms,
+                           ROW_NUMBER() OVER (PARTITION BY name ORDER BY generated DESC, runs.id DESC) AS rank
+                    FROM checks JOIN runs ON runs.id = checks.run_id
+                    WHERE checks.ms IS NOT NULL {where}
+                ) WHERE rank <= ? GROUP BY name ORDER BY avg_ms DESC""",
+            args + (window,)
+        ).fetchall()
+        return [
+            {"check": r["name"], "avg_ms": round(r["avg_ms"], 3), "max_ms": round(r["max_ms"], 3),
+             "last_ms": round(r["last_ms"], 3), "runs": r["runs"]}
+            for r in rows
+        ]
+
+    def regressions(self, workspace: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """Most recent per-check score drops from one run of a workspace to its next."""
+        where, args = self._where(workspace)
+        rows = self.conn.execute(
+            f"""SELECT * FROM (
+                    SELECT name, report, generated, checks.score AS score,
+                           LAG(checks.score) OVER (PARTITION BY workspace, name
+                                                 ORDER BY generated, runs.id) AS previous
+                    FROM checks JOIN runs ON runs.id = checks.run_id {where}
+                ) WHERE score < previous ORDER BY generated DESC LIMIT ?""",
+            args + (limit,)
+        ).fetchall()
+        return [
+            {"check": r["name"], "file": r["report"], "date": r["generated"],
+             "previous": r["previous"], "score": r["score"]}
+            for r in rows
+        ]
+
+
+def load_previous_runs(benchmarks_dir: str) -> List[Dict]:
+    """Load previous benchmark runs for trend analysis (from the run history)."""
+    if not os.path.exists(benchmarks_dir):
+        return []
+    with RunHistory(benchmarks_dir) as history:
+        return history.runs()
 
 
-def calculate_trend(current_score: int, previous_runs: List[Dict]) -> Dict[str, Any]:
-    """Calculate trend from previous runs."""
-    if not previous_runs:
+def calculate_trend(report: Dict[str, Any], history: RunHistory,
+                    workspace: Optional[str] = None) -> Dict[str, Any]:
+    """Calculate trend against the run history (before the report is added)."""
+    last = history.last(workspace)
+    if last is None:
         return {
             "direction": "N/A",
             "change": 0,
             "message": "First run - no trend data"
         }
 
-    last_score = previous_runs[-1]["score"]
-    change = current_score - last_score
+    last_score = last["score"]
+    change = report["score"] - last_score
 
     if change > 0:
         direction = "improving"
@@ -713,20 +1614,710 @@ def calculate_trend(current_score: int, previous_runs: List[Dict]) -> Dict[str,
         direction = "stable"
         symbol = "→"
 
+    previous_checks = history.check_scores(last["id"])
+    regressions = [
+        {"check": c["check"], "previous": previous_checks[c["check"]], "score": c["score"]}
+        for c in report["checks"]
+        if c["check"] in previous_checks and c["score"] < previous_checks[c["check"]]
+    ]
+    best = history.best(workspace)
+
     return {
         "direction": direction,
         "change": change,
         "symbol": symbol,
         "previous_score": last_score,
+        "moving_average": history.moving_average(workspace),
+        "best_score": best["score"],
+        "best_report": best["file"],
+        "regressions": regressions,
         "message": f"{symbol}{abs(change)} ({direction})"
     }
 
 
+# ============================================================================
+# INCREMENTAL RESCORING
+# ============================================================================
+
+MANIFEST_VERSION = 1
+MANIFEST_DIRNAME = ".cache"
+
+_SCORER_FINGERPRINT: Optional[str] = None
+
+
+class CheckInputs:
+    """What one checker consumed: catalog queries (as result digests),
+    directory listings and the files it read."""
+
+    def __init__(self):
+        self.queries: Dict[Tuple[str, ...], str] = {}
+        self.dirs: Dict[str, str] = {}
+        self.documents: Dict[str, Document] = {}
+
+    def entry(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Manifest entry: the inputs plus the result they produced."""
+        files = {}
+        for path, doc in self.documents.items():
+            if doc.stamp is not None:
+                files[path] = doc.stamp
+                continue
+            # Listed but never read (or unreadable): size+mtime only
+            try:
+                stat = os.stat(path)
+                files[path] = [stat.st_size, stat.st_mtime_ns, None]
+            except OSError:
+                files[path] = None
+        return {
+            "queries": [[list(patterns), digest] for patterns, digest in self.queries.items()],
+            "dirs": [[directory, digest] for directory, digest in self.dirs.items()],
+            "files": files,
+            "result": result
+        }
+
+
+def scorer_fingerprint() -> str:
+    """Hash of this script, so edited rules or weights invalidate manifests."""
+    global _SCORER_FINGERPRINT
+    if _SCORER_FINGERPRINT is None:
+        _SCORER_FINGERPRINT = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()[:16]
+    return _SCORER_FINGERPRINT
+
+
+def pdf_cache_path(benchmarks_dir: str) -> str:
+    """<benchmarks_dir>/.cache/pdf_text, shared by every workspace."""
+    return os.path.join(benchmarks_dir, MANIFEST_DIRNAME, "pdf_text")
+
+
+def default_manifest_path(workspace: str, benchmarks_dir: str) -> str:
+    """<benchmarks_dir>/.cache/mmbench_<workspace hash>.json"""
+    key = hashlib.sha1(os.path.abspath(workspace).encode('utf-8', errors='surrogateescape'))
+    return os.path.join(benchmarks_dir, MANIFEST_DIRNAME, f"mmbench_{key.hexdigest()[:16]}.json")
+
+
+def load_manifest(manifest_path: str, workspace: str, plan: RulePlan) -> Dict[str, Any]:
+    """Cached check entries by checker/rule name, or {} if missing or stale."""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if (manifest.get("version") != MANIFEST_VERSION
+            or manifest.get("scorer") != scorer_fingerprint()
+            or manifest.get("rules") != plan.fingerprint
+            or manifest.get("pdf") != pdf_extractor()
+            or manifest.get("workspace") != workspace):
+        return {}
+    return manifest.get("checks", {})
+
+
+def save_manifest(manifest_path: str, workspace: str, plan: RulePlan,
+                  checks: Dict[str, Any]) -> None:
+    """Write the manifest atomically (tmp file + rename)."""
+    Path(manifest_path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            "version": MANIFEST_VERSION,
+            "scorer": scorer_fingerprint(),
+            "rules": plan.fingerprint,
+            "pdf": pdf_extractor(),
+            "workspace": workspace,
+            "checks": checks
+        }, f)
+    os.replace(tmp_path, manifest_path)
+
+
+def inputs_unchanged(entry: Dict[str, Any], catalog: FileCatalog) -> bool:
+    """True if every input recorded in a manifest entry is still the same.
+
+    Query results are compared by digest. Files are compared by size and
+    mtime, falling back to the content hash when only the mtime moved
+    (the entry's stamp is refreshed so the next run doesn't rehash).
+    """
+    for patterns, digest in entry["queries"]:
+        if paths_digest(catalog.find(patterns)) != digest:
+            return False
+    for directory, digest in entry["dirs"]:
+        if paths_digest(catalog.under(directory)) != digest:
+            return False
+
+    for path, stamp in entry["files"].items():
+        if stamp is None:
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        size, mtime_ns, digest = stamp
+        if stat.st_size != size:
+            return False
+        if stat.st_mtime_ns != mtime_ns:
+            if digest is None:
+                return False
+            with open(path, 'rb') as f:
+                if hashlib.sha1(f.read()).hexdigest() != digest:
+                    return False
+            stamp[1] = stat.st_mtime_ns
+
+    return True
+
+
+def score_workspace_incremental(workspace: str, manifest_path: str,
+                                plan: Optional[RulePlan] = None,
+                                profile_dir: Optional[str] = None,
+                                pdf_cache_dir: Optional[str] = None) -> Tuple[Dict[str, Any], List[str]]:
+    """Score a workspace, re-running only checkers and rules whose inputs changed.
+
+    Returns (report, names of the checks reused from the manifest). The
+    report is the same as score_workspace's except for the sections that
+    measure this run, perf and the rules cost profile: there a reused check
+    is marked "cached", with the time spent validating its inputs and no
+    bytes read.
+    """
+    catalog = FileCatalog(workspace, plan, pdf_cache_dir)
+    cached = load_manifest(manifest_path, workspace, catalog.plan)
+    report, reused, checks = rescore_checks(
+        workspace, catalog, cached, lambda name, entry: inputs_unchanged(entry, catalog),
+        profile_dir)
+    save_manifest(manifest_path, workspace, catalog.plan, checks)
+    return report, reused
+
+
+def rescore_checks(workspace: str, catalog: FileCatalog, cached: Dict[str, Any],
+                   reuse: Any, profile_dir: Optional[str] = None
+                   ) -> Tuple[Dict[str, Any], List[str], Dict[str, Any]]:
+    """Run the checks, reusing each cached entry for which reuse(name, entry)
+    is true. Returns (report, reused check names, manifest entries).
+
+    Only perf and the rules cost profile tell reused checks from re-run ones
+    (see score_workspace_incremental).
+    """
+    results = []
+    perf = []
+    reused = []
+    checks = {}
+    for name, run in check_jobs(catalog.plan):
+        entry = cached.get(name)
+        start = time.perf_counter()
+        if entry is not None and reuse(name, entry):
+            reused.append(entry["result"]["check"])
+            perf.append({"check": entry["result"]["check"],
+                         "ms": round(1000 * (time.perf_counter() - start), 3),
+                         "bytes_read": 0, "files_read": 0, "files_touched": 0, "queries": 0,
+                         "cached": True})
+        else:
+            catalog.recorder = CheckInputs()
+            try:
+                result, check_perf = run_check(run, workspace, catalog, profile_dir)
+                entry = catalog.recorder.entry(result)
+            finally:
+                catalog.recorder = None
+            perf.append(check_perf)
+        checks[name] = entry
+        results.append(entry["result"])
+
+    # Copied: the report mustn't alias mutable manifest state
+    report = build_report(workspace, json.loads(json.dumps(results)), catalog, tuple(reused), perf)
+    return report, reused, checks
+
+
+# ============================================================================
+# BATCH MODE
+# ============================================================================
+
+LEADERBOARD_FILENAME = "leaderboard.json"
+
+
+def find_batch_workspaces(workspace_arg: str) -> Dict[str, str]:
+    """Map name -> path for the workspaces under a directory or glob.
+
+    A directory stands for its subdirectories (experiments/ -> every trail);
+    a quoted glob for the directories it matches. Names are the basenames,
+    or relative paths when basenames collide.
+    """
+    if os.path.isdir(workspace_arg):
+        paths = [os.path.join(workspace_arg, d) for d in os.listdir(workspace_arg)]
+    else:
+        paths = glob.glob(workspace_arg)
+    paths = sorted(os.path.normpath(p) for p in paths if os.path.isdir(p))
+
+    names = [os.path.basename(p) for p in paths]
+    unique = len(set(names)) == len(names)
+    return {(name if unique else os.path.relpath(path)): path for name, path in zip(names, paths)}
+
+
+def profile_path(benchmarks_dir: str, report_file: str) -> str:
+    """Directory for a run's per-check cProfile dumps: profiles/<report name>/"""
+    return os.path.join(benchmarks_dir or ".", "profiles", Path(report_file).stem)
+
+
+def report_filename(name: str, stamp: str) -> str:
+    """run_report_<name>_<stamp>.json, with the name made filename-safe."""
+    safe_name = re.sub(r'[^\w.-]+', '_', name)
+    return f"run_report_{safe_name}_{stamp}.json"
+
+
+def score_batch_workspace(name: str, workspace: str, manifest_path: Optional[str],
+                          rules_path: Optional[str] = None,
+                          profile_dir: Optional[str] = None,
+                          pdf_cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Batch worker: score one workspace (incrementally with a manifest path).
+    Returns {"workspace", "report"}, or an error row; one bad workspace
+    doesn't stop the batch."""
+    try:
+        plan = load_rule_plan(rules_path)
+        if manifest_path:
+            report, _ = score_workspace_incremental(workspace, manifest_path, plan,
+                                                    profile_dir, pdf_cache_dir)
+        else:
+            report = score_workspace(workspace, plan, profile_dir, pdf_cache_dir)
+        return {"workspace": name, "report": report}
+    except Exception as e:
+        return {"workspace": name, "error": str(e)[:200]}
+
+
+def record_batch_run(name: str, report: Dict[str, Any], output_path: str,
+                     history: RunHistory) -> Dict[str, Any]:
+    """Add the trend, write the run report, index it and return its leaderboard row."""
+    workspace = report["meta"]["workspace"]
+    report["trend"] = calculate_trend(report, history, workspace)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    history.add(report, os.path.basename(output_path))
+
+    return {
+        "workspace": name,
+        "score": report["score"],
+        "grade": report["summary"]["grade"],
+        "checks_passed": report["summary"]["checks_passed"],
+        "trend": report["trend"]["message"],
+        "runs": history.count(workspace),
+        "best_score": history.best(workspace)["score"],
+        "moving_average": history.moving_average(workspace),
+        "history": [run["score"] for run in history.runs(workspace, limit=10)],
+        "failed_checks": [d["check"] for d in report["deductions"]],
+        "regressions": [r["check"] for r in report["trend"].get("regressions", [])],
+        "checks_ms": report["perf"]["checks_ms"],
+        "report": os.path.basename(output_path)
+    }
+
+
+def build_leaderboard(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Rank workspaces by score (ties by name); failed workspaces go last."""
+    rows = sorted(rows, key=lambda r: ("error" in r, -r.get("score", 0), r["workspace"]))
+    for rank, row in enumerate(rows, 1):
+        if "error" not in row:
+            row["rank"] = rank
+
+    scored = [r for r in rows if "error" not in r]
+    return {
+        "meta": {
+            "generated": datetime.now().isoformat(),
+            "workspaces": len(rows),
+            "version": "1.0"
+        },
+        "best": scored[0]["workspace"] if scored else None,
+        "mean_score": round(sum(r["score"] for r in scored) / len(scored), 1) if scored else None,
+        "improving": [r["workspace"] for r in scored if "↑" in r["trend"]],
+        "declining": [r["workspace"] for r in scored if "↓" in r["trend"]],
+        "workspaces": rows
+    }
+
+
+def batch(workspace_arg: str, benchmarks_dir: str, workers: int = 1,
+          cache: bool = True, rules_path: Optional[str] = None,
+          profile: bool = False) -> Dict[str, Any]:
+    """Score every workspace under a directory or glob in one process pool."""
+
+    print(f"\nMMBench Score - Phase 11 Scorer (batch mode)")
+    print(f"=" * 40)
+    print(f"Workspaces: {workspace_arg}")
+    print(f"Output: {benchmarks_dir}\n")
+
+    workspaces = find_batch_workspaces(workspace_arg)
+    if not workspaces:
+        print(f"  Error: No workspaces found: {workspace_arg}")
+        sys.exit(1)
+    if rules_path:
+        try:
+            plan = load_rule_plan(rules_path)
+        except (OSError, ValueError, RuntimeError) as e:
+            print(f"  Error: Bad rule file {rules_path}: {e}")
+            sys.exit(1)
+        print(f"Rules: {rules_path} ({len(plan.rules)} custom rules)")
+
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    reports = {name: report_filename(name, stamp) for name in workspaces}
+    pdf_cache_dir = pdf_cache_path(benchmarks_dir) if cache else None
+    jobs = [
+        (name, path, default_manifest_path(path, benchmarks_dir) if cache else None, rules_path,
+         profile_path(benchmarks_dir, reports[name]) if profile else None, pdf_cache_dir)
+        for name, path in workspaces.items()
+    ]
+
+    print(f"Scoring {len(jobs)} workspaces...")
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = pool.map(score_batch_workspace, *zip(*jobs))
+    else:
+        results = (score_batch_workspace(*job) for job in jobs)
+
+    # Trends come from the run history; each workspace against its own runs
+    rows = []
+    with RunHistory(benchmarks_dir) as history:
+        for result in results:
+            name = result["workspace"]
+            if "report" in result:
+                output_path = os.path.join(benchmarks_dir, reports[name])
+                result = record_batch_run(name, result["report"], output_path, history)
+            rows.append(result)
+            print(f"  Scored: {name}")
+
+    leaderboard = build_leaderboard(rows)
+    leaderboard_path = os.path.join(benchmarks_dir, LEADERBOARD_FILENAME)
+    with open(leaderboard_path, 'w', encoding='utf-8') as f:
+        json.dump(leaderboard, f, indent=2)
+
+    # Print leaderboard
+    width = max(len("Workspace"), *(len(r["workspace"]) for r in leaderboard["workspaces"]))
+    print(f"\n  {'Rank':>4}  {'Workspace':<{width}}  {'Score':>5}  {'Best':>4}  {'Runs':>4}  Trend")
+    for row in leaderboard["workspaces"]:
+        if "error" in row:
+            print(f"  {'-':>4}  {row['workspace']:<{width}}  Error: {row['error']}")
+        else:
+            print(f"  {row['rank']:>4}  {row['workspace']:<{width}}  {row['score']:>5}  "
+                  f"{row['best_score']:>4}  {row['runs']:>4}  {row['trend']}")
+
+    print(f"\n  Leaderboard saved: {leaderboard_path}")
+    print(f"\n  Done!")
+
+    return leaderboard
+
+
+def show_history(benchmarks_dir: str, workspace: Optional[str] = None) -> None:
+    """Print run history statistics for a benchmarks directory."""
+
+    print(f"\nMMBench Score - Run History")
+    print(f"=" * 40)
+    print(f"Benchmarks: {benchmarks_dir}")
+    if workspace:
+        print(f"Workspace: {workspace}")
+
+    if not os.path.isdir(benchmarks_dir):
+        print(f"  Error: Benchmarks directory not found: {benchmarks_dir}")
+        sys.exit(1)
+
+    with RunHistory(benchmarks_dir) as history:
+        runs = history.runs(workspace, limit=10)
+        if not runs:
+            print(f"\n  No runs recorded")
+            return
+
+        best = history.best(workspace)
+        print(f"\n  Runs: {history.count(workspace)}")
+        print(f"  Best: {best['score']} ({best['file']})")
+        print(f"  Moving avg ({TREND_WINDOW} runs): {history.moving_average(workspace)}")
+
+        print(f"\n  Recent runs:")
+        for run in runs:
+            print(f"    {run['date'][:19]}  {run['score']:>3}  {run['file']}")
+
+        print(f"\n  Best-ever check scores:")
+        for name, score in history.best_check_scores(workspace).items():
+            print(f"    - {name}: {score}/{SCORING_WEIGHTS.get(name, '?')}")
+
+        timings = history.check_timings(workspace)
+        if timings:
+            print(f"\n  Slowest checks (ms, last {TREND_WINDOW} timed runs):")
+            print(f"    {'Check':<28} {'Avg':>9} {'Max':>9} {'Last':>9}")
+            for t in timings[:10]:
+                print(f"    {t['check']:<28} {t['avg_ms']:>9.2f} {t['max_ms']:>9.2f} {t['last_ms']:>9.2f}")
+
+        regressions = history.regressions(workspace, limit=10)
+        if regressions:
+            print(f"\n  Recent regressions:")
+            for r in regressions:
+                print(f"    {r['date'][:19]}  {r['check']}: {r['previous']} → {r['score']}  ({r['file']})")
+
+
+# ============================================================================
+# WATCH MODE
+# ============================================================================
+
+WATCH_INTERVAL = 0.5  # Seconds between polls
+
+
+def snapshot_workspace(workspace: str) -> Tuple[List[Tuple[str, List[str]]], Dict[str, Tuple[int, int]]]:
+    """One walk of the workspace: the listing (for FileCatalog) and the
+    size and mtime of every file in it."""
+    listing = []
+    stamps = {}
+    for root, _, files in os.walk(workspace):
+        present = []
+        for filename in files:
+            path = os.path.join(root, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # Removed (or an editor's temp file) mid-walk
+            stamps[path] = (stat.st_size, stat.st_mtime_ns)
+            present.append(filename)
+        listing.append((root, present))
+    return listing, stamps
+
+
+def check_dependencies(checks: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Dependency map of each check's last run: the glob patterns it queried,
+    the directories it listed and the files it read."""
+    return {
+        name: {
+            "patterns": sorted({p for patterns, _ in entry["queries"] for p in patterns}),
+            "dirs": [directory for directory, _ in entry["dirs"]],
+            "files": set(entry["files"])
+        }
+        for name, entry in checks.items()
+    }
+
+
+def affected_checks(workspace: str, dependencies: Dict[str, Dict[str, Any]],
+                    modified: set, listed: set) -> List[str]:
+    """Checks to re-run: those that read a modified file, or whose patterns
+    or directories match a file that was added or removed."""
+    affected = []
+    for name, deps in dependencies.items():
+        dirs = [os.path.normpath(os.path.join(workspace, d)) for d in deps["dirs"]]
+        if (modified & deps["files"] or listed & deps["files"]
+                or any(compile_glob(p).match(os.path.basename(path).lower())
+                       for path in listed for p in deps["patterns"])
+                or any(path.startswith(top + os.sep) for path in listed for top in dirs)):
+            affected.append(name)
+    return affected
+
+
+def watch_step(workspace: str, plan: RulePlan, stamps: Dict[str, Tuple[int, int]],
+               checks: Dict[str, Any], pdf_cache_dir: Optional[str] = None
+               ) -> Tuple[Dict[str, Tuple[int, int]], Dict[str, Any], List[str], Optional[Dict[str, Any]]]:
+    """One poll of watch(): re-stat the workspace and re-run the checks the
+    changes since stamps affect. Returns (stamps, manifest entries, affected
+    check names, report); the report is None when nothing had to be re-run."""
+    listing, current = snapshot_workspace(workspace)
+    if current == stamps:
+        return stamps, checks, [], None
+    listed = current.keys() ^ stamps.keys()
+    modified = {path for path, stamp in current.items()
+                if path in stamps and stamps[path] != stamp}
+
+    affected = affected_checks(workspace, check_dependencies(checks), modified, listed)
+    if not affected:
+        return current, checks, [], None
+
+    catalog = FileCatalog(workspace, plan, pdf_cache_dir, listing)
+    report, _, checks = rescore_checks(
+        workspace, catalog, checks, lambda name, entry: name not in affected)
+    return current, checks, affected, report
+
+
+def watch(workspace: str, output_path: str, cache: bool = True,
+          rules_path: Optional[str] = None, interval: float = WATCH_INTERVAL) -> None:
+    """Poll a workspace and rescore on every change until interrupted.
+
+    Only the checks whose dependencies changed are re-run; the others keep
+    their results. Each rescore rewrites output_path (not indexed in the run
+    history) and prints a score line. With cache, the manifest is loaded at
+    start and saved on exit, so a normal run afterwards reuses the results.
+    """
+
+    print(f"\nMMBench Score - Phase 11 Scorer (watch mode)")
+    print(f"=" * 40)
+    print(f"Workspace: {workspace}")
+    print(f"Output: {output_path}\n")
+
+    if not os.path.isdir(workspace):
+        print(f"  Error: Workspace not found: {workspace}")
+        sys.exit(1)
+    try:
+        plan = load_rule_plan(rules_path)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"  Error: Bad rule file {rules_path}: {e}")
+        sys.exit(1)
+    if rules_path:
+        print(f"Rules: {rules_path} ({len(plan.rules)} custom rules)")
+
+    benchmarks_dir = os.path.dirname(output_path)
+    manifest_path = default_manifest_path(workspace, benchmarks_dir) if cache else None
+    pdf_cache_dir = pdf_cache_path(benchmarks_dir) if cache else None
+
+    def write(report: Dict[str, Any]) -> None:
+        tmp_path = f"{output_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        os.replace(tmp_path, output_path)
+
+    listing, stamps = snapshot_workspace(workspace)
+    catalog = FileCatalog(workspace, plan, pdf_cache_dir, listing)
+    cached = load_manifest(manifest_path, workspace, plan) if manifest_path else {}
+    report, _, checks = rescore_checks(
+        workspace, catalog, cached, lambda name, entry: inputs_unchanged(entry, catalog))
+    write(report)
+    print(f"  [{datetime.now():%H:%M:%S}] Score: {report['score']}/100 "
+          f"({report['summary']['grade']})  watching every {interval}s, Ctrl+C to stop")
+
+    try:
+        while True:
+            time.sleep(interval)
+            start = time.perf_counter()
+            stamps, checks, affected, rescored = watch_step(workspace, plan, stamps, checks,
+                                                            pdf_cache_dir)
+            if rescored is None:
+                continue
+
+            previous = {c["check"]: c["score"] for c in report["checks"]}
+            report = rescored
+            write(report)
+
+            changes = [f"{c['check']} {previous.get(c['check'], 0)}→{c['score']}"
+                       for c in report["checks"] if c["score"] != previous.get(c["check"])]
+            print(f"  [{datetime.now():%H:%M:%S}] Score: {report['score']}/100 "
+                  f"({report['summary']['grade']})  {len(affected)} checks rescored in "
+                  f"{1000 * (time.perf_counter() - start):.0f} ms"
+                  + (f"; {', '.join(changes)}" if changes else ""))
+    except KeyboardInterrupt:
+        print(f"\n  Stopped. Last report: {output_path}")
+    finally:
+        if manifest_path:
+            save_manifest(manifest_path, workspace, plan, checks)
+
+
+# ============================================================================
+# IN-PROCESS API
+# ============================================================================
+
+@dataclass
+class CheckResult:
+    """One check's outcome (built-in checker or custom rule)."""
+
+    check: str
+    passed: bool
+    score: int
+    max_score: int
+    details: Dict[str, Any]
+    cached: bool = False  # Reused from an earlier WorkspaceScorer.score() call
+
+    @property
+    def message(self) -> str:
+        return self.details.get("message", "")
+
+
+@dataclass
+class ScoreResult:
+    """What WorkspaceScorer.score() returns: the checks asked for, in order."""
+
+    checks: List[CheckResult]
+    ms: float
+
+    @property
+    def score(self) -> int:
+        return sum(c.score for c in self.checks)
+
+    @property
+    def max_score(self) -> int:
+        return sum(c.max_score for c in self.checks)
+
+    @property
+    def passed(self) -> bool:
+        return all(c.passed for c in self.checks)
+
+    def __getitem__(self, check: str) -> CheckResult:
+        for result in self.checks:
+            if result.check == check:
+                return result
+        raise KeyError(check)
+
+
+class WorkspaceScorer:
+    """Scores one workspace repeatedly in the same process (judge gates,
+    time_tracker validation) without a subprocess and a JSON round trip.
+
+    The file catalog, loaded documents and check results are kept between
+    calls. Each call re-stats the workspace in one walk; only the checks
+    whose inputs changed are re-run, and only modified files are re-read.
+    """
+
+    def __init__(self, workspace: str, rules_path: Optional[str] = None,
+                 pdf_cache_dir: Optional[str] = None):
+        self.workspace = workspace
+        self.plan = load_rule_plan(rules_path)
+        self.pdf_cache_dir = pdf_cache_dir
+        self.jobs = dict(check_jobs(self.plan))
+        self.catalog: Optional[FileCatalog] = None
+        self._stamps: Dict[str, Tuple[int, int]] = {}
+        self._entries: Dict[str, Dict[str, Any]] = {}  # Manifest entries by job name
+        self._perf: Dict[str, Dict[str, Any]] = {}
+
+    def _job(self, check: str) -> str:
+        """Job name for a check name ("memo_exists", "check_memo_exists" or a rule name)."""
+        for name in (check, f"check_{check}", f"rule:{check}"):
+            if name in self.jobs:
+                return name
+        raise ValueError(f"Unknown check: {check}")
+
+    def refresh(self) -> None:
+        """Re-stat the workspace; drop the results and documents it invalidates."""
+        listing, stamps = snapshot_workspace(self.workspace)
+        if self.catalog is not None and stamps == self._stamps:
+            return
+
+        listed = stamps.keys() ^ self._stamps.keys()
+        modified = {path for path, stamp in stamps.items()
+                    if path in self._stamps and self._stamps[path] != stamp}
+        for name in affected_checks(self.workspace, check_dependencies(self._entries),
+                                    modified, listed):
+            del self._entries[name]
+
+        previous = self.catalog
+        self.catalog = FileCatalog(self.workspace, self.plan, self.pdf_cache_dir, listing)
+        if previous is not None:
+            self.catalog.documents.adopt(previous.documents, stamps.keys() - modified)
+        self._stamps = stamps
+
+    def score(self, checks: Optional[List[str]] = None) -> ScoreResult:
+        """Run the given checks (default: all) and return their results."""
+        start = time.perf_counter()
+        names = [self._job(check) for check in checks] if checks is not None else list(self.jobs)
+        self.refresh()
+
+        results = []
+        for name in names:
+            entry = self._entries.get(name)
+            cached = entry is not None
+            if not cached:
+                self.catalog.recorder = CheckInputs()
+                try:
+                    result, self._perf[name] = run_check(self.jobs[name], self.workspace, self.catalog)
+                    entry = self._entries[name] = self.catalog.recorder.entry(result)
+                finally:
+                    self.catalog.recorder = None
+            result = entry["result"]
+            results.append(CheckResult(result["check"], result["passed"], result["score"],
+                                       result["max_score"], json.loads(json.dumps(result["details"])),
+                                       cached))
+        return ScoreResult(results, round(1000 * (time.perf_counter() - start), 3))
+
+    def report(self) -> Dict[str, Any]:
+        """Full report, as score_workspace builds it (perf: each check's last run)."""
+        self.score()
+        results = [self._entries[name]["result"] for name in self.jobs]
+        perf = [self._perf[name] for name in self.jobs]
+        return build_report(self.workspace, json.loads(json.dumps(results)), self.catalog, perf=perf)
+
+
 # ============================================================================
 # MAIN FUNCTION
 # ============================================================================
 
-def main(workspace: str, output_path: str) -> None:
+def main(workspace: str, output_path: str, cache: bool = True,
+         rules_path: Optional[str] = None, profile: bool = False) -> None:
     """Main scoring pipeline."""
 
     print(f"\nMMBench Score - Phase 11 Scorer")
@@ -739,19 +2330,44 @@ def main(workspace: str, output_path: str) -> None:
         print(f"  Error: Workspace not found: {workspace}")
         sys.exit(1)
 
+    # Compile the rules
+    try:
+        plan = load_rule_plan(rules_path)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"  Error: Bad rule file {rules_path}: {e}")
+        sys.exit(1)
+    if rules_path:
+        print(f"Rules: {rules_path} ({len(plan.rules)} custom rules, "
+              f"{len(plan.patterns)} distinct content patterns)")
+
     # Score workspace
     print("Running checks...")
-    report = score_workspace(workspace)
-
-    # Load previous runs for trend
     benchmarks_dir = os.path.dirname(output_path)
-    previous_runs = load_previous_runs(benchmarks_dir)
-    report["trend"] = calculate_trend(report["score"], previous_runs)
+    profile_dir = profile_path(benchmarks_dir, output_path) if profile else None
+    if cache:
+        report, reused = score_workspace_incremental(
+            workspace, default_manifest_path(workspace, benchmarks_dir), plan, profile_dir,
+            pdf_cache_path(benchmarks_dir))
+        print(f"  Reused: {len(reused)}/{len(report['checks'])} checks with unchanged inputs")
+    else:
+        report = score_workspace(workspace, plan, profile_dir)
 
-    # Write output
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2)
+    perf = report["perf"]
+    print(f"  Time: {perf['checks_ms']:.1f} ms in checks, {perf['catalog_ms']:.1f} ms indexing "
+          f"{perf['files']:,} files; {perf['bytes_read']:,} bytes read")
+    slowest = sorted(perf["checks"], key=lambda p: -p["ms"])[:3]
+    print(f"  Slowest: " + ", ".join(f"{p['check']} {p['ms']:.1f} ms" for p in slowest))
+    if profile_dir:
+        print(f"  Profiles: {profile_dir}/<check>.prof")
+
+    # Trend against the run history, then record this run in it
+    with RunHistory(benchmarks_dir) as history:
+        report["trend"] = calculate_trend(report, history)
+
+        # Write output
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        history.add(report, os.path.basename(output_path))
 
     # Print summary
     print(f"\n  Results:")
@@ -760,14 +2376,30 @@ def main(workspace: str, output_path: str) -> None:
     print(f"  Grade: {report['summary']['grade']}")
     print(f"  Status: {report['summary']['status']}")
     print(f"  Trend: {report['trend']['message']}")
+    if report["trend"].get("moving_average") is not None:
+        print(f"  Moving avg ({TREND_WINDOW} runs): {report['trend']['moving_average']}"
+              f" | Best: {report['trend']['best_score']}")
     print(f"  {'='*30}")
 
+    # Print per-check regressions
+    if report["trend"].get("regressions"):
+        print(f"\n  Regressions since last run:")
+        for r in report["trend"]["regressions"]:
+            print(f"    - {r['check']}: {r['previous']} → {r['score']}")
+
     # Print deductions
     if report["deductions"]:
         print(f"\n  Deductions:")
         for d in report["deductions"][:5]:
             print(f"    - {d['check']}: -{d['deduction']} ({d['message'][:50]})")
 
+    # Print rule costs
+    if "rules" in report:
+        print(f"\n  Rule cost (ms):")
+        for entry in report["rules"]["cost"][:5]:
+            cached = " (cached)" if entry.get("cached") else ""
+            print(f"    - {entry['rule']}: {entry['ms']:.2f}{cached}")
+
     # Print recommendations
     if report["recommendations"]:
         print(f"\n  Recommendations:")
@@ -780,16 +2412,107 @@ def main(workspace: str, output_path: str) -> None:
 
 
 if __name__ == "__main__":
-    if len(sys.argv) >= 3:
-        main(sys.argv[1], sys.argv[2])
+    parser = argparse.ArgumentParser(
+        description="MMBench Score: rule-based scoring for MCM/ICM papers (Phase 11)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Example:
+  python mmbench_score.py workspace/2025_C/ benchmarks/run_report_20260124.json
+  python mmbench_score.py --batch "experiments/trail-*" benchmarks/
+  python mmbench_score.py --batch experiments/ benchmarks/ --workers 4
+  python mmbench_score.py --history benchmarks/ [workspace/2025_C/]
+  python mmbench_score.py --watch workspace/2025_C/ benchmarks/live_report.json
+
+--batch takes a directory (each subdirectory is a workspace) or a quoted
+glob of workspaces and a benchmarks directory. It writes
+run_report_<workspace>_<timestamp>.json per workspace, with the trend
+against that workspace's earlier reports, and leaderboard.json ranking
+them.
+
+Every run is indexed in history.sqlite in the benchmarks directory (per-run
+and per-check scores; existing run_report_*.json files are imported once).
+Trends report the change since the last run, the moving average, the
+best-ever score and checks that lost points; --history prints the same
+statistics for a benchmarks directory, optionally for one workspace.
+
+Check results are cached in .cache/ under the benchmarks directory with
+a manifest of each checker's inputs (catalog queries, and the files it read
+with size, mtime and hash): a rerun only re-executes checkers whose inputs
+changed and reuses the rest. The report is the same as a full run's except
+for the measured perf and rule cost sections, where reused checks are
+marked "cached". --no-cache runs every checker.
+
+PDF papers (paper.pdf with no paper.tex/.md next to it) are scored like
+text papers when PyMuPDF or pdfplumber is installed (pip install pymupdf);
+extracted text is cached in .cache/pdf_text/ by PDF content hash, so a PDF
+is extracted once however often it is rescored. Without either library a
+PDF memo only gets credit for existing.
+
+--watch polls the workspace (every --interval seconds) and, on each change,
+re-runs only the checks that depend on it: the ones that read a modified
+file, or whose file patterns or directories match a file that was added or
+removed. The report file is rewritten and a score line printed each time;
+watch reports are not added to the run history.
+
+--rules takes a YAML (or JSON) rule file, compiled once into a rule plan:
+it can override weights, thresholds, file_patterns and the content pattern
+sets, and add rules scored like the built-in checks (weights must still sum
+to 100):
+
+  weights: {documentation: 0, narrative_arc: 5}
+  rules:
+    - {name: data_sources, weight: 5, content: ["data source", "doi:"], min_matches: 2}
+    - {name: results_tables, weight: 5, files: ["results*.csv"]}
+
+Reports have a perf section: catalog indexing time and, per check, time,
+bytes and files read, files touched and catalog queries; per-check times
+are kept in the run history (--history lists the slowest checks).
+--profile also runs each check under cProfile and dumps
+profiles/<report>/<check>.prof in the benchmarks directory (read them with
+python -m pstats).
+
+Content patterns are shared by every rule and check that uses them and
+evaluated once per document; the report's rules section has the measured
+cost of each rule and pattern set (timings vary between runs).
+
+Scoring Criteria:
+""" + "\n".join(f"  - {check}: {weight} points" for check, weight in SCORING_WEIGHTS.items())
+    + f"\n  Total: {sum(SCORING_WEIGHTS.values())} points\n"
+    )
+    parser.add_argument("workspace", nargs="?",
+                        help="Workspace to score (directory or glob of workspaces with --batch)")
+    parser.add_argument("output_json", nargs="?",
+                        help="Where to write the report JSON (benchmarks directory with --batch)")
+    parser.add_argument("--batch", action="store_true",
+                        help="Score many workspaces concurrently and rank them")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Processes for --batch (default: 0 = all cores)")
+    parser.add_argument("--history", metavar="BENCHMARKS_DIR",
+                        help="Show run history statistics (optionally for the given workspace)")
+    parser.add_argument("--rules", metavar="RULES_FILE",
+                        help="YAML/JSON rule file: overrides and custom scoring rules")
+    parser.add_argument("--profile", action="store_true",
+                        help="Dump cProfile stats per check under <benchmarks>/profiles/")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Run every checker instead of reusing unchanged results")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep rescoring the workspace as files change (Ctrl+C to stop)")
+    parser.add_argument("--interval", type=float, default=WATCH_INTERVAL,
+                        help=f"Seconds between polls for --watch (default: {WATCH_INTERVAL})")
+
+    args = parser.parse_args()
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+
+    if args.history:
+        show_history(args.history, args.workspace)
+    elif args.workspace and args.output_json:
+        if args.watch:
+            watch(args.workspace, args.output_json, not args.no_cache, args.rules, args.interval)
+        elif args.batch:
+            batch(args.workspace, args.output_json, workers, not args.no_cache, args.rules,
+                  args.profile)
+        else:
+            main(args.workspace, args.output_json, not args.no_cache, args.rules, args.profile)
     else:
-        print("Usage: python mmbench_score.py <workspace_path> <output_json>")
-        print("")
-        print("Example:")
-        print("  python mmbench_score.py workspace/2025_C/ benchmarks/run_report_20260124.json")
-        print("")
-        print("Scoring Criteria:")
-        for check, weight in SCORING_WEIGHTS.items():
-            print(f"  - {check}: {weight} points")
-        print(f"  Total: {sum(SCORING_WEIGHTS.values())} points")
+        parser.print_help()
         sys.exit(1)
@@ -7,6 +7,7 @@ Usage:
 
 Example:
     python style_analyzer.py reference_papers/ knowledge_library/academic_writing/style_guide.md
+    python style_analyzer.py reference_papers/ style_guide.md --workers 4
 
 This script analyzes O-Prize winning papers to extract:
 1. High-frequency academic verbs and vocabulary
@@ -24,10 +25,14 @@ import os
 import re
 import sys
 import json
+import gzip
+import hashlib
+import argparse
 from pathlib import Path
 from datetime import datetime
 from collections import Counter, defaultdict
 from typing import Dict, List, Tuple, Optional, Any
+from concurrent.futures import ProcessPoolExecutor
 
 # Try to import optional dependencies
 try:
@@ -39,6 +44,8 @@ except ImportError:
 
 try:
     import spacy
+    from spacy.matcher import PhraseMatcher
+    from spacy.tokens import DocBin
     HAS_SPACY = True
 except ImportError:
     HAS_SPACY = False
@@ -86,28 +93,158 @@ IMPLICATION_MARKERS = [
     "pointing to", "confirming that", "revealing that"
 ]
 
+# Set lookups for the vocabulary pass (a word is counted in the first class it is in)
+VERB_CLASSES = (
+    ("high", frozenset(ACADEMIC_VERBS_HIGH)),
+    ("medium", frozenset(ACADEMIC_VERBS_MEDIUM)),
+    ("weak", frozenset(WEAK_VERBS)),
+)
+CONNECTOR_SET = frozenset(ACADEMIC_CONNECTORS)
+VERB_WORDS = frozenset().union(*(words for _, words in VERB_CLASSES))
+TRACKED_WORDS = CONNECTOR_SET | VERB_WORDS
+
+WORD_PATTERN = re.compile(r'\b[a-z]+\b')
+
+
+def marker_pattern(markers: List[str]) -> Any:
+    """One case-insensitive whole-word regex for a marker list."""
+    return re.compile(r'\b(?:' + '|'.join(map(re.escape, markers)) + r')\b', re.IGNORECASE)
+
+
+OBSERVATION_PATTERN = marker_pattern(OBSERVATION_MARKERS)
+IMPLICATION_PATTERN = marker_pattern(IMPLICATION_MARKERS)
+
+# Sentence splitting without spaCy: end punctuation followed by whitespace and
+# a capital, digit or opening quote/bracket, unless it ends an abbreviation
+# ("No." only before a number: "No. 3", but "No. Yes it is." is two sentences)
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+(?=["\'(\[]?[A-Z0-9])')
+ABBREVIATION_END = re.compile(
+    r'\b(?:e\.g|i\.e|et al|etc|vs|cf|approx|resp|fig|figs|eq|eqs|sec|tab|ref)\.$',
+    re.IGNORECASE
+)
+NUMBER_ABBREVIATION_END = re.compile(r'\bno\.$', re.IGNORECASE)
+
 
 # ============================================================================
 # TEXT EXTRACTION
 # ============================================================================
 
+EXTRACTION_VERSION = 1  # Bump when extract_pdf_pages output changes
+CACHE_DIRNAME = ".cache"
+
+
+def extract_pdf_pages(pdf_path: str) -> Tuple[str, List[int]]:
+    """Text of a PDF (non-empty pages joined by newlines) and the offset in
+    it where each page starts. Raises on unreadable PDFs."""
+    text_parts = []
+    page_offsets = []
+    offset = 0
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            page_offsets.append(offset)
+            page_text = page.extract_text()
+            if page_text:
+                text_parts.append(page_text)
+                offset += len(page_text) + 1
+    return '\n'.join(text_parts), page_offsets
+
+
 def extract_text_from_pdf(pdf_path: str) -> str:
     """Extract text from a PDF file."""
     if not HAS_PDFPLUMBER:
         return ""
 
-    text_parts = []
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
+        return extract_pdf_pages(pdf_path)[0]
     except Exception as e:
         print(f"  Warning: Could not read {pdf_path}: {e}")
         return ""
 
-    return '\n'.join(text_parts)
+
+def extract_pdf_job(pdf_path: str) -> Dict[str, Any]:
+    """Process pool worker: extract one PDF; errors are returned, not raised."""
+    try:
+        text, page_offsets = extract_pdf_pages(pdf_path)
+        return {"text": text, "page_offsets": page_offsets}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def default_cache_dir(output_path: str, name: str = "style_text") -> str:
+    """Cache next to the style guide: <output dir>/.cache/<name>"""
+    return os.path.join(os.path.dirname(output_path) or ".", CACHE_DIRNAME, name)
+
+
+def pdf_digest(pdf_path: str) -> str:
+    """Content hash keying a PDF in the extraction cache."""
+    with open(pdf_path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def load_extraction(cache_dir: str, digest: str) -> Optional[Dict[str, Any]]:
+    """Cached {"text", "page_offsets"} for a PDF hash, or None."""
+    try:
+        with gzip.open(os.path.join(cache_dir, f"{digest}.json.gz"), 'rt', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, EOFError, ValueError):
+        return None
+    if entry.get("version") != EXTRACTION_VERSION:
+        return None
+    return entry
+
+
+def save_extraction(cache_dir: str, digest: str, entry: Dict[str, Any]) -> None:
+    """Store an extraction gzip-compressed, atomically (tmp file + rename).
+    The tmp file is per process: shard workers may extract the same PDF."""
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    cache_path = os.path.join(cache_dir, f"{digest}.json.gz")
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        json.dump({"version": EXTRACTION_VERSION, "text": entry["text"],
+                   "page_offsets": entry["page_offsets"]}, f)
+    os.replace(tmp_path, cache_path)
+
+
+def extract_pdfs(pdf_paths: List[str], cache_dir: Optional[str] = None,
+                 workers: int = 1) -> Dict[str, Dict[str, Any]]:
+    """Extract many PDFs: cached ones (by content hash) are loaded, the rest
+    extracted across a process pool and added to the cache.
+
+    Returns {"text", "page_offsets"} by path; unreadable PDFs are left out.
+    """
+    extracted = {}
+    missing = []
+    digests = {}
+    for path in pdf_paths:
+        if cache_dir:
+            digests[path] = pdf_digest(path)
+            entry = load_extraction(cache_dir, digests[path])
+            if entry is not None:
+                extracted[path] = entry
+                continue
+        missing.append(path)
+
+    if missing and not HAS_PDFPLUMBER:
+        print(f"  Warning: {len(missing)} PDFs not in the cache and pdfplumber not installed")
+        return extracted
+
+    if missing:
+        print(f"  Extracting {len(missing)} PDFs ({len(extracted)} cached)...")
+    if workers > 1 and len(missing) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(missing))) as pool:
+            results = list(pool.map(extract_pdf_job, missing))
+    else:
+        results = [extract_pdf_job(path) for path in missing]
+
+    for path, entry in zip(missing, results):
+        if "error" in entry:
+            print(f"  Warning: Could not read {path}: {entry['error']}")
+            continue
+        extracted[path] = entry
+        if cache_dir:
+            save_extraction(cache_dir, digests[path], entry)
+
+    return extracted
 
 
 def extract_text_from_txt(txt_path: str) -> str:
@@ -125,63 +262,206 @@ def extract_text_from_md(md_path: str) -> str:
     return extract_text_from_txt(md_path)
 
 
-def load_papers(directory: str) -> List[Dict[str, str]]:
-    """Load all papers from a directory."""
+def load_paper_text(filepath: str, cache_dir: Optional[str] = None) -> str:
+    """Text of one paper (PDFs through the extraction cache when cache_dir is given)."""
+    if not filepath.endswith('.pdf'):
+        return extract_text_from_txt(filepath)
+
+    digest = pdf_digest(filepath) if cache_dir else None
+    entry = load_extraction(cache_dir, digest) if cache_dir else None
+    if entry is None:
+        if not HAS_PDFPLUMBER:
+            return ""
+        entry = extract_pdf_job(filepath)
+        if "error" in entry:
+            print(f"  Warning: Could not read {filepath}: {entry['error']}")
+            return ""
+        if cache_dir:
+            save_extraction(cache_dir, digest, entry)
+    return entry["text"]
+
+
+def load_papers(directory: str, cache_dir: Optional[str] = None,
+                workers: int = 1) -> List[Dict[str, Any]]:
+    """Load all papers from a directory.
+
+    PDFs are extracted through extract_pdfs (in parallel, with the cache
+    when cache_dir is given); "page_offsets" has where each page starts.
+    """
+    files = []
+    for root, dirs, filenames in os.walk(directory):
+        dirs[:] = [d for d in dirs if d != CACHE_DIRNAME]
+        for filename in filenames:
+            if filename.endswith(('.pdf', '.txt', '.md')):
+                files.append((filename, os.path.join(root, filename)))
+
+    extracted = extract_pdfs(
+        [filepath for filename, filepath in files if filename.endswith('.pdf')],
+        cache_dir, workers
+    )
+
     papers = []
+    for filename, filepath in files:
+        if filename.endswith('.pdf'):
+            entry = extracted.get(filepath, {"text": "", "page_offsets": []})
+            text, page_offsets = entry["text"], entry["page_offsets"]
+        elif filename.endswith('.txt'):
+            text, page_offsets = extract_text_from_txt(filepath), [0]
+        else:
+            text, page_offsets = extract_text_from_md(filepath), [0]
+
+        if text.strip():
+            papers.append({
+                "filename": filename,
+                "path": filepath,
+                "text": text,
+                "page_offsets": page_offsets
+            })
+            print(f"    Loaded: {filename} ({len(text)} chars)")
 
-    for root, dirs, files in os.walk(directory):
-        for filename in files:
-            filepath = os.path.join(root, filename)
-
-            if filename.endswith('.pdf'):
-                text = extract_text_from_pdf(filepath)
-            elif filename.endswith('.txt'):
-                text = extract_text_from_txt(filepath)
-            elif filename.endswith('.md'):
-                text = extract_text_from_md(filepath)
-            else:
-                continue
+    return papers
 
-            if text.strip():
-                papers.append({
-                    "filename": filename,
-                    "path": filepath,
-                    "text": text
-                })
-                print(f"    Loaded: {filename} ({len(text)} chars)")
 
-    return papers
+# ============================================================================
+# NLP PIPELINE (optional: spaCy)
+# ============================================================================
+
+SPACY_MODEL = "en_core_web_sm"
+SPACY_BATCH_SIZE = 4  # Papers are long; small batches keep memory flat
+
+
+def load_nlp() -> Optional[Any]:
+    """The spaCy pipeline with only what the analysis uses (tagger and
+    lemmatizer for verbs, senter for sentences), or None without spaCy."""
+    if not HAS_SPACY:
+        return None
+    try:
+        nlp = spacy.load(SPACY_MODEL, exclude=["ner", "parser"])
+    except OSError:
+        print(f"  Warning: spaCy model missing: python -m spacy download {SPACY_MODEL}")
+        return None
+
+    if "senter" in nlp.disabled:
+        nlp.enable_pipe("senter")
+    elif not nlp.has_pipe("senter"):
+        nlp.add_pipe("sentencizer")
+    return nlp
+
+
+def marker_matcher(nlp: Any) -> Any:
+    """PhraseMatcher (case-insensitive) labelling OBSERVATION and IMPLICATION markers."""
+    matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+    matcher.add("OBSERVATION", [nlp.make_doc(m) for m in OBSERVATION_MARKERS])
+    matcher.add("IMPLICATION", [nlp.make_doc(m) for m in IMPLICATION_MARKERS])
+    return matcher
+
+
+def nlp_cache_key(nlp: Any, text: str) -> str:
+    """DocBin cache key: the pipeline (model, version, components) and the text."""
+    pipeline = f"{nlp.meta.get('name')}-{nlp.meta.get('version')}-{spacy.__version__}-{nlp.pipe_names}"
+    return hashlib.sha1(f"{pipeline}\n{text}".encode('utf-8', errors='surrogateescape')).hexdigest()
+
+
+def parse_papers(texts: List[str], nlp: Any, cache_dir: Optional[str] = None,
+                 workers: int = 1) -> List[Any]:
+    """spaCy docs for the papers: cached ones loaded from <cache_dir>/<key>.spacy
+    (DocBin), the rest parsed with nlp.pipe across workers processes and
+    added to the cache."""
+    docs: List[Any] = [None] * len(texts)
+    keys = [nlp_cache_key(nlp, text) for text in texts] if cache_dir else []
+    missing = []
+    for i, text in enumerate(texts):
+        if cache_dir:
+            cache_path = os.path.join(cache_dir, f"{keys[i]}.spacy")
+            if os.path.exists(cache_path):
+                try:
+                    docs[i] = next(DocBin().from_disk(cache_path).get_docs(nlp.vocab))
+                    continue
+                except Exception:
+                    pass  # Unreadable entry: parse again
+        missing.append(i)
+
+    if missing:
+        print(f"  Parsing {len(missing)} papers with spaCy ({len(texts) - len(missing)} cached)...")
+        nlp.max_length = max(nlp.max_length, max(len(texts[i]) for i in missing) + 1)
+        parsed = nlp.pipe((texts[i] for i in missing), batch_size=SPACY_BATCH_SIZE,
+                          n_process=min(workers, len(missing)))
+        for i, doc in zip(missing, parsed):
+            docs[i] = doc
+            if cache_dir:
+                Path(cache_dir).mkdir(parents=True, exist_ok=True)
+                cache_path = os.path.join(cache_dir, f"{keys[i]}.spacy")
+                doc_bin = DocBin(attrs=["LEMMA", "POS", "SENT_START"])
+                doc_bin.add(doc)
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"  # Shards may parse the same paper
+                doc_bin.to_disk(tmp_path)
+                os.replace(tmp_path, cache_path)
+
+    return docs
+
+
+def count_pos_verbs(doc: Any) -> Counter:
+    """Tracked verbs used as verbs (POS VERB), counted by lemma."""
+    return Counter(
+        lemma for lemma in (token.lemma_.lower() for token in doc if token.pos_ == "VERB")
+        if lemma in VERB_WORDS
+    )
 
 
 # ============================================================================
 # ANALYSIS FUNCTIONS
 # ============================================================================
 
-def analyze_vocabulary(texts: List[str]) -> Dict[str, Any]:
-    """Analyze vocabulary usage patterns."""
+def count_vocabulary(text: str) -> Tuple[int, Counter]:
+    """One tokenization pass over a paper: its word count and the counts of
+    the tracked verbs and connectors (whole words, first occurrence order)."""
+    words = WORD_PATTERN.findall(text.lower())
+    counts = Counter(words)
+    return len(words), Counter({w: c for w, c in counts.items() if w in TRACKED_WORDS})
+
+
+def vocabulary_record(text: str, doc: Optional[Any] = None) -> Dict[str, Any]:
+    """A paper's word count and tracked word counts. With its spaCy doc,
+    verbs are counted by lemma where tagged VERB ("demonstrated" counts,
+    the noun "use" does not)."""
+    word_count, counts = count_vocabulary(text)
+    if doc is not None:
+        counts = Counter({w: c for w, c in counts.items() if w not in VERB_WORDS})
+        counts.update(count_pos_verbs(doc))
+    return {
+        "words": word_count,
+        "counts": dict(counts),
+        "verb_counting": "pos" if doc is not None else "tokens"
+    }
+
 
-    combined_text = ' '.join(texts).lower()
-    words = re.findall(r'\b[a-z]+\b', combined_text)
-    word_count = len(words)
+def merge_vocabulary(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Vocabulary statistics from per-paper records (merged in paper order)."""
 
-    # Count academic verbs
-    high_verb_counts = Counter()
-    medium_verb_counts = Counter()
-    weak_verb_counts = Counter()
+    word_count = 0
+    counts = Counter()
+    for record in records:
+        word_count += record["words"]
+        counts.update(record["counts"])
 
-    for word in words:
-        if word in ACADEMIC_VERBS_HIGH:
-            high_verb_counts[word] += 1
-        elif word in ACADEMIC_VERBS_MEDIUM:
-            medium_verb_counts[word] += 1
-        elif word in WEAK_VERBS:
-            weak_verb_counts[word] += 1
+    # Split into the verb classes
+    by_class = {name: Counter() for name, _ in VERB_CLASSES}
+    for word, count in counts.items():
+        for name, words in VERB_CLASSES:
+            if word in words:
+                by_class[name][word] = count
+                break
+    high_verb_counts = by_class["high"]
+    medium_verb_counts = by_class["medium"]
+    weak_verb_counts = by_class["weak"]
 
     # Normalize per 10,000 words
     scale = 10000 / max(word_count, 1)
 
+    pos = bool(records) and all(r["verb_counting"] == "pos" for r in records)
     return {
         "total_words": word_count,
+        "verb_counting": "pos" if pos else "tokens",
         "high_value_verbs": {
             word: round(count * scale, 2)
             for word, count in high_verb_counts.most_common(15)
@@ -195,15 +475,52 @@ def analyze_vocabulary(texts: List[str]) -> Dict[str, Any]:
             for word, count in weak_verb_counts.most_common(10)
         },
         "academic_connectors": {
-            word: round(combined_text.count(word) * scale, 2)
+            word: round(counts[word] * scale, 2)
             for word in ACADEMIC_CONNECTORS
-            if combined_text.count(word) > 0
+            if counts[word] > 0
         }
     }
 
 
-def analyze_abstract_patterns(texts: List[str]) -> Dict[str, Any]:
-    """Analyze abstract section patterns."""
+def analyze_vocabulary(texts: List[str], workers: int = 1,
+                       docs: Optional[List[Any]] = None) -> Dict[str, Any]:
+    """Analyze vocabulary usage patterns.
+
+    Papers are counted separately (across a process pool with workers > 1,
+    without docs) and the counts merged in paper order.
+    """
+    if docs is not None:
+        records = [vocabulary_record(text, doc) for text, doc in zip(texts, docs)]
+    elif workers > 1 and len(texts) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(texts))) as pool:
+            records = list(pool.map(vocabulary_record, texts))
+    else:
+        records = [vocabulary_record(text) for text in texts]
+    return merge_vocabulary(records)
+
+
+def abstract_record(text: str) -> Optional[Dict[str, Any]]:
+    """Numbers, percentages and p-values in a paper's abstract (None if not found)."""
+
+    # Try to find abstract section
+    abstract_match = re.search(
+        r'(?:abstract|summary)[\s:]*\n*(.*?)(?:\n\n|introduction|keywords)',
+        text,
+        re.IGNORECASE | re.DOTALL
+    )
+    if not abstract_match:
+        return None
+
+    abstract = abstract_match.group(1)[:1500]  # Limit to ~1500 chars
+    return {
+        "numbers": len(re.findall(r'\d+\.?\d*', abstract)),
+        "percentages": bool(re.search(r'\d+\.?\d*\s*%', abstract)),
+        "pvalues": bool(re.search(r'p\s*[<>]\s*0\.\d+', abstract, re.IGNORECASE))
+    }
+
+
+def merge_abstracts(records: List[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Abstract statistics from per-paper records."""
 
     abstract_stats = {
         "papers_analyzed": 0,
@@ -216,32 +533,17 @@ def analyze_abstract_patterns(texts: List[str]) -> Dict[str, Any]:
 
     number_counts = []
 
-    for text in texts:
-        # Try to find abstract section
-        abstract_match = re.search(
-            r'(?:abstract|summary)[\s:]*\n*(.*?)(?:\n\n|introduction|keywords)',
-            text,
-            re.IGNORECASE | re.DOTALL
-        )
-
-        if abstract_match:
-            abstract = abstract_match.group(1)[:1500]  # Limit to ~1500 chars
-            abstract_stats["papers_analyzed"] += 1
-
-            # Count numbers
-            numbers = re.findall(r'\d+\.?\d*', abstract)
-            number_counts.append(len(numbers))
-
-            if len(numbers) >= 1:
-                abstract_stats["papers_with_numbers"] += 1
-
-            # Check for percentages
-            if re.search(r'\d+\.?\d*\s*%', abstract):
-                abstract_stats["papers_with_percentages"] += 1
-
-            # Check for p-values
-            if re.search(r'p\s*[<>]\s*0\.\d+', abstract, re.IGNORECASE):
-                abstract_stats["papers_with_pvalues"] += 1
+    for record in records:
+        if record is None:
+            continue
+        abstract_stats["papers_analyzed"] += 1
+        number_counts.append(record["numbers"])
+        if record["numbers"] >= 1:
+            abstract_stats["papers_with_numbers"] += 1
+        if record["percentages"]:
+            abstract_stats["papers_with_percentages"] += 1
+        if record["pvalues"]:
+            abstract_stats["papers_with_pvalues"] += 1
 
     if number_counts:
         abstract_stats["avg_numbers_per_abstract"] = round(
@@ -264,62 +566,112 @@ def analyze_abstract_patterns(texts: List[str]) -> Dict[str, Any]:
     return abstract_stats
 
 
-def analyze_sentence_patterns(texts: List[str]) -> Dict[str, Any]:
-    """Analyze sentence patterns for Observation-Implication structure."""
+def analyze_abstract_patterns(texts: List[str]) -> Dict[str, Any]:
+    """Analyze abstract section patterns."""
+    return merge_abstracts([abstract_record(text) for text in texts])
 
-    patterns = {
-        "observation_implication": [],
-        "figure_references": [],
-        "comparison_patterns": [],
-        "methodology_patterns": []
+
+def paper_sentences(text: str, doc: Optional[Any] = None, matcher: Optional[Any] = None):
+    """Yield (sentence, has observation and implication markers) for every
+    sentence of a paper: from its spaCy doc (sentences from the pipeline,
+    markers from a marker_matcher) when given, else split_sentences and the
+    marker regexes."""
+    if doc is None:
+        for sent in split_sentences(text):
+            yield sent, bool(OBSERVATION_PATTERN.search(sent) and IMPLICATION_PATTERN.search(sent))
+        return
+
+    hits = {"OBSERVATION": set(), "IMPLICATION": set()}
+    for match_id, start, _ in matcher(doc):
+        hits[doc.vocab.strings[match_id]].add(doc[start].sent.start)
+    for sent in doc.sents:
+        yield sent.text, sent.start in hits["OBSERVATION"] and sent.start in hits["IMPLICATION"]
+
+
+def pattern_record(text: str, doc: Optional[Any] = None,
+                   matcher: Optional[Any] = None) -> Dict[str, Any]:
+    """A paper's observation-implication pattern counts and its first
+    distinct figure reference and comparison patterns."""
+
+    pattern_counts = Counter()
+    figure_references = []
+    comparison_patterns = []
+
+    for sent, observation_implication in paper_sentences(text, doc, matcher):
+        sent = ' '.join(sent.split())
+        if len(sent) < 20:
+            continue
+
+        # Check for observation-implication pattern
+        if observation_implication:
+            generalized = generalize_pattern(sent)
+            pattern_counts[generalized] += 1
+
+        # Check for figure references
+        fig_match = re.search(
+            r'figure\s+\d+\s+(?:shows?|reveals?|demonstrates?|indicates?)',
+            sent,
+            re.IGNORECASE
+        )
+        if fig_match:
+            generalized = re.sub(r'\d+', '[N]', sent[:100])
+            figure_references.append(generalized)
+
+        # Check for comparison patterns
+        if re.search(r'compared\s+to|outperforms?|exceeds?|reduces?.*by', sent, re.IGNORECASE):
+            generalized = generalize_pattern(sent[:100])
+            comparison_patterns.append(generalized)
+
+    return {
+        "observation_implication": dict(pattern_counts),
+        "figure_references": list(dict.fromkeys(figure_references))[:5],
+        "comparison_patterns": list(dict.fromkeys(comparison_patterns))[:5]
     }
 
+
+def merge_patterns(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sentence patterns from per-paper records (merged in paper order)."""
+
     pattern_counts = Counter()
+    figure_references = []
+    comparison_patterns = []
+    for record in records:
+        pattern_counts.update(record["observation_implication"])
+        figure_references.extend(record["figure_references"])
+        comparison_patterns.extend(record["comparison_patterns"])
 
-    for text in texts:
-        sentences = re.split(r'[.!?]+', text)
+    return {
+        # Get top patterns
+        "observation_implication": [
+            {"pattern": p, "count": c}
+            for p, c in pattern_counts.most_common(10)
+        ],
+        # Deduplicate figure patterns
+        "figure_references": list(dict.fromkeys(figure_references))[:5],
+        "comparison_patterns": list(dict.fromkeys(comparison_patterns))[:5],
+        "methodology_patterns": []
+    }
 
-        for sent in sentences:
-            sent = sent.strip()
-            if len(sent) < 20:
-                continue
 
-            # Check for observation-implication pattern
-            for obs in OBSERVATION_MARKERS:
-                if obs in sent.lower():
-                    for imp in IMPLICATION_MARKERS:
-                        if imp in sent.lower():
-                            # Found pattern - generalize it
-                            generalized = generalize_pattern(sent)
-                            pattern_counts[generalized] += 1
-                            break
-
-            # Check for figure references
-            fig_match = re.search(
-                r'figure\s+\d+\s+(?:shows?|reveals?|demonstrates?|indicates?)',
-                sent,
-                re.IGNORECASE
-            )
-            if fig_match:
-                generalized = re.sub(r'\d+', '[N]', sent[:100])
-                patterns["figure_references"].append(generalized)
-
-            # Check for comparison patterns
-            if re.search(r'compared\s+to|outperforms?|exceeds?|reduces?.*by', sent, re.IGNORECASE):
-                generalized = generalize_pattern(sent[:100])
-                patterns["comparison_patterns"].append(generalized)
-
-    # Get top patterns
-    patterns["observation_implication"] = [
-        {"pattern": p, "count": c}
-        for p, c in pattern_counts.most_common(10)
-    ]
+def analyze_sentence_patterns(texts: List[str], nlp: Optional[Any] = None,
+                              docs: Optional[List[Any]] = None) -> Dict[str, Any]:
+    """Analyze sentence patterns for Observation-Implication structure."""
+    if docs is None:
+        return merge_patterns([pattern_record(text) for text in texts])
+    matcher = marker_matcher(nlp)
+    return merge_patterns([pattern_record(text, doc, matcher) for text, doc in zip(texts, docs)])
 
-    # Deduplicate figure patterns
-    patterns["figure_references"] = list(set(patterns["figure_references"]))[:5]
-    patterns["comparison_patterns"] = list(set(patterns["comparison_patterns"]))[:5]
 
-    return patterns
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences, keeping "e.g.", "Fig. 3" and decimals intact."""
+    sentences = []
+    for piece in SENTENCE_BOUNDARY.split(text):
+        if sentences and (ABBREVIATION_END.search(sentences[-1])
+                          or (piece[:1].isdigit() and NUMBER_ABBREVIATION_END.search(sentences[-1]))):
+            sentences[-1] += ' ' + piece
+        else:
+            sentences.append(piece)
+    return sentences
 
 
 def generalize_pattern(sentence: str) -> str:
@@ -334,8 +686,45 @@ def generalize_pattern(sentence: str) -> str:
     return result
 
 
-def analyze_figure_captions(texts: List[str]) -> Dict[str, Any]:
-    """Analyze figure caption patterns."""
+CAPTION_PATTERN = re.compile(
+    r'(?:figure|fig\.?)\s*\d+[:\.\s]+([^.]+\.)',
+    re.IGNORECASE
+)
+
+
+def caption_record(text: str) -> Dict[str, Any]:
+    """A paper's caption counts and its first good and bad examples."""
+
+    record = {"total": 0, "conclusionary": 0, "with_numbers": 0, "good": [], "bad": []}
+
+    for caption in CAPTION_PATTERN.findall(text):
+        record["total"] += 1
+        caption = caption.strip()
+
+        # Check if conclusionary
+        is_conclusionary = any(
+            marker in caption.lower()
+            for marker in IMPLICATION_MARKERS + ["reveals", "demonstrates", "shows that"]
+        )
+
+        # Check for numbers
+        has_numbers = bool(re.search(r'\d+\.?\d*', caption))
+
+        if is_conclusionary:
+            record["conclusionary"] += 1
+            if len(record["good"]) < 3:
+                record["good"].append(caption[:150])
+        elif len(record["bad"]) < 3:
+            record["bad"].append(caption[:150])
+
+        if has_numbers:
+            record["with_numbers"] += 1
+
+    return record
+
+
+def merge_captions(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Figure caption statistics from per-paper records."""
 
     caption_stats = {
         "total_figures": 0,
@@ -348,38 +737,14 @@ def analyze_figure_captions(texts: List[str]) -> Dict[str, Any]:
         }
     }
 
-    caption_pattern = re.compile(
-        r'(?:figure|fig\.?)\s*\d+[:\.\s]+([^.]+\.)',
-        re.IGNORECASE
-    )
-
-    for text in texts:
-        captions = caption_pattern.findall(text)
-
-        for caption in captions:
-            caption_stats["total_figures"] += 1
-            caption = caption.strip()
-
-            # Check if conclusionary
-            is_conclusionary = any(
-                marker in caption.lower()
-                for marker in IMPLICATION_MARKERS + ["reveals", "demonstrates", "shows that"]
-            )
-
-            # Check for numbers
-            has_numbers = bool(re.search(r'\d+\.?\d*', caption))
-
-            if is_conclusionary:
-                caption_stats["conclusionary"] += 1
-                if len(caption_stats["examples"]["good"]) < 3:
-                    caption_stats["examples"]["good"].append(caption[:150])
-            else:
-                caption_stats["descriptive_only"] += 1
-                if len(caption_stats["examples"]["bad"]) < 3:
-                    caption_stats["examples"]["bad"].append(caption[:150])
-
-            if has_numbers:
-                caption_stats["with_numbers"] += 1
+    for record in records:
+        caption_stats["total_figures"] += record["total"]
+        caption_stats["conclusionary"] += record["conclusionary"]
+        caption_stats["descriptive_only"] += record["total"] - record["conclusionary"]
+        caption_stats["with_numbers"] += record["with_numbers"]
+        for kind in ("good", "bad"):
+            examples = caption_stats["examples"][kind]
+            examples.extend(record[kind][:3 - len(examples)])
 
     # Calculate percentages
     n = caption_stats["total_figures"]
@@ -394,6 +759,100 @@ def analyze_figure_captions(texts: List[str]) -> Dict[str, Any]:
     return caption_stats
 
 
+def analyze_figure_captions(texts: List[str]) -> Dict[str, Any]:
+    """Analyze figure caption patterns."""
+    return merge_captions([caption_record(text) for text in texts])
+
+
+# ============================================================================
+# PER-PAPER STATISTICS STORE
+# ============================================================================
+
+STATS_VERSION = 1  # Bump when a *_record function changes
+
+
+def paper_record(text: str, doc: Optional[Any] = None,
+                 matcher: Optional[Any] = None) -> Dict[str, Any]:
+    """Everything the style guide needs from one paper (JSON-serializable)."""
+    return {
+        "vocabulary": vocabulary_record(text, doc),
+        "abstract": abstract_record(text),
+        "patterns": pattern_record(text, doc, matcher),
+        "captions": caption_record(text)
+    }
+
+
+def merge_records(records: List[Dict[str, Any]]) -> Tuple[Dict, Dict, Dict, Dict]:
+    """(vocabulary, abstracts, patterns, captions) for the corpus, merged in paper order."""
+    return (
+        merge_vocabulary([r["vocabulary"] for r in records]),
+        merge_abstracts([r["abstract"] for r in records]),
+        merge_patterns([r["patterns"] for r in records]),
+        merge_captions([r["captions"] for r in records])
+    )
+
+
+def text_digest(text: str) -> str:
+    return hashlib.sha1(text.encode('utf-8', errors='surrogateescape')).hexdigest()
+
+
+def load_stats(stats_path: str, verb_counting: str) -> Dict[str, Dict[str, Any]]:
+    """Stored {"digest", "record"} by paper path, or {} if missing or stale."""
+    try:
+        with open(stats_path, 'r', encoding='utf-8') as f:
+            store = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if store.get("version") != STATS_VERSION or store.get("verb_counting") != verb_counting:
+        return {}
+    return store.get("papers", {})
+
+
+def save_stats(stats_path: str, verb_counting: str, papers: Dict[str, Dict[str, Any]]) -> None:
+    """Write the store atomically (tmp file + rename)."""
+    Path(stats_path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{stats_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"version": STATS_VERSION, "verb_counting": verb_counting, "papers": papers}, f)
+    os.replace(tmp_path, stats_path)
+
+
+def update_records(papers: List[Dict[str, Any]], stored: Dict[str, Dict[str, Any]],
+                   nlp: Optional[Any] = None, nlp_cache_dir: Optional[str] = None,
+                   workers: int = 1) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    """Records for the papers: reused from the store when the paper's text
+    is unchanged, else computed (across a process pool without spaCy; with
+    it, the changed papers are parsed by parse_papers).
+
+    Returns (store entries by path in paper order, paths recomputed).
+    """
+    entries = {}
+    changed = []
+    for paper in papers:
+        digest = text_digest(paper["text"])
+        entry = stored.get(paper["path"])
+        if entry is not None and entry["digest"] == digest:
+            entries[paper["path"]] = entry
+        else:
+            entries[paper["path"]] = {"digest": digest, "record": None}
+            changed.append(paper)
+
+    texts = [paper["text"] for paper in changed]
+    if nlp is not None and texts:
+        docs = parse_papers(texts, nlp, nlp_cache_dir, workers)
+        matcher = marker_matcher(nlp)
+        records = [paper_record(text, doc, matcher) for text, doc in zip(texts, docs)]
+    elif workers > 1 and len(texts) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(texts))) as pool:
+            records = list(pool.map(paper_record, texts))
+    else:
+        records = [paper_record(text) for text in texts]
+
+    for paper, record in zip(changed, records):
+        entries[paper["path"]]["record"] = record
+    return entries, [paper["path"] for paper in changed]
+
+
 # ============================================================================
 # STYLE GUIDE GENERATION
 # ============================================================================
@@ -591,7 +1050,6 @@ def generate_style_guide(
 
     content.append("### 3.3 Comparison Patterns")
     content.append("")
-
     comp_patterns = patterns.get("comparison_patterns", [])
     if comp_patterns:
         for p in comp_patterns[:3]:
@@ -732,11 +1190,255 @@ def get_verb_usage(verb: str) -> str:
     return usage_examples.get(verb, f"\"We {verb} that...\"")
 
 
+# ============================================================================
+# SHARDED ANALYSIS
+# ============================================================================
+
+SHARDS_FILENAME = "style_shards.json"
+DELTA_FILENAME = "style_delta.md"
+
+YEAR_PATTERN = re.compile(r'(?<!\d)(20\d{2})(?!\d)')
+PROBLEM_PATTERN = re.compile(r'Problem_([A-F])(?![a-z])', re.IGNORECASE)
+# Problem statements ("2024_MCM_Problem_C.pdf") are not papers; "_Results.pdf" are
+PROBLEM_STATEMENT = re.compile(r'_Problem_[A-F]\.pdf$', re.IGNORECASE)
+
+_SHARD_NLP: Dict[str, Any] = {}  # spaCy pipeline, loaded once per worker process
+
+
+def shard_key(filepath: str) -> str:
+    """"<year>/<problem>" for a paper, from its directories or filename
+    ("student paper/2023/C/2310767.pdf", "2023/2023_MCM_Problem_C_Results.pdf")."""
+    parts = Path(filepath).parts
+    years = [p for p in parts if YEAR_PATTERN.fullmatch(p)]
+    year_match = YEAR_PATTERN.search(parts[-1])
+    year = years[-1] if years else (year_match.group(1) if year_match else "other")
+
+    letters = [p.upper() for p in parts[:-1] if re.fullmatch(r'[A-Fa-f]', p)]
+    problem_match = PROBLEM_PATTERN.search(parts[-1])
+    problem = letters[-1] if letters else (problem_match.group(1).upper() if problem_match else "other")
+    return f"{year}/{problem}"
+
+
+def find_shards(roots: List[str]) -> Dict[str, List[str]]:
+    """Paper files under the roots grouped by shard_key, in walk order. A
+    file whose content already appeared (the same PDF under two roots) is
+    skipped, so no paper is counted twice."""
+    shards = defaultdict(list)
+    seen = set()
+    for directory in roots:
+        for root, dirs, filenames in os.walk(directory):
+            dirs[:] = sorted(d for d in dirs if d != CACHE_DIRNAME)
+            for filename in sorted(filenames):
+                if filename.endswith(('.pdf', '.txt', '.md')) and not PROBLEM_STATEMENT.search(filename):
+                    filepath = os.path.join(root, filename)
+                    digest = pdf_digest(filepath)
+                    if digest not in seen:
+                        seen.add(digest)
+                        shards[shard_key(filepath)].append(filepath)
+    return dict(sorted(shards.items()))
+
+
+def analyze_shard(paths: List[str], stored: Dict[str, Dict[str, Any]],
+                  cache_dir: Optional[str] = None, nlp_cache_dir: Optional[str] = None,
+                  use_spacy: bool = False) -> Dict[str, Any]:
+    """Shard worker: records for a shard's papers, one paper in memory at a
+    time (reused from stored when the text is unchanged).
+
+    Returns {"entries": store entries by path, "analyzed": count}.
+    """
+    nlp = None
+    if use_spacy:
+        if "nlp" not in _SHARD_NLP:
+            _SHARD_NLP["nlp"] = load_nlp()
+        nlp = _SHARD_NLP["nlp"]
+    matcher = marker_matcher(nlp) if nlp is not None else None
+
+    entries = {}
+    analyzed = 0
+    for path in paths:
+        text = load_paper_text(path, cache_dir)
+        if not text.strip():
+            continue
+        digest = text_digest(text)
+        entry = stored.get(path)
+        if entry is None or entry["digest"] != digest:
+            doc = parse_papers([text], nlp, nlp_cache_dir)[0] if nlp is not None else None
+            entry = {"digest": digest, "record": paper_record(text, doc, matcher)}
+            analyzed += 1
+        entries[path] = entry
+    return {"entries": entries, "analyzed": analyzed}
+
+
+def aggregate(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Corpus statistics for a group of paper records."""
+    vocab, abstracts, patterns, captions = merge_records(records)
+    return {
+        "papers": len(records),
+        "vocabulary": vocab,
+        "abstracts": abstracts,
+        "patterns": patterns,
+        "captions": captions
+    }
+
+
+def verb_rates(records: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Every tracked verb's frequency per 10,000 words in a group of papers."""
+    words = sum(r["vocabulary"]["words"] for r in records)
+    counts = Counter()
+    for record in records:
+        counts.update(record["vocabulary"]["counts"])
+    scale = 10000 / max(words, 1)
+    return {verb: round(counts[verb] * scale, 2) for verb in sorted(VERB_WORDS)}
+
+
+def delta_report(by_year: Dict[str, List[Dict[str, Any]]], top: int = 5) -> List[Dict[str, Any]]:
+    """Year-over-year changes: the verbs that rose and fell most (per 10k
+    words) and the change in caption and abstract statistics."""
+    years = sorted(y for y in by_year if y != "other")
+    deltas = []
+    for before, after in zip(years, years[1:]):
+        old_rates, new_rates = verb_rates(by_year[before]), verb_rates(by_year[after])
+        changes = sorted(
+            ({"verb": v, "from": old_rates[v], "to": new_rates[v],
+              "change": round(new_rates[v] - old_rates[v], 2)} for v in old_rates),
+            key=lambda c: -c["change"]
+        )
+        old_stats, new_stats = aggregate(by_year[before]), aggregate(by_year[after])
+        deltas.append({
+            "from": before,
+            "to": after,
+            "verbs_up": [c for c in changes[:top] if c["change"] > 0],
+            "verbs_down": [c for c in reversed(changes[-top:]) if c["change"] < 0],
+            "captions": {
+                key: [old_stats["captions"].get(key, 0), new_stats["captions"].get(key, 0)]
+                for key in ("total_figures", "pct_conclusionary", "pct_with_numbers")
+            },
+            "abstracts": {
+                key: [old_stats["abstracts"].get(key, 0), new_stats["abstracts"].get(key, 0)]
+                for key in ("avg_numbers_per_abstract", "pct_with_numbers")
+            }
+        })
+    return deltas
+
+
+def format_delta(deltas: List[Dict[str, Any]]) -> str:
+    """style_delta.md: the delta report as Markdown."""
+    content = ["# O-Prize Style Shifts by Year (Auto-Generated)", ""]
+    content.append(f"> **Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    content.append("")
+    if not deltas:
+        content.append("Fewer than two years of papers: nothing to compare.")
+    for delta in deltas:
+        content.append(f"## {delta['from']} → {delta['to']}")
+        content.append("")
+        content.append("| Verb | Per 10k words | Change |")
+        content.append("|------|---------------|--------|")
+        for c in delta["verbs_up"] + delta["verbs_down"]:
+            content.append(f"| {c['verb']} | {c['from']} → {c['to']} | {c['change']:+} |")
+        content.append("")
+        content.append("| Statistic | Change |")
+        content.append("|-----------|--------|")
+        for section in ("captions", "abstracts"):
+            for key, (old, new) in delta[section].items():
+                content.append(f"| {section}.{key} | {old} → {new} |")
+        content.append("")
+    return '\n'.join(content)
+
+
+def sharded(roots: List[str], output_dir: str, workers: int = 1, cache: bool = True,
+            use_spacy: bool = True) -> None:
+    """Style statistics per year/problem shard across several corpora.
+
+    Shards are analyzed in parallel, each worker streaming its papers one at
+    a time; only the small per-paper records come back. Writes
+    style_shards.json (per-shard, per-year and global aggregates plus the
+    year-over-year delta), style_delta.md and a global style_guide.md.
+    """
+
+    print(f"\nO-Prize Style Analyzer (sharded)")
+    print(f"=" * 40)
+    print(f"Source: {', '.join(roots)}")
+    print(f"Output: {output_dir}\n")
+
+    shards = find_shards(roots)
+    if not shards:
+        print("  Error: No papers found")
+        sys.exit(1)
+    print(f"  {sum(len(p) for p in shards.values())} papers in {len(shards)} shards")
+
+    shards_path = os.path.join(output_dir, SHARDS_FILENAME)
+    cache_dir = default_cache_dir(shards_path) if cache else None
+    nlp_cache_dir = default_cache_dir(shards_path, "style_nlp") if cache else None
+    stats_path = default_cache_dir(shards_path, "style_stats.json") if cache else None
+    if use_spacy and HAS_SPACY:
+        # Loaded once here; forked workers inherit it
+        _SHARD_NLP["nlp"] = load_nlp()
+    use_spacy = _SHARD_NLP.get("nlp") is not None
+    verb_counting = "pos" if use_spacy else "tokens"
+    stored = load_stats(stats_path, verb_counting) if stats_path else {}
+
+    jobs = [
+        (paths, {p: stored[p] for p in paths if p in stored}, cache_dir, nlp_cache_dir, use_spacy)
+        for paths in shards.values()
+    ]
+    print("Analyzing shards...")
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(analyze_shard, *zip(*jobs)))
+    else:
+        results = [analyze_shard(*job) for job in jobs]
+
+    entries = {}
+    by_shard = {}
+    by_year = defaultdict(list)
+    analyzed = 0
+    for key, result in zip(shards, results):
+        records = [entry["record"] for entry in result["entries"].values()]
+        entries.update(result["entries"])
+        analyzed += result["analyzed"]
+        if records:
+            by_shard[key] = records
+            by_year[key.split('/')[0]].extend(records)
+        print(f"  {key}: {len(records)} papers")
+    print(f"  {analyzed} papers analyzed, {len(entries) - analyzed} unchanged")
+    if stats_path:
+        save_stats(stats_path, verb_counting, entries)
+
+    all_records = [record for records in by_shard.values() for record in records]
+    deltas = delta_report(by_year)
+    report = {
+        "generated": datetime.now().isoformat(),
+        "roots": roots,
+        "papers": len(all_records),
+        "global": aggregate(all_records),
+        "years": {year: aggregate(records) for year, records in sorted(by_year.items())},
+        "shards": {key: aggregate(records) for key, records in by_shard.items()},
+        "delta": deltas
+    }
+
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    with open(shards_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n  Shard statistics: {shards_path}")
+
+    delta_path = os.path.join(output_dir, DELTA_FILENAME)
+    with open(delta_path, 'w', encoding='utf-8') as f:
+        f.write(format_delta(deltas))
+    print(f"  Delta report: {delta_path}")
+
+    overall = report["global"]
+    write_style_guide(os.path.join(output_dir, "style_guide.md"), overall["vocabulary"],
+                      overall["abstracts"], overall["patterns"], overall["captions"],
+                      overall["papers"])
+    print(f"\n  Done!")
+
+
 # ============================================================================
 # MAIN FUNCTION
 # ============================================================================
 
-def main(papers_dir: str, output_path: str) -> None:
+def main(papers_dir: str, output_path: str, workers: int = 1, cache: bool = True,
+         use_spacy: bool = True) -> None:
     """Main analysis pipeline."""
 
     print(f"\nO-Prize Style Analyzer")
@@ -746,7 +1448,7 @@ def main(papers_dir: str, output_path: str) -> None:
 
     # Load papers
     print("Loading papers...")
-    papers = load_papers(papers_dir)
+    papers = load_papers(papers_dir, default_cache_dir(output_path) if cache else None, workers)
 
     if not papers:
         print("\n  No papers found! Creating default style guide...")
@@ -756,23 +1458,36 @@ def main(papers_dir: str, output_path: str) -> None:
         print(f"\n  Loaded {len(papers)} papers")
         texts = [p["text"] for p in papers]
 
-    # Analyze
-    print("\nAnalyzing vocabulary...")
-    vocab = analyze_vocabulary(texts)
-
-    print("Analyzing abstract patterns...")
-    abstracts = analyze_abstract_patterns(texts)
+    # Sentences, POS tags and lemmas (spaCy, when installed)
+    nlp = load_nlp() if use_spacy and texts else None
+    verb_counting = "pos" if nlp is not None else "tokens"
 
-    print("Analyzing sentence patterns...")
-    patterns = analyze_sentence_patterns(texts)
+    # Analyze the new and changed papers; reuse the stored records of the rest
+    print("\nAnalyzing papers...")
+    stats_path = default_cache_dir(output_path, "style_stats.json") if cache else None
+    stored = load_stats(stats_path, verb_counting) if stats_path else {}
+    entries, recomputed = update_records(
+        papers, stored, nlp, default_cache_dir(output_path, "style_nlp") if cache else None, workers
+    )
+    removed = len(stored.keys() - entries.keys())
+    print(f"  {len(recomputed)} papers analyzed, {len(entries) - len(recomputed)} unchanged, "
+          f"{removed} removed")
+    if stats_path:
+        save_stats(stats_path, verb_counting, entries)
 
-    print("Analyzing figure captions...")
-    captions = analyze_figure_captions(texts)
+    vocab, abstracts, patterns, captions = merge_records([e["record"] for e in entries.values()])
 
     # Generate style guide
     print("\nGenerating style guide...")
+    write_style_guide(output_path, vocab, abstracts, patterns, captions, len(papers))
+    print(f"\n  Done!")
+
+
+def write_style_guide(output_path: str, vocab: Dict, abstracts: Dict, patterns: Dict,
+                      captions: Dict, paper_count: int) -> None:
+    """Write style_guide.md and the raw analysis JSON next to it."""
     style_guide = generate_style_guide(
-        vocab, abstracts, patterns, captions, len(papers)
+        vocab, abstracts, patterns, captions, paper_count
     )
 
     # Write output
@@ -786,7 +1501,7 @@ def main(papers_dir: str, output_path: str) -> None:
     json_path = output_path.replace('.md', '_analysis.json')
     analysis = {
         "generated": datetime.now().isoformat(),
-        "papers_analyzed": len(papers),
+        "papers_analyzed": paper_count,
         "vocabulary": vocab,
         "abstracts": abstracts,
         "patterns": {
@@ -800,19 +1515,64 @@ def main(papers_dir: str, output_path: str) -> None:
         json.dump(analysis, f, indent=2)
 
     print(f"  Analysis JSON: {json_path}")
-    print(f"\n  Done!")
 
 
 if __name__ == "__main__":
-    if len(sys.argv) >= 3:
-        main(sys.argv[1], sys.argv[2])
+    parser = argparse.ArgumentParser(
+        description="Extract academic writing patterns from O-Prize reference papers",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Example:
+  python style_analyzer.py reference_papers/ knowledge_library/academic_writing/style_guide.md
+  python style_analyzer.py --sharded "problems and results/" "student paper/" style_by_year/
+
+PDFs are extracted, and vocabulary counted per paper, in parallel
+(--workers, default all cores). Extracted text is cached, gzip-compressed
+with page offsets, in .cache/style_text/ next to the output, keyed by PDF
+content hash: a rerun after adding one paper only extracts that paper.
+
+Per-paper statistics (vocabulary counts, abstract, caption and sentence
+pattern stats) are kept in .cache/style_stats.json: only new or changed
+papers are analyzed, removed ones dropped, and the corpus statistics merged
+from the records.
+
+With spaCy and en_core_web_sm, papers are parsed once with nlp.pipe (NER
+and the dependency parser disabled) for sentence boundaries, a PhraseMatcher
+over the observation/implication markers and POS-tagged verb counts; parsed
+docs are cached as DocBin files in .cache/style_nlp/. Without spaCy (or with
+--no-spacy) sentences are split by regex, keeping "e.g." and decimals intact.
+--no-cache extracts and analyzes every paper.
+
+--sharded takes several paper directories and an output directory. Papers
+are grouped by year and problem letter (from directories like 2023/C/ or
+names like 2023_MCM_Problem_C_Results.pdf; problem statements are skipped)
+and the shards analyzed in parallel, one paper in memory at a time per
+worker. It writes style_shards.json (per-shard, per-year and global
+statistics, and year-over-year deltas), style_delta.md (the verbs and
+caption/abstract statistics that changed most between years) and a global
+style_guide.md.
+
+Optional dependencies:
+  pip install pdfplumber spacy
+  python -m spacy download en_core_web_sm
+""")
+    parser.add_argument("papers_directory", nargs="+",
+                        help="Directory of reference papers (PDF, TXT, MD); several with --sharded")
+    parser.add_argument("output_path", help="Where to write style_guide.md (a directory with --sharded)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Processes for PDF extraction and counting (default: 0 = all cores)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Extract and analyze every paper instead of reusing cached results")
+    parser.add_argument("--no-spacy", action="store_true",
+                        help="Use the regex sentence splitter and token counts even with spaCy installed")
+    parser.add_argument("--sharded", action="store_true",
+                        help="Statistics per year/problem shard, per year and overall, with deltas")
+
+    args = parser.parse_args()
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    if args.sharded:
+        sharded(args.papers_directory, args.output_path, workers, not args.no_cache, not args.no_spacy)
+    elif len(args.papers_directory) > 1:
+        parser.error("give one papers directory (several with --sharded)")
     else:
-        print("Usage: python style_analyzer.py <papers_directory> <output_path>")
-        print("")
-        print("Example:")
-        print("  python style_analyzer.py reference_papers/ knowledge_library/academic_writing/style_guide.md")
-        print("")
-        print("Optional dependencies:")
-        print("  pip install pdfplumber spacy")
-        print("  python -m spacy download en_core_web_sm")
-        sys.exit(1)
+        main(args.papers_directory[0], args.output_path, workers, not args.no_cache, not args.no_spacy)
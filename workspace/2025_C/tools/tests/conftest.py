@@ -0,0 +1,37 @@
+"""Shared fixtures: the numbered tool scripts loaded as modules."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent
+
+
+def load_tool(filename: str, name: str):
+    """Import a tool script by file name (they start with a digit).
+
+    Registered in sys.modules so worker processes can unpickle its functions.
+    """
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, TOOLS_DIR / filename)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+@pytest.fixture(scope="session")
+def log_analyzer():
+    return load_tool("7_log_analyzer.py", "log_analyzer")
+
+
+@pytest.fixture(scope="session")
+def mmbench():
+    return load_tool("8_mmbench_score.py", "mmbench_score")
+
+
+@pytest.fixture(scope="session")
+def style_analyzer():
+    return load_tool("6_style_analyzer.py", "style_analyzer")
@@ -0,0 +1,181 @@
+"""Regression checks: every way of parsing a log gives the serial summary."""
+
+import pytest
+
+# Long enough for the loss series to outgrow SERIES_BUCKETS several times
+LOG_LINES = 60000
+
+
+@pytest.fixture(scope="module")
+def long_log(log_analyzer, tmp_path_factory):
+    path = tmp_path_factory.mktemp("logs") / "training_full.log"
+    log_analyzer.generate_synthetic_log(str(path), LOG_LINES)
+    return path
+
+
+@pytest.fixture(scope="module")
+def serial(log_analyzer, long_log):
+    data = log_analyzer.parse_log_file(str(long_log))
+    assert data["loss_values"].count > 2 * log_analyzer.SERIES_BUCKETS
+    return log_analyzer.comparable_summary(data, str(long_log))
+
+
+def split_segments(log_path, directory, parts):
+    """Write log_path as rotated segments, oldest first."""
+    lines = log_path.read_text().splitlines(keepends=True)
+    size = -(-len(lines) // parts)
+    paths = []
+    for i in range(parts):
+        suffix = f".{parts - 1 - i}" if i < parts - 1 else ""
+        path = directory / f"training.log{suffix}"
+        path.write_text("".join(lines[i * size:(i + 1) * size]))
+        paths.append(str(path))
+    return paths
+
+
+def test_bucket_layout_follows_line(log_analyzer):
+    series = log_analyzer.SeriesStats()
+    for i in range(3 * log_analyzer.SERIES_BUCKETS + 7):
+        series.add(float(i), None, i + 1)
+    width = series.width
+    for (segment, k), (count, mean, _, low) in zip(series.keys, series.buckets):
+        assert segment == 0
+        assert low == k * width
+        assert mean == pytest.approx(k * width + (count - 1) / 2)
+
+
+@pytest.mark.parametrize("split", [1, 4093, 4096, 5000, 9001])
+def test_merged_series_matches_streamed(log_analyzer, split):
+    values = [((i * 7919) % 1013) / 17.0 for i in range(3 * log_analyzer.SERIES_BUCKETS)]
+    streamed, head, tail = (log_analyzer.SeriesStats() for _ in range(3))
+    tail.start_segment(-split)
+    for i, value in enumerate(values):
+        streamed.add(value, None, i + 1)
+        if i < split:
+            head.add(value, None, i + 1)
+        else:
+            tail.add(value, None, i + 1 - split)
+    tail.rebase(split, 0)
+    head.merge(tail)
+    assert head.width == streamed.width
+    assert head.keys == streamed.keys
+    for merged, expected in zip(head.buckets, streamed.buckets):
+        assert merged == pytest.approx(expected)
+
+
+def test_chunks_keep_series_only_on_request(log_analyzer, long_log):
+    size = long_log.stat().st_size
+    (start, end), _ = log_analyzer.split_byte_ranges(str(long_log), 2)
+    assert log_analyzer.count_lines(str(long_log), start, end) == \
+        long_log.read_bytes()[:end].count(b"\n")
+    for keep_series in (False, True):
+        data, _ = log_analyzer.parse_chunk(str(long_log), end, size, keep_series=keep_series,
+                                           lines_before=1000)
+        assert (data["loss_values"].series is not None) == keep_series
+
+
+def test_parallel_matches_serial(log_analyzer, long_log, serial):
+    data = log_analyzer.parse_log_file_parallel(str(long_log), 3, min_chunk_bytes=1024)
+    assert log_analyzer.comparable_summary(data, str(long_log)) == serial
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_segments_match_single_log(log_analyzer, long_log, serial, tmp_path, workers):
+    paths = split_segments(long_log, tmp_path, 3)
+    data = log_analyzer.parse_log_segments(paths, workers)
+    assert log_analyzer.comparable_summary(data, str(long_log)) == serial
+
+
+def test_windows_only_on_exact_series(log_analyzer, long_log):
+    bucketed = log_analyzer.generate_summary(log_analyzer.parse_log_file(str(long_log)),
+                                             str(long_log))
+    assert "loss_windows" not in bucketed["oscillation"]
+    assert bucketed["oscillation"]["loss"]["approximate"]
+    assert bucketed["convergence"]["loss"]["approximate"]
+
+    data = log_analyzer.parse_log_file(str(long_log), keep_series=True)
+    exact = log_analyzer.generate_summary(data, str(long_log))
+    n = data["loss_values"].count
+    windows = exact["oscillation"]["loss_windows"]
+    assert windows["rolling"]["window"] == int(n * log_analyzer.ROLLING_WINDOW_FRACTION)
+    for point in windows["change_points"]:
+        assert point["at_pct"] == round(100 * point["index"] / n, 1)
+    assert "approximate" not in exact["oscillation"]["loss"]
+
+
+@pytest.mark.parametrize("profile", ["keras", "pymc"])
+def test_follow_resume_matches_one_shot(log_analyzer, tmp_path, profile):
+    source = tmp_path / "source.log"
+    log_analyzer.generate_profile_log(str(source), profile, 8000)
+    lines = source.read_text().splitlines(keepends=True)
+    log_path, state_path = tmp_path / "training.log", tmp_path / "summary.json.state"
+
+    # A few lines per poll at first, so the format is undecided for a while
+    written = 0
+    log_path.write_text("")
+    for size in [1, 2, 5, 20, 200, 2000, len(lines)]:
+        with open(log_path, "a") as f:
+            f.writelines(lines[written:size])
+        written = size
+        state = log_analyzer.load_follow_state(str(state_path), str(log_path), profile="auto")
+        log_analyzer.follow_update(state)
+        log_analyzer.save_follow_state(state, str(state_path))
+    log_analyzer.follow_update(state, final=True)
+
+    detected = log_analyzer.detect_profile(str(log_path))
+    assert state["format"] == detected == profile
+    one_shot = log_analyzer.parse_log_file(str(log_path), profile=detected)
+    assert (log_analyzer.comparable_summary(state["data"], str(log_path))
+            == log_analyzer.comparable_summary(one_shot, str(log_path)))
+
+
+def test_cached_matches_uncached(log_analyzer, long_log, tmp_path):
+    paths = split_segments(long_log, tmp_path, 2)
+    cache_dir = str(tmp_path / "cache")
+
+    # Half of the newest segment first, then the rest appended (cache extended)
+    newest = tmp_path / "training.log"
+    tail = newest.read_text().splitlines(keepends=True)
+    newest.write_text("".join(tail[:len(tail) // 2]))
+    log_analyzer.parse_log_segments_cached(paths, cache_dir)
+    with open(newest, "a") as f:
+        f.writelines(tail[len(tail) // 2:])
+
+    expected = log_analyzer.comparable_summary(log_analyzer.parse_log_segments(paths), "log")
+    for statuses in (["hit", "extended"], ["hit", "hit"]):
+        data, seen = log_analyzer.parse_log_segments_cached(paths, cache_dir)
+        assert seen == statuses
+        assert log_analyzer.comparable_summary(data, "log") == expected
+
+
+def test_cache_keeps_same_header_logs_apart(log_analyzer, tmp_path):
+    header = "Epoch 1/10\n" * 50
+    first, second = tmp_path / "a.log", tmp_path / "b.log"
+    first.write_text(header + "loss: 0.5\n" * 10)
+    second.write_text(header + "loss: 0.9\n" * 10)
+    cache_dir = str(tmp_path / "cache")
+
+    for path in (first, second):
+        data, statuses = log_analyzer.parse_log_segments_cached([str(path)], cache_dir)
+        assert statuses == ["miss"]
+        assert (log_analyzer.comparable_summary(data, "log")
+                == log_analyzer.comparable_summary(log_analyzer.parse_log_file(str(path)), "log"))
+
+
+def test_small_growing_log_extends_its_entry(log_analyzer, tmp_path):
+    log = tmp_path / "training.log"
+    log.write_text("Epoch 1/10\n" + "loss: 0.5\n" * 10)
+    statuses = []
+    for _ in range(2):
+        statuses += log_analyzer.parse_log_segments_cached([str(log)])[1]
+        with open(log, "a") as f:
+            f.write("loss: 0.4\n" * 10)
+    data, seen = log_analyzer.parse_log_segments_cached([str(log)])
+    assert statuses + seen == ["miss", "extended", "extended"]
+    assert log_analyzer.parse_log_segments_cached([str(log)])[1] == ["hit"]
+    assert data["loss_values"].count == 30
+
+    entries = list((tmp_path / ".cache").glob("*.pkl"))
+    assert len(entries) == 1
+    entry = log_analyzer.load_cache_entry(str(entries[0]), str(log))
+    assert entry["data"]["loss_values"].series is None
@@ -0,0 +1,138 @@
+"""Regression checks: incremental scoring and the run history match a full run."""
+
+import json
+import os
+import sqlite3
+
+import pytest
+
+PAPER = """Abstract
+We find 12.5% growth (95% CI 10.1-14.9), p < 0.05 and 3 regimes over 40 years.
+
+Introduction
+""" + "The model explains the regime shifts in detail. " * 60 + """
+
+Sensitivity Analysis
+A parameter sweep over the growth rate reveals that the ranking is stable.
+Figure 1: the trend reveals that growth slows after the second regime.
+"""
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    root = tmp_path / "workspace"
+    (root / "paper").mkdir(parents=True)
+    (root / "code").mkdir()
+    (root / "paper" / "main.tex").write_text(PAPER)
+    (root / "summary.md").write_text("short summary 1 2\n\nrobustness check done\n")
+    (root / "code" / "main.py").write_text("import numpy as np\nx = np.arange(10)\n")
+    return root
+
+
+def comparable(report):
+    """Report without the parts that describe the run rather than the workspace."""
+    report = json.loads(json.dumps(report))
+    report["meta"].pop("generated")
+    report.pop("perf", None)
+    report.get("rules", {}).pop("cost", None)
+    return report
+
+
+EDITS = [
+    ("unchanged", lambda root: None),
+    ("touched", lambda root: os.utime(root / "paper" / "main.tex")),
+    ("edited", lambda root: (root / "paper" / "main.tex").write_text(PAPER + "Bootstrap intervals.\n")),
+    ("added", lambda root: (root / "README.md").write_text("# Run\npython code/main.py\n")),
+    ("diagram", lambda root: (root / "flow.mmd").write_text("graph TD; A-->B")),
+    ("removed", lambda root: os.remove(root / "summary.md")),
+]
+
+
+def test_incremental_matches_full(mmbench, workspace, tmp_path):
+    manifest = str(tmp_path / "bench" / ".cache" / "manifest.json")
+    ws = str(workspace)
+    report, reused = mmbench.score_workspace_incremental(ws, manifest)
+    assert not reused
+
+    for label, edit in EDITS:
+        edit(workspace)
+        report, reused = mmbench.score_workspace_incremental(ws, manifest)
+        assert comparable(report) == comparable(mmbench.score_workspace(ws)), label
+        cached = {p["check"] for p in report["perf"]["checks"] if p.get("cached")}
+        assert cached == set(reused)
+    assert reused  # The last edit leaves most checks' inputs alone
+
+
+def test_history_imports_reports_once(mmbench, workspace, tmp_path):
+    bench = tmp_path / "bench"
+    bench.mkdir()
+    report = mmbench.score_workspace(str(workspace))
+    for i, score in enumerate([60, 70, 65]):
+        report["score"] = score
+        report["meta"]["generated"] = f"2026-01-0{i + 1}T00:00:00"
+        (bench / f"run_report_{i}.json").write_text(json.dumps(report))
+
+    with mmbench.RunHistory(str(bench)) as history:
+        assert history.count() == 3
+        assert [run["score"] for run in history.runs()] == [60, 70, 65]
+        assert history.last()["score"] == 65
+        assert history.best()["score"] == 70
+    with mmbench.RunHistory(str(bench)) as history:
+        assert history.sync() == 0
+        assert history.count() == 3
+
+
+def test_history_migrates_untimed_schema(mmbench, tmp_path):
+    conn = sqlite3.connect(tmp_path / mmbench.HISTORY_FILENAME)
+    conn.executescript(mmbench.HISTORY_SCHEMA.replace(",\n    ms REAL", ""))
+    conn.execute("INSERT INTO runs (report, workspace, generated, score) "
+                 "VALUES ('run_report_old.json', 'ws', '2025-12-31T00:00:00', 80)")
+    conn.commit()
+    conn.close()
+
+    with mmbench.RunHistory(str(tmp_path)) as history:
+        assert history.count() == 1
+        assert history.last()["score"] == 80
+        assert history.check_timings() == []
+
+
+def test_scorer_matches_full_run(mmbench, workspace):
+    ws = str(workspace)
+    scorer = mmbench.WorkspaceScorer(ws)
+    scorer.score()
+    for label, edit in EDITS:
+        edit(workspace)
+        result = scorer.score()
+        expected = mmbench.score_workspace(ws)
+        assert comparable(scorer.report()) == comparable(expected), label
+        assert result.score == sum(c["score"] for c in expected["checks"]), label
+    assert any(c.cached for c in scorer.score().checks)
+
+
+def test_watch_step_reruns_only_affected_checks(mmbench, workspace):
+    ws = str(workspace)
+    plan = mmbench.default_plan()
+    listing, stamps = mmbench.snapshot_workspace(ws)
+    catalog = mmbench.FileCatalog(ws, plan, None, listing)
+    _, _, checks = mmbench.rescore_checks(ws, catalog, {}, lambda name, entry: False)
+    assert mmbench.watch_step(ws, plan, stamps, checks)[2:] == ([], None)
+
+    # A modified file re-runs the checks that read it
+    code = str(workspace / "code" / "main.py")
+    deps = mmbench.check_dependencies(checks)
+    readers = [name for name in checks if code in deps[name]["files"]]
+    assert 0 < len(readers) < len(checks)
+    (workspace / "code" / "main.py").write_text("import numpy as np\nx = np.zeros(3)\n")
+    stamps, checks, affected, report = mmbench.watch_step(ws, plan, stamps, checks)
+    assert affected == readers
+    assert comparable(report) == comparable(mmbench.score_workspace(ws))
+
+    # An added file re-runs the checks whose patterns match it
+    deps = mmbench.check_dependencies(checks)
+    matching = [name for name in checks
+                if any(mmbench.compile_glob(p).match("readme.md") for p in deps[name]["patterns"])]
+    assert 0 < len(matching) < len(checks)
+    (workspace / "README.md").write_text("# Run\npython code/main.py\n")
+    stamps, checks, affected, report = mmbench.watch_step(ws, plan, stamps, checks)
+    assert affected == matching
+    assert comparable(report) == comparable(mmbench.score_workspace(ws))
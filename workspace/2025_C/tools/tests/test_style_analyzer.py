@@ -0,0 +1,151 @@
+"""Regression checks: the statistics store gives the uncached style guide."""
+
+import json
+
+import pytest
+
+SENTENCES = [
+    "We quantify the effect of rainfall on yield and demonstrate a 12.5% gain.",
+    "Figure {n} shows that the error falls below 0.05, which suggests the model is stable.",
+    "Table {n} reveals that demand peaks in July; therefore, capacity must grow.",
+    "We validate the model against 40 years of records with an RMSE of 0.{n}.",
+    "However, the sensitivity analysis indicates that the ranking is robust.",
+    "Moreover, we characterize each regime and estimate its duration.",
+]
+
+
+def paper_text(n):
+    body = " ".join(SENTENCES[(n + i) % len(SENTENCES)].format(n=n) for i in range(12))
+    return (f"Summary\nWe find {n}0% higher efficiency (p < 0.05) across 3 scenarios.\n\n"
+            f"{body}\n\nFigure {n}: Yield against rainfall for {n} regions.\n")
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    papers = tmp_path / "papers"
+    papers.mkdir()
+    for n in range(1, 7):
+        (papers / f"paper_{n}.md").write_text(paper_text(n))
+    return papers
+
+
+def analysis(style_analyzer, papers, output_dir, cache):
+    output = output_dir / "style_guide.md"
+    style_analyzer.main(str(papers), str(output), cache=cache, use_spacy=False)
+    result = json.loads((output_dir / "style_guide_analysis.json").read_text())
+    result.pop("generated")
+    return result
+
+
+EDITS = [
+    ("unchanged", lambda papers: None),
+    ("edited", lambda papers: (papers / "paper_2.md").write_text(paper_text(9))),
+    ("removed", lambda papers: (papers / "paper_4.md").unlink()),
+    ("added", lambda papers: (papers / "paper_7.md").write_text(paper_text(7))),
+]
+
+
+def test_stored_statistics_match_uncached(style_analyzer, corpus, tmp_path):
+    cached_dir, fresh_dir = tmp_path / "cached", tmp_path / "fresh"
+    analysis(style_analyzer, corpus, cached_dir, cache=True)
+
+    for label, edit in EDITS:
+        edit(corpus)
+        assert (analysis(style_analyzer, corpus, cached_dir, cache=True)
+                == analysis(style_analyzer, corpus, fresh_dir, cache=False)), label
+
+
+def test_unchanged_papers_are_reused(style_analyzer, corpus, tmp_path):
+    papers = style_analyzer.load_papers(str(corpus))
+    entries, recomputed = style_analyzer.update_records(papers, {})
+    assert len(recomputed) == len(papers)
+
+    stats_path = str(tmp_path / "style_stats.json")
+    style_analyzer.save_stats(stats_path, "tokens", entries)
+    stored = style_analyzer.load_stats(stats_path, "tokens")
+    assert style_analyzer.update_records(papers, stored) == (entries, [])
+    assert style_analyzer.load_stats(stats_path, "pos") == {}
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Trends differ, e.g. in July. Demand peaks.", ["Trends differ, e.g. in July.", "Demand peaks."]),
+    ("See Fig. 3 for the fit. It holds.", ["See Fig. 3 for the fit.", "It holds."]),
+    ("The error is 0.05 overall. Costs fall by 3.5%.", ["The error is 0.05 overall.", "Costs fall by 3.5%."]),
+    ("Use model No. 2 here. Is it stable? No. Yes it is.",
+     ["Use model No. 2 here.", "Is it stable?", "No.", "Yes it is."]),
+])
+def test_split_sentences_keeps_abbreviations_and_decimals(style_analyzer, text, expected):
+    assert style_analyzer.split_sentences(text) == expected
+
+
+def test_sentence_with_several_markers_counted_once(style_analyzer):
+    text = ("Figure 2 shows and confirms the trend, suggesting growth and indicating demand. "
+            "Costs stay flat across every region.")
+    sentences = list(style_analyzer.paper_sentences(text))
+    assert [flag for _, flag in sentences] == [True, False]
+    record = style_analyzer.pattern_record(text)
+    assert sum(record["observation_implication"].values()) == 1
+
+
+@pytest.mark.parametrize("path, key", [
+    ("student paper/2023/C/2310767.pdf", "2023/C"),
+    ("student paper/2024/a/2401234.pdf", "2024/A"),
+    ("reference_papers/2023/2023_MCM_Problem_C_Results.pdf", "2023/C"),
+    ("reference_papers/2022_MCM_Problem_B_Results.pdf", "2022/B"),
+    ("notes/overview.md", "other/other"),
+])
+def test_shard_key_naming_schemes(style_analyzer, path, key):
+    assert style_analyzer.shard_key(path) == key
+
+
+def test_find_shards_skips_statements_and_duplicates(style_analyzer, tmp_path):
+    reference, student = tmp_path / "reference_papers", tmp_path / "student paper"
+    files = {
+        reference / "2023" / "2023_MCM_Problem_C.pdf": b"statement",
+        reference / "2023" / "2023_MCM_Problem_C_Results.pdf": b"results 2023",
+        student / "2023" / "C" / "2310767.pdf": b"paper 2310767",
+        student / "2023" / "C" / "copy_of_results.pdf": b"results 2023",
+        student / "2024" / "C" / "2401234.pdf": b"paper 2401234",
+    }
+    for path, content in files.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+    shards = style_analyzer.find_shards([str(reference), str(student)])
+    assert shards == {
+        "2023/C": [str(reference / "2023" / "2023_MCM_Problem_C_Results.pdf"),
+                   str(student / "2023" / "C" / "2310767.pdf")],
+        "2024/C": [str(student / "2024" / "C" / "2401234.pdf")],
+    }
+
+
+def test_delta_report_two_years(style_analyzer):
+    filler = "The model fits the data across every region we study. "
+    by_year = {
+        "2023": [style_analyzer.paper_record(filler * 20 + "We demonstrate and demonstrate it. " * 5)],
+        "2024": [style_analyzer.paper_record(filler * 20 + "We quantify and quantify it. " * 5)],
+        "other": [style_analyzer.paper_record("We validate it. " * 50)],
+    }
+    deltas = style_analyzer.delta_report(by_year)
+    assert [(d["from"], d["to"]) for d in deltas] == [("2023", "2024")]
+    (delta,) = deltas
+    assert [c["verb"] for c in delta["verbs_up"]] == ["quantify"]
+    assert [c["verb"] for c in delta["verbs_down"]] == ["demonstrate"]
+    up, down = delta["verbs_up"][0], delta["verbs_down"][0]
+    assert up["from"] == 0 and up["change"] == up["to"] > 0
+    assert down["to"] == 0 and down["change"] == -down["from"] < 0
+    assert style_analyzer.delta_report({"2023": by_year["2023"]}) == []
+
+
+def test_vocabulary_counts_whole_words_only(style_analyzer):
+    words, counts = style_analyzer.count_vocabulary(
+        "Enthusiasm ran high; thus, we showed it. Thusly, THUS and thus.")
+    assert words == 11
+    assert counts["thus"] == 3
+    assert "enthusiasm" not in counts and "showed" not in counts
+
+
+def test_vocabulary_parallel_matches_serial(style_analyzer):
+    texts = [paper_text(n) for n in range(1, 7)]
+    assert (style_analyzer.analyze_vocabulary(texts, workers=3)
+            == style_analyzer.analyze_vocabulary(texts))